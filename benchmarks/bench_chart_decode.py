@@ -0,0 +1,100 @@
+"""
+Chart API decoding benchmark.
+
+Compares the original decoding path (stdlib json + ChartResponse(**data) + per-day datetimes)
+with the fast path (bytes -> RawChartResponse, orjson when installed, vectorized dates).
+
+    python benchmarks/bench_chart_decode.py [--years 20] [--repeat 20]
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ftmarkets.extract import scraper as scraper_module
+from ftmarkets.extract.schemas import ChartResponse, Ticker
+from ftmarkets.extract.scraper import Scraper
+
+
+def make_payload(years: int) -> bytes:
+    n = years * 260
+    start = datetime(2000, 1, 3)
+    dates = [(start + timedelta(days=i)).isoformat() for i in range(n)]
+
+    def series(offset: float) -> list[float]:
+        return [round(100 + offset + i * 0.013, 3) for i in range(n)]
+
+    payload = {
+        "Dates": dates,
+        "Elements": [
+            {
+                "Type": "price",
+                "Symbol": "36276",
+                "ComponentSeries": [
+                    {"Type": name, "Values": series(k)}
+                    for k, name in enumerate(["Open", "High", "Low", "Close"])
+                ],
+            },
+            {
+                "Type": "volume",
+                "Symbol": "36276",
+                "ComponentSeries": [{"Type": "Volume", "Values": series(1e6)}],
+            },
+        ],
+    }
+    return json.dumps(payload).encode()
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--years", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    content = make_payload(args.years)
+    scraper = Scraper()
+    ticker = Ticker(root="AAPL:NSQ")
+
+    def baseline():
+        data = ChartResponse(**json.loads(content))
+        return np.asarray(data.dates, dtype="datetime64[s]")
+
+    def fast():
+        return scraper._convert_to_frame(ticker, scraper._decode_chart(content))
+
+    orjson = scraper_module.orjson
+
+    def fast_stdlib():
+        scraper_module.orjson = None
+        try:
+            return fast()
+        finally:
+            scraper_module.orjson = orjson
+
+    print(f"Chart response: {args.years} years, {len(content) / 1024:.0f} KiB")
+    base_ms = timed(baseline, args.repeat)
+    print(f"  {'baseline, json + ChartResponse(**data):':41} {base_ms:8.2f} ms")
+    for label, fn in [
+        ("fast path, pydantic JSON parser", fast_stdlib),
+        ("fast path, orjson", fast if orjson is not None else None),
+    ]:
+        if fn is None:
+            print(f"  {label + ':':41} skipped (orjson not installed)")
+            continue
+        ms = timed(fn, args.repeat)
+        print(f"  {label + ':':41} {ms:8.2f} ms  ({base_ms / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
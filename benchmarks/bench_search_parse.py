@@ -0,0 +1,116 @@
+"""
+Search results page parsing benchmark.
+
+Compares the original parser (string XPath per panel and row, a second walk of the document
+for tearsheet links, and a linear duplicate check per link) with the single-pass parser using
+precompiled XPaths and a set-based duplicate index, on large multi-panel result pages.
+
+    python benchmarks/bench_search_parse.py [--rows 200] [--panels 4] [--links 400] [--repeat 20]
+"""
+
+import argparse
+import time
+from typing import Any, cast
+from urllib.parse import parse_qs, urlparse
+
+from lxml import html
+from pydantic_market_data.models import Symbol
+
+from ftmarkets.extract.scraper import _ASSET_CLASS_MAP, Scraper
+
+PANELS = ("equity-panel", "etf-panel", "fund-panel", "index-panel")
+SECTIONS = ("etfs", "equities", "funds", "indices")
+
+
+def make_page(rows: int, panels: int, links: int) -> bytes:
+    parts = ["<html><body>"]
+    for p in range(panels):
+        body = "".join(
+            f"<tr><td>Company {p}-{i} plc</td><td>T{p}X{i}:LSE</td>"
+            "<td>London Stock Exchange</td><td>United Kingdom</td></tr>"
+            for i in range(rows)
+        )
+        parts.append(
+            f'<div id="{PANELS[p % len(PANELS)]}" role="tabpanel">'
+            f'<table class="mod-ui-table"><tbody>{body}</tbody></table></div>'
+        )
+    # Half the links repeat panel tickers, as the "Best Match" lists do
+    for i in range(links):
+        ticker = f"T0X{i}:LSE" if i % 2 == 0 else f"L{i}:NSQ"
+        section = SECTIONS[i % len(SECTIONS)]
+        parts.append(f'<a href="/data/{section}/tearsheet/summary?s={ticker}">Link {i}</a>')
+    parts.append("</body></html>")
+    return "".join(parts).encode()
+
+
+def baseline(scraper: Scraper, tree: Any, query: str) -> list[Symbol]:
+    results: list[Symbol] = []
+    panels = tree.xpath(
+        '//div[@role="tabpanel"] | //div[contains(@class, "mod-search-results__section")]'
+    )
+    for panel in panels:
+        asset_type = _ASSET_CLASS_MAP.get(panel.get("id"))
+        if not asset_type:
+            header = panel.xpath(".//h3")
+            if header:
+                ft_name = header[0].text.strip()
+                asset_type = _ASSET_CLASS_MAP.get(ft_name, ft_name)
+        for row in panel.xpath('.//table[contains(@class, "mod-ui-table")]/tbody/tr'):
+            cols = row.xpath("./td")
+            if len(cols) >= 2:
+                name = cols[0].text_content().strip()
+                ticker_str = cols[1].text_content().strip()
+                exchange = cols[2].text_content().strip() if len(cols) > 2 else None
+                country = cols[3].text_content().strip() if len(cols) > 3 else None
+                scraper._add_to_results(
+                    results, ticker_str, name, exchange, country, asset_type, query
+                )
+    for link in tree.xpath('//a[contains(@href, "tearsheet/summary?s=")]'):
+        href = link.get("href")
+        ticker_str = parse_qs(urlparse(href).query).get("s", [None])[0]
+        name = link.text_content().strip()
+        if ticker_str and not any(str(r.ticker) == ticker_str for r in results):
+            link_asset_type = None
+            for at_key in ["equities", "etfs", "funds", "indices"]:
+                if f"/{at_key}/" in href:
+                    link_asset_type = _ASSET_CLASS_MAP.get(at_key, at_key.capitalize())
+                    break
+            scraper._add_to_results(results, ticker_str, name, None, None, link_asset_type, query)
+    return results
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200, help="Rows per panel")
+    parser.add_argument("--panels", type=int, default=4)
+    parser.add_argument("--links", type=int, default=400, help="Tearsheet links on the page")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    content = make_page(args.rows, args.panels, args.links)
+    tree = cast(Any, html.fromstring(content))
+    scraper = Scraper()
+    old = baseline(scraper, tree, "TEST")
+    new = scraper._parse_search_results(tree, "TEST")
+    assert [str(s.ticker) for s in old] == [str(s.ticker) for s in new]
+
+    print(
+        f"Search page: {len(content) / 1024:.0f} KiB, {args.panels} panels x {args.rows} rows,"
+        f" {args.links} links, {len(new)} results"
+    )
+    base_ms = timed(lambda: baseline(scraper, tree, "TEST"), args.repeat)
+    print(f"  {'baseline, per-call XPath + linear dedup:':42} {base_ms:8.2f} ms")
+    ms = timed(lambda: scraper._parse_search_results(tree, "TEST"), args.repeat)
+    print(f"  {'single pass, compiled XPath + set dedup:':42} {ms:8.2f} ms  ({base_ms / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
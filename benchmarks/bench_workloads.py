@@ -0,0 +1,179 @@
+"""
+Offline end-to-end benchmark suite.
+
+Replays realistic workloads from a cassette instead of markets.ft.com and reports, per stage,
+throughput, p50/p99 latency and peak traced memory:
+
+    search       N searches (JSON search API, search_backend="json")
+    xid          N XID discoveries (tearsheet download + parse)
+    history      20-year daily histories
+    validation   bulk trade validation (FTDataSource.validate_many), one op per ticker
+
+By default the cassette is first recorded from synthetic responses (ftmarkets.testing), so no
+network access is needed. Pass --cassette to keep it, or --live to record from the real site.
+Chart requests are keyed on a look-back in days from today, so a cassette holding the
+validation stage only replays on the day it was recorded.
+
+    python benchmarks/bench_workloads.py [--searches 1000] [--xids 1000] [--histories 20]
+        [--trades 5000] [--stages search,xid,history,validation] [--cassette PATH] [--live]
+"""
+
+import argparse
+import gc
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date, timedelta
+from pathlib import Path
+
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from ftmarkets.api import FTDataSource
+from ftmarkets.client import FTClient
+from ftmarkets.extract.schemas import Ticker
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.ledger import Trade
+from ftmarkets.testing import Cassette, RecordingAdapter, ReplayAdapter, SyntheticAdapter
+from ftmarkets.testing.synthetic import isin_for, ohlcv, trading_days, xid_for
+
+HISTORY_DAYS = 365 * 20
+
+
+@dataclass
+class Stage:
+    name: str
+    # Builds the list of operations to time from a fresh Scraper; setup work is not timed
+    prepare: Callable[[Scraper], list[Callable[[], object]]]
+
+
+def tickers(prefix: str, n: int) -> list[str]:
+    return [f"{prefix}{i:05d}:NSQ" for i in range(n)]
+
+
+def make_trades(n: int, n_tickers: int) -> list[Trade]:
+    days = trading_days(730, date.today() - timedelta(days=7))
+    trades = []
+    for i in range(n):
+        ticker = f"VAL{i % n_tickers:05d}:NSQ"
+        day = days[(i * 7919) % len(days)]
+        close = float(ohlcv(xid_for(ticker), day.reshape(1))["Close"][0])
+        # Every tenth trade is off-market, so failures are exercised too
+        price = close * (1.5 if i % 10 == 0 else 1.0)
+        trades.append(Trade(ticker=ticker, date=day.astype(date), price=price, id=str(i)))
+    return trades
+
+
+def build_stages(args: argparse.Namespace) -> list[Stage]:
+    def search(scraper: Scraper) -> list[Callable[[], object]]:
+        queries = [isin_for(i) for i in range(args.searches)]
+        return [lambda q=q: scraper.search(q) for q in queries]
+
+    def xid(scraper: Scraper) -> list[Callable[[], object]]:
+        names = [Ticker(root=t) for t in tickers("XID", args.xids)]
+        return [lambda t=t: scraper.get_xid(t) for t in names]
+
+    def history(scraper: Scraper) -> list[Callable[[], object]]:
+        names = tickers("HST", args.histories)
+        for t in names:
+            scraper.get_xid(Ticker(root=t))
+        return [lambda t=t: scraper.get_history_frame(t, days=HISTORY_DAYS) for t in names]
+
+    def validation(scraper: Scraper) -> list[Callable[[], object]]:
+        source = FTDataSource(scraper_instance=scraper, max_workers=1)
+        groups: dict[str, list[Trade]] = {}
+        for trade in make_trades(args.trades, args.validation_tickers):
+            groups.setdefault(trade.ticker, []).append(trade)
+        for t in groups:
+            scraper.get_xid(Ticker(root=t))
+        return [lambda g=g: list(source.validate_many(g)) for g in groups.values()]
+
+    stages = {
+        "search": Stage("search", search),
+        "xid": Stage("xid", xid),
+        "history": Stage("history (20y)", history),
+        "validation": Stage("validation", validation),
+    }
+    return [stages[name] for name in args.stages.split(",")]
+
+
+def make_scraper(adapter: BaseAdapter) -> Scraper:
+    # Coalescing and caching are off so every operation exercises the full request path
+    return Scraper(http_client=FTClient(adapter=adapter, coalesce=False), search_backend="json")
+
+
+def run_stage(stage: Stage, adapter: BaseAdapter) -> tuple[list[float], float]:
+    ops = stage.prepare(make_scraper(adapter))
+    gc.collect()
+    latencies = []
+    started = time.perf_counter()
+    for op in ops:
+        t0 = time.perf_counter()
+        op()
+        latencies.append(time.perf_counter() - t0)
+    return latencies, time.perf_counter() - started
+
+
+def peak_memory(stage: Stage, adapter: BaseAdapter) -> float:
+    # Separate pass: tracemalloc slows allocation-heavy code and would skew the timings
+    ops = stage.prepare(make_scraper(adapter))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for op in ops:
+            op()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[int(pct) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--searches", type=int, default=1000)
+    parser.add_argument("--xids", type=int, default=1000)
+    parser.add_argument("--histories", type=int, default=20)
+    parser.add_argument("--trades", type=int, default=5000)
+    parser.add_argument("--validation-tickers", type=int, default=100)
+    parser.add_argument("--stages", default="search,xid,history,validation")
+    parser.add_argument("--cassette", type=Path, help="Cassette to replay (recorded if missing)")
+    parser.add_argument("--live", action="store_true", help="Record from markets.ft.com")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the peak memory pass")
+    args = parser.parse_args()
+
+    stages = build_stages(args)
+    if args.cassette and args.cassette.exists():
+        cassette = Cassette.load(args.cassette)
+        print(f"Replaying {len(cassette)} recorded responses from {args.cassette}")
+    else:
+        cassette = Cassette(args.cassette)
+        source: BaseAdapter = HTTPAdapter() if args.live else SyntheticAdapter()
+        started = time.perf_counter()
+        for stage in stages:
+            run_stage(stage, RecordingAdapter(cassette, source))
+        origin = "markets.ft.com" if args.live else "synthetic data"
+        elapsed = time.perf_counter() - started
+        print(f"Recorded {len(cassette)} responses from {origin} in {elapsed:.1f}s")
+        if args.cassette:
+            cassette.save()
+
+    replay = ReplayAdapter(cassette)
+    print(f"\n{'stage':16} {'ops':>6} {'ops/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'peak MiB':>9}")
+    for stage in stages:
+        latencies, total = run_stage(stage, replay)
+        memory = "-" if args.no_memory else f"{peak_memory(stage, replay):.1f}"
+        print(
+            f"{stage.name:16} {len(latencies):6d} {len(latencies) / total:9.1f}"
+            f" {percentile(latencies, 50) * 1000:9.2f} {percentile(latencies, 99) * 1000:9.2f}"
+            f" {memory:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
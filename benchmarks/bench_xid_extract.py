@@ -0,0 +1,89 @@
+"""
+XID extraction benchmark.
+
+Compares the original extraction (lxml DOM of the whole tearsheet + XPath over every
+data-mod-config + JSON decoding) with the incremental byte scan used by Scraper.get_xid,
+which stops at the first match and so never reads the rest of a streamed page.
+
+    python benchmarks/bench_xid_extract.py [--kib 400] [--position 0.3] [--repeat 200]
+"""
+
+import argparse
+import html as html_lib
+import json
+import time
+from typing import Any, cast
+
+from lxml import html
+
+from ftmarkets.extract.scraper import Scraper
+
+
+def make_page(kib: int, position: float) -> bytes:
+    """
+    Tearsheet-like page of about `kib` KiB with the XID config at `position` (0..1) of it.
+    """
+    block = (
+        '<div class="mod-module" data-mod-config="{&quot;inline&quot;:true}">'
+        '<table class="mod-ui-table"><tr><th>Open</th><td>123.45</td></tr>'
+        "<tr><th>Volume</th><td>1,234,567</td></tr></table></div>\n"
+    )
+    n = kib * 1024 // len(block)
+    config = html_lib.escape(json.dumps({"xid": "36276", "symbol": "AAPL:NSQ"}), quote=True)
+    target = f'<section class="mod-tearsheet-overview" data-mod-config="{config}"></section>\n'
+    split = int(n * position)
+    body = block * split + target + block * (n - split)
+    return f"<html><head><title>Apple Inc</title></head><body>{body}</body></html>".encode()
+
+
+def baseline(content: bytes) -> str | None:
+    tree = html.fromstring(content)
+    divs = cast(list[Any], tree.xpath("//div[@data-mod-config] | //section[@data-mod-config]"))
+    for div in divs:
+        cfg = json.loads(html_lib.unescape(div.get("data-mod-config")))
+        if "xid" in cfg:
+            return str(cfg["xid"])
+    return None
+
+
+def chunked(content: bytes, size: int, read: list[int]):
+    for i in range(0, len(content), size):
+        read[0] += min(size, len(content) - i)
+        yield content[i : i + size]
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--kib", type=int, default=400)
+    parser.add_argument("--position", type=float, default=0.3)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    content = make_page(args.kib, args.position)
+    scraper = Scraper()
+    size = Scraper.XID_CHUNK_SIZE
+    read = [0]
+    assert baseline(content) == scraper._scan_xid(chunked(content, size, read))[0] == "36276"
+
+    print(f"Tearsheet: {len(content) / 1024:.0f} KiB, XID config at {args.position:.0%}")
+    base_ms = timed(lambda: baseline(content), args.repeat)
+    print(f"  {'baseline, lxml DOM + XPath + json:':36} {base_ms:8.3f} ms")
+    for label, fn in [
+        ("byte scan, whole body:", lambda: scraper._scan_xid([content])),
+        ("byte scan, streamed chunks:", lambda: scraper._scan_xid(chunked(content, size, [0]))),
+    ]:
+        ms = timed(fn, args.repeat)
+        print(f"  {label:36} {ms:8.3f} ms  ({base_ms / ms:.1f}x)")
+    print(f"  streamed: read {read[0] / 1024:.0f} of {len(content) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from pydantic_market_data.models import OHLCV, History, Symbol
 
+from .api import AsyncFTDataSource as AsyncFTDataSource
 from .api import FTDataSource as FTDataSource
 
-__all__ = ["OHLCV", "History", "Symbol", "FTDataSource"]
+__all__ = ["OHLCV", "History", "Symbol", "FTDataSource", "AsyncFTDataSource"]
 
 __version__ = "0.1.1"
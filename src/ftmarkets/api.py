@@ -1,6 +1,15 @@
+import asyncio
 import logging
-from datetime import date, datetime
-
+import threading
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import cast
+
+import numpy as np
+import pandas as pd
+import requests
 from pydantic_market_data.interfaces import DataSource
 from pydantic_market_data.models import (
     OHLCV,
@@ -14,45 +23,86 @@ from pydantic_market_data.models import (
     Ticker,
 )
 
-from .extract.scraper import Scraper, scraper
+from .extract.async_scraper import AsyncScraper
+from .extract.scraper import Scraper, ScraperError, scraper
+from .frame import FTHistory, HistoryFrame
+from .history_cache import HistoryCache, last_days
+from .ledger import Trade, TradeResult
+from .resolution_cache import ResolutionCache
 
 # Re-export needed models for CLI
-__all__ = ["FTDataSource", "History", "OHLCV", "SecurityCriteria", "Symbol"]
+__all__ = [
+    "AsyncFTDataSource",
+    "FTDataSource",
+    "History",
+    "OHLCV",
+    "PriceMatrix",
+    "SecurityCriteria",
+    "Symbol",
+    "Trade",
+    "TradeResult",
+]
 
 logger = logging.getLogger(__name__)
 
 _PRICE_LOOKUP_WINDOW_DAYS = 5  # Covers weekends + public holidays
+_RESOLVE_MAX_WORKERS = 8
+
+# Convert period string to days
+_PERIOD_DAYS = {
+    HistoryPeriod.D1: 2,
+    HistoryPeriod.D5: 7,
+    HistoryPeriod.MO1: 30,
+    HistoryPeriod.MO3: 90,
+    HistoryPeriod.MO6: 180,
+    HistoryPeriod.Y1: 365,
+    HistoryPeriod.Y2: 365 * 2,
+    HistoryPeriod.Y5: 365 * 5,
+    HistoryPeriod.Y10: 365 * 10,
+    HistoryPeriod.MAX: 365 * 20,
+}
+
+
+def lookback_days(period: HistoryPeriod | None = None, dates: Iterable[date] = ()) -> int:
+    """
+    Chart look-back (days) covering `period` and the price lookup window of every date.
+    Use it as HistoryCache(min_days=...) when a session's windows are known up front.
+    """
+    days = _PERIOD_DAYS.get(period, 30) if period is not None else 0
+    window = timedelta(days=_PRICE_LOOKUP_WINDOW_DAYS)
+    for d in dates:
+        days = max(days, (date.today() - (d - window)).days + 1)
+    return days
 
 
-class FTDataSource(DataSource):
+@dataclass(frozen=True)
+class PriceMatrix:
     """
-    Financial Times (markets.ft.com) data source implementation.
-    Delegates to strict Scraper.
+    Result of get_prices. Each frame is indexed by ticker with one column per date.
+    `prices` holds close prices (NaN where no candle is nearby), `matched_dates` the candle
+    date used for each cell, `fallback` flags cells filled from a neighbouring day, and
+    `errors` maps tickers that could not be fetched to their error.
     """
 
-    def __init__(self, scraper_instance: Scraper | None = None):
-        self.scraper = scraper_instance or scraper
+    prices: pd.DataFrame
+    matched_dates: pd.DataFrame
+    fallback: pd.DataFrame
+    errors: dict[str, str] = field(default_factory=dict)
 
-    def search(self, query: str) -> list[Symbol]:
-        return self.scraper.search(query)
 
-    def resolve(self, criteria: SecurityCriteria) -> Symbol | None:
-        """
-        Resolve a security based on criteria.
-        Checks for ISIN, Symbol, Description.
-        Validates against Price/Date if provided.
-        """
-        candidates: list[Symbol] = []
-        if criteria.isin:
-            candidates = self.scraper.search(str(criteria.isin))
-        if not candidates and criteria.symbol:
-            candidates = self.scraper.search(str(criteria.symbol))
-        if not candidates and criteria.description:
-            candidates = self.scraper.search(str(criteria.description))
+class _FTDataSourceBase:
+    """
+    Transport-independent logic shared by FTDataSource and AsyncFTDataSource.
+    """
 
-        if not candidates:
-            return None
+    history_cache: HistoryCache | None
+
+    def _ticker_name(self, ticker: Ticker | str) -> str:
+        return ticker.root if isinstance(ticker, Ticker) else ticker
 
+    def _filter_candidates(
+        self, criteria: SecurityCriteria, candidates: list[Symbol]
+    ) -> list[Symbol]:
         filtered = []
         for cand in candidates:
             # Currency Check
@@ -68,89 +118,19 @@ class FTDataSource(DataSource):
                     continue
 
             filtered.append(cand)
+        return filtered
 
-        if not filtered:
-            return None
-
-        # Price validation
-        if criteria.target_price:
-            target_dt = self._ensure_datetime(criteria.target_date)
-            days = self._get_required_history_days(target_dt)
-
-            tp = criteria.target_price
-            target_pr = Price(root=float(tp)) if isinstance(tp, (int, float)) else tp
-
-            valid_candidates = []
-            for cand in filtered:
-                hist = self.scraper.get_history(cand.ticker, days=days)
-                try:
-                    if self._check_price_match(hist, target_dt, target_pr):
-                        valid_candidates.append(cand)
-                except PriceVerificationError:
-                    continue
-
-            if valid_candidates:
-                return valid_candidates[0]
-            return None
-
-        return filtered[0]
-
-    def get_price(self, ticker: Ticker | str, date: date | None = None) -> Price:
-        """
-        Get the price for a ticker (current or historical).
-        """
-        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
-        target_dt = self._ensure_datetime(date)
-        days = self._get_required_history_days(target_dt)
-        hist = self.scraper.get_history(ticker_val, days=days + 10)
+    def _to_price(self, value: Price | float) -> Price:
+        return Price(root=float(value)) if isinstance(value, (int, float)) else value
 
+    def _price_from_history(self, hist: History, ticker: Ticker, target_dt: datetime) -> Price:
         target_date = target_dt.date()
         match_range = self._find_nearest_candle(hist, target_date)
 
         if match_range and match_range.close is not None:
             return Price(root=float(match_range.close))
 
-        raise RuntimeError(
-            f"Could not retrieve price for ticker '{ticker_val.root}' on {target_date}"
-        )
-
-    def history(self, ticker: Ticker | str, period: HistoryPeriod = HistoryPeriod.MO1) -> History:
-        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
-        # Convert period string to days
-        days_map = {
-            HistoryPeriod.D1: 2,
-            HistoryPeriod.D5: 7,
-            HistoryPeriod.MO1: 30,
-            HistoryPeriod.MO3: 90,
-            HistoryPeriod.MO6: 180,
-            HistoryPeriod.Y1: 365,
-            HistoryPeriod.Y2: 365 * 2,
-            HistoryPeriod.Y5: 365 * 5,
-            HistoryPeriod.Y10: 365 * 10,
-            HistoryPeriod.MAX: 365 * 20,
-        }
-
-        days = days_map.get(period, 30)
-        return self.scraper.get_history(ticker_val, days=days)
-
-    def validate(
-        self, ticker: Ticker | str, target_date: date, target_price: Price | float
-    ) -> bool:
-        """
-        Validates if the ticker traded near the target price on the target date.
-        """
-        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
-        if isinstance(target_price, (int, float)):
-            price_val = Price(root=float(target_price))
-        else:
-            price_val = target_price
-
-        target_dt = self._ensure_datetime(target_date)
-        days = self._get_required_history_days(target_dt)
-        # Fetch slightly more history to be safe
-        hist = self.scraper.get_history(ticker_val, days=days + 10)
-
-        return self._check_price_match(hist, target_dt, price_val)
+        raise RuntimeError(f"Could not retrieve price for ticker '{ticker.root}' on {target_date}")
 
     # --- Internal Helpers ---
 
@@ -160,46 +140,111 @@ class FTDataSource(DataSource):
         d = date_input.root if isinstance(date_input, StrictDate) else date_input
         return datetime.combine(d, datetime.min.time())
 
-    def _get_required_history_days(self, target_date: datetime) -> int:
-        days_diff = (datetime.now() - target_date).days
-        return max(days_diff + 5, 30)
+    def _get_lookup_window(self, target_date: datetime) -> tuple[date, date]:
+        """Date range holding every candle _find_nearest_candle may pick for target_date."""
+        window = timedelta(days=_PRICE_LOOKUP_WINDOW_DAYS)
+        return target_date.date() - window, target_date.date() + window
+
+    def _candle_frame(self, history: History) -> HistoryFrame:
+        """
+        Columnar view used for nearest-candle lookups. A lazy FTHistory's frame, and its
+        sorted date index, is reused across lookups. Materialized candles may have been
+        edited, so they are re-read instead.
+        """
+        if self._is_lazy(history):
+            return cast(FTHistory, history).frame
+        return HistoryFrame.from_candles(history.symbol, history.candles)
+
+    def _is_lazy(self, history: History) -> bool:
+        return isinstance(history, FTHistory) and "candles" not in history.__dict__
+
+    def _cached_histories(
+        self, tickers: Iterable[Ticker | str], days: int
+    ) -> tuple[dict[str, History | None], list[str]]:
+        """
+        The history cache's entries for tickers (None where it has none), and the tickers
+        still to fetch.
+        """
+        names = list(dict.fromkeys(self._ticker_name(t) for t in tickers))
+        if self.history_cache is None:
+            return dict.fromkeys(names), names
+        cached = {name: self.history_cache.get(name, days) for name in names}
+        return cached, [name for name, hist in cached.items() if hist is None]
+
+    def _merge_fetched(
+        self,
+        cached: dict[str, History | None],
+        fetched: dict[str, History],
+        fetch_days: int,
+        days: int,
+    ) -> dict[str, History]:
+        """
+        history_many result in the caller's order: cached entries plus fresh fetches, which
+        are added to the history cache. Tickers that could not be fetched are omitted.
+        """
+        if self.history_cache is not None:
+            for name, hist in fetched.items():
+                self.history_cache.put(name, fetch_days, hist)
+        result: dict[str, History] = {}
+        for name, entry in cached.items():
+            if entry is None and name in fetched:
+                entry = fetched[name] if fetch_days == days else last_days(fetched[name], days)
+            if entry is not None:
+                result[name] = self._materialized(entry)
+        return result
+
+    def _fetch_days(self, days: int) -> int:
+        return self.history_cache.fetch_days(days) if self.history_cache else days
+
+    def _materialized(self, history: History) -> History:
+        """
+        History handed to the caller. Its candles are built so it serializes fully even when
+        nested in another model, while the cached FTHistory stays lazy.
+        """
+        return history.materialized() if isinstance(history, FTHistory) else history
+
+    def _find_nearest_candles(
+        self, history: History, target_dates: list[date]
+    ) -> list[OHLCV | None]:
+        """
+        Batched _find_nearest_candle: one vectorized lookup for many target dates.
+        """
+        frame = self._candle_frame(history)
+        positions = frame.nearest(target_dates, _PRICE_LOOKUP_WINDOW_DAYS).tolist()
+        if self._is_lazy(history):
+            # Build only the candles that were picked, not the whole history
+            return [frame.candle(pos) if pos >= 0 else None for pos in positions]
+        return [history.candles[pos] if pos >= 0 else None for pos in positions]
 
     def _find_nearest_candle(self, history: History, target_date):
-        """Return the OHLCV candle closest to target_date within _PRICE_LOOKUP_WINDOW_DAYS."""
-        # Exact match first
-        for c in history.candles:
-            c_dt = c.date if isinstance(c.date, datetime) else None
-            if c_dt and c_dt.date() == target_date:
-                return c
-
-        # Nearest within window
-        candidates = []
-        for c in history.candles:
-            c_dt = c.date if isinstance(c.date, datetime) else None
-            if c_dt:
-                diff = abs((c_dt.date() - target_date).days)
-                if diff <= _PRICE_LOOKUP_WINDOW_DAYS:
-                    candidates.append((diff, c))
-
-        if candidates:
-            candidates.sort(key=lambda x: x[0])
-            return candidates[0][1]
-        return None
+        """
+        Return the OHLCV candle closest to target_date within _PRICE_LOOKUP_WINDOW_DAYS.
+        An exact match wins; ties go to the earlier day. O(log n) on a sorted date index.
+        """
+        return self._find_nearest_candles(history, [target_date])[0]
 
     def _check_price_match(
         self, history: History, target_dt: datetime, target_price: Price
     ) -> bool:
         target_date = target_dt.date()
-        target_price_val = target_price.root
-
         match_range = self._find_nearest_candle(history, target_date)
 
         if not match_range:
             return False
+        return self._check_candle(
+            match_range, str(history.symbol.ticker), target_date, target_price
+        )
+
+    def _check_candle(
+        self, match_range: OHLCV, ticker: str, target_date: date, target_price: Price
+    ) -> bool:
+        target_price_val = target_price.root
+        if target_price_val <= 0:
+            raise ValueError(f"Price must be positive, got {target_price_val}")
 
         logger.info(
             "Matched range for %s on %s: Low=%s, High=%s, Close=%s",
-            history.symbol.ticker,
+            ticker,
             target_date,
             match_range.low,
             match_range.high,
@@ -223,11 +268,535 @@ class FTDataSource(DataSource):
 
         # If we reach here, it failed. Raise error with details.
         raise PriceVerificationError(
-            f"Price {target_price_val} does not match {history.symbol.ticker}",
-            ticker=str(history.symbol.ticker),
+            f"Price {target_price_val} does not match {ticker}",
+            ticker=ticker,
             actual_date=target_date,
             expected_price=target_price_val,
             actual_low=low,
             actual_high=high,
             actual_close=close,
         )
+
+    # --- Bulk validation ---
+
+    def _group_trades(self, trades: Iterable[Trade]) -> dict[str, list[Trade]]:
+        groups: dict[str, list[Trade]] = {}
+        for trade in trades:
+            groups.setdefault(trade.ticker, []).append(trade)
+        return groups
+
+    def _trades_window(self, trades: list[Trade]) -> tuple[date, date]:
+        """Date range covering the lookup window of every trade in the group."""
+        window = timedelta(days=_PRICE_LOOKUP_WINDOW_DAYS)
+        return min(t.date for t in trades) - window, max(t.date for t in trades) + window
+
+    def _validate_trades(self, history: History, trades: list[Trade]) -> list[TradeResult]:
+        results = []
+        candles = self._find_nearest_candles(history, [t.date for t in trades])
+        for trade, candle in zip(trades, candles, strict=True):
+            if candle is None:
+                results.append(
+                    TradeResult(trade=trade, valid=False, error="No candle near trade date")
+                )
+                continue
+            try:
+                valid = self._check_candle(
+                    candle, trade.ticker, trade.date, Price(root=trade.price)
+                )
+            except PriceVerificationError:
+                valid = False
+            except Exception as e:
+                # One bad trade must not lose the results of the rest of the ledger
+                results.append(TradeResult(trade=trade, valid=None, error=str(e)))
+                continue
+            results.append(
+                TradeResult(
+                    trade=trade,
+                    valid=valid,
+                    matched_date=candle.date.date(),
+                    low=candle.low,
+                    high=candle.high,
+                    close=candle.close,
+                )
+            )
+        return results
+
+    def _failed_trades(self, trades: list[Trade], error: Exception) -> list[TradeResult]:
+        logger.warning(
+            "Could not validate %d trade(s) for %s: %s", len(trades), trades[0].ticker, error
+        )
+        return [TradeResult(trade=t, valid=None, error=str(error)) for t in trades]
+
+    # --- Price matrix ---
+
+    def _unique_dates(self, dates: Iterable[date]) -> list[date]:
+        return list(dict.fromkeys(d.date() if isinstance(d, datetime) else d for d in dates))
+
+    def _dates_window(self, dates: list[date]) -> tuple[date, date]:
+        """Date range covering the lookup window of every date."""
+        window = timedelta(days=_PRICE_LOOKUP_WINDOW_DAYS)
+        return min(dates) - window, max(dates) + window
+
+    def _nearest_closes(
+        self, history: History, targets: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Close and day of the candle _find_nearest_candle picks for each target day, computed
+        in one vectorized lookup. NaN / NaT where no candle is close enough.
+        """
+        frame = self._candle_frame(history)
+        positions = frame.nearest(targets, _PRICE_LOOKUP_WINDOW_DAYS)
+        found = positions >= 0
+        closes = np.full(len(targets), np.nan)
+        matched = np.full(len(targets), np.datetime64("NaT"), dtype="datetime64[D]")
+        closes[found] = frame.close[positions[found]]
+        matched[found] = frame.dates[positions[found]].astype("datetime64[D]")
+        return closes, matched
+
+    def _price_matrix(
+        self,
+        tickers: list[str],
+        dates: list[date],
+        histories: dict[str, History | Exception],
+    ) -> PriceMatrix:
+        targets = np.array(dates, dtype="datetime64[D]")
+        closes = np.full((len(tickers), len(dates)), np.nan)
+        matched = np.full((len(tickers), len(dates)), np.datetime64("NaT"), dtype="datetime64[D]")
+        errors: dict[str, str] = {}
+        for i, ticker in enumerate(tickers):
+            hist = histories[ticker]
+            if isinstance(hist, Exception):
+                logger.warning("Could not fetch prices for %s: %s", ticker, hist)
+                errors[ticker] = str(hist)
+                continue
+            closes[i], matched[i] = self._nearest_closes(hist, targets)
+
+        index = pd.Index(tickers, name="Ticker")
+        columns = pd.DatetimeIndex(targets, name="Date")
+        return PriceMatrix(
+            prices=pd.DataFrame(closes, index=index, columns=columns),
+            matched_dates=pd.DataFrame(matched, index=index, columns=columns),
+            fallback=pd.DataFrame(
+                ~np.isnat(matched) & (matched != targets), index=index, columns=columns
+            ),
+            errors=errors,
+        )
+
+
+class FTDataSource(_FTDataSourceBase, DataSource):
+    """
+    Financial Times (markets.ft.com) data source implementation.
+    Delegates to strict Scraper.
+    """
+
+    def __init__(
+        self,
+        scraper_instance: Scraper | None = None,
+        max_workers: int = _RESOLVE_MAX_WORKERS,
+        resolution_cache: ResolutionCache | None = None,
+        history_cache: HistoryCache | None = None,
+    ):
+        self.scraper = scraper_instance or scraper
+        # Concurrent history fetches in resolve() and validate_many(); 1 disables threading
+        self.max_workers = max_workers
+        # Opt-in: repeated resolve() calls for the same criteria skip search and validation
+        self.resolution_cache = resolution_cache
+        # Opt-in: history requests for a ticker already fetched are trimmed from that fetch
+        self.history_cache = history_cache
+
+    def search(self, query: str) -> list[Symbol]:
+        return self.scraper.search(query)
+
+    def _get_history(self, ticker: Ticker | str, days: int) -> History:
+        """
+        Last `days` days of history, from the history cache when it covers them.
+        """
+        name = self._ticker_name(ticker)
+        if self.history_cache is None:
+            return self.scraper.get_history(name, days=days)
+        hist = self.history_cache.get(name, days)
+        if hist is not None:
+            return hist
+        fetch_days = self.history_cache.fetch_days(days)
+        hist = self.scraper.get_history(name, days=fetch_days)
+        self.history_cache.put(name, fetch_days, hist)
+        return hist if fetch_days == days else last_days(hist, days)
+
+    def _get_history_range(self, ticker: Ticker | str, start: date, end: date) -> History:
+        if self.history_cache is None:
+            return self.scraper.get_history_range(ticker, start, end)
+        hist = self._get_history(ticker, self.scraper._range_days(start))
+        return self.scraper._trim_history(hist, start, end)
+
+    def resolve(self, criteria: SecurityCriteria) -> Symbol | None:
+        """
+        Resolve a security based on criteria.
+        Checks for ISIN, Symbol, Description.
+        Validates against Price/Date if provided.
+        """
+        if self.resolution_cache is None:
+            return self._resolve(criteria)
+        found, cached = self.resolution_cache.lookup(criteria)
+        if found:
+            return cached
+        result = self._resolve(criteria)
+        self.resolution_cache.store(criteria, result)
+        return result
+
+    def _resolve(self, criteria: SecurityCriteria) -> Symbol | None:
+        candidates: list[Symbol] = []
+        if criteria.isin:
+            candidates = self.scraper.search(str(criteria.isin))
+        if not candidates and criteria.symbol:
+            candidates = self.scraper.search(str(criteria.symbol))
+        if not candidates and criteria.description:
+            candidates = self.scraper.search(str(criteria.description))
+
+        if not candidates:
+            return None
+
+        filtered = self._filter_candidates(criteria, candidates)
+        if not filtered:
+            return None
+
+        # Price validation
+        if criteria.target_price:
+            target_dt = self._ensure_datetime(criteria.target_date)
+            start, end = self._get_lookup_window(target_dt)
+            target_pr = self._to_price(criteria.target_price)
+
+            # Set once the result is decided; running checks stop at their next network step
+            decided = threading.Event()
+
+            def is_valid(cand: Symbol) -> bool:
+                if decided.is_set():
+                    return False
+                if getattr(self.scraper, "history_store", None) is None:
+                    # Tearsheet first, so an overtaken candidate never requests its chart
+                    ticker = cand.ticker
+                    self.scraper.get_xid(Ticker(root=ticker) if isinstance(ticker, str) else ticker)
+                    if decided.is_set():
+                        return False
+                hist = self._get_history_range(cand.ticker, start, end)
+                if decided.is_set():
+                    return False
+                try:
+                    return self._check_price_match(hist, target_dt, target_pr)
+                except PriceVerificationError:
+                    return False
+
+            if self.max_workers <= 1 or len(filtered) == 1:
+                return next((cand for cand in filtered if is_valid(cand)), None)
+
+            # Validate all candidates concurrently but decide in priority order, so the result
+            # matches a sequential scan. Once it is decided, queued checks are cancelled and
+            # running ones stop before their next request.
+            executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(filtered)))
+            try:
+                futures = [executor.submit(is_valid, cand) for cand in filtered]
+                for cand, future in zip(filtered, futures, strict=True):
+                    if future.result():
+                        return cand
+                return None
+            finally:
+                decided.set()
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        return filtered[0]
+
+    def get_price(self, ticker: Ticker | str, date: date | None = None) -> Price:
+        """
+        Get the price for a ticker (current or historical).
+        """
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        target_dt = self._ensure_datetime(date)
+        hist = self._get_history_range(ticker_val, *self._get_lookup_window(target_dt))
+        return self._price_from_history(hist, ticker_val, target_dt)
+
+    def history(self, ticker: Ticker | str, period: HistoryPeriod = HistoryPeriod.MO1) -> History:
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        days = _PERIOD_DAYS.get(period, 30)
+        return self._materialized(self._get_history(ticker_val, days=days))
+
+    def history_many(
+        self, tickers: Iterable[Ticker | str], period: HistoryPeriod = HistoryPeriod.MO1
+    ) -> dict[str, History]:
+        """
+        Fetch history for many tickers using batched Chart API requests.
+        Tickers the history cache covers are not fetched again.
+        Returns a mapping of ticker to History; tickers that cannot be fetched are omitted.
+        """
+        days = _PERIOD_DAYS.get(period, 30)
+        cached, missing = self._cached_histories(tickers, days)
+        fetch_days = self._fetch_days(days)
+        fetched = self.scraper.get_histories(list(missing), days=fetch_days) if missing else {}
+        return self._merge_fetched(cached, fetched, fetch_days, days)
+
+    def validate(
+        self, ticker: Ticker | str, target_date: date, target_price: Price | float
+    ) -> bool:
+        """
+        Validates if the ticker traded near the target price on the target date.
+        """
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        price_val = self._to_price(target_price)
+
+        target_dt = self._ensure_datetime(target_date)
+        hist = self._get_history_range(ticker_val, *self._get_lookup_window(target_dt))
+
+        return self._check_price_match(hist, target_dt, price_val)
+
+    def validate_many(self, trades: Iterable[Trade]) -> Iterator[TradeResult]:
+        """
+        Validate many trades with one history request per ticker.
+        Each ticker's history covers its earliest to latest trade date. Tickers are fetched
+        concurrently (`max_workers`); results are yielded ticker by ticker, in input order.
+        """
+        groups = self._group_trades(trades)
+        if not groups:
+            return
+
+        def validate_group(group: list[Trade]) -> list[TradeResult]:
+            try:
+                hist = self._get_history_range(group[0].ticker, *self._trades_window(group))
+            except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+                return self._failed_trades(group, e)
+            return self._validate_trades(hist, group)
+
+        with ThreadPoolExecutor(max_workers=max(min(self.max_workers, len(groups)), 1)) as ex:
+            for results in ex.map(validate_group, groups.values()):
+                yield from results
+
+    def get_prices(self, tickers: Iterable[Ticker | str], dates: Iterable[date]) -> PriceMatrix:
+        """
+        Close prices as a ticker x date PriceMatrix.
+        Each ticker's history is fetched once over the whole date span, concurrently
+        (`max_workers`). Every cell then takes the nearest candle within
+        ±_PRICE_LOOKUP_WINDOW_DAYS, like get_price(); cells with no candle nearby are NaN.
+        The matched candle dates, the cells filled from a neighbouring day and the tickers
+        that could not be fetched are returned alongside the prices.
+        """
+        ticker_list = list(dict.fromkeys(t.root if isinstance(t, Ticker) else t for t in tickers))
+        date_list = self._unique_dates(dates)
+        if not ticker_list or not date_list:
+            return self._price_matrix(ticker_list, date_list, {})
+        start, end = self._dates_window(date_list)
+
+        def fetch(ticker: str) -> History | Exception:
+            try:
+                return self._get_history_range(ticker, start, end)
+            except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max(min(self.max_workers, len(ticker_list)), 1)) as ex:
+            histories = dict(zip(ticker_list, ex.map(fetch, ticker_list), strict=True))
+        return self._price_matrix(ticker_list, date_list, histories)
+
+
+class AsyncFTDataSource(_FTDataSourceBase):
+    """
+    Asyncio counterpart of FTDataSource.
+    Delegates to AsyncScraper; requires the `async` extra.
+    """
+
+    def __init__(
+        self,
+        scraper_instance: AsyncScraper | None = None,
+        max_workers: int = _RESOLVE_MAX_WORKERS,
+        resolution_cache: ResolutionCache | None = None,
+        history_cache: HistoryCache | None = None,
+    ):
+        self.scraper = scraper_instance or AsyncScraper()
+        # Concurrent history fetches in resolve() and validate_many()
+        self.max_workers = max_workers
+        # Opt-in: repeated resolve() calls for the same criteria skip search and validation
+        self.resolution_cache = resolution_cache
+        # Opt-in: history requests for a ticker already fetched are trimmed from that fetch
+        self.history_cache = history_cache
+
+    async def search(self, query: str) -> list[Symbol]:
+        return await self.scraper.search(query)
+
+    async def _get_history(self, ticker: Ticker | str, days: int) -> History:
+        """
+        Last `days` days of history, from the history cache when it covers them.
+        """
+        name = self._ticker_name(ticker)
+        if self.history_cache is None:
+            return await self.scraper.get_history(name, days=days)
+        hist = self.history_cache.get(name, days)
+        if hist is not None:
+            return hist
+        fetch_days = self.history_cache.fetch_days(days)
+        hist = await self.scraper.get_history(name, days=fetch_days)
+        self.history_cache.put(name, fetch_days, hist)
+        return hist if fetch_days == days else last_days(hist, days)
+
+    async def _get_history_range(self, ticker: Ticker | str, start: date, end: date) -> History:
+        if self.history_cache is None:
+            return await self.scraper.get_history_range(ticker, start, end)
+        hist = await self._get_history(ticker, self.scraper._range_days(start))
+        return self.scraper._trim_history(hist, start, end)
+
+    async def resolve(self, criteria: SecurityCriteria) -> Symbol | None:
+        """
+        Resolve a security based on criteria.
+        Checks for ISIN, Symbol, Description.
+        Validates against Price/Date if provided.
+        """
+        if self.resolution_cache is None:
+            return await self._resolve(criteria)
+        found, cached = self.resolution_cache.lookup(criteria)
+        if found:
+            return cached
+        result = await self._resolve(criteria)
+        self.resolution_cache.store(criteria, result)
+        return result
+
+    async def _resolve(self, criteria: SecurityCriteria) -> Symbol | None:
+        candidates: list[Symbol] = []
+        if criteria.isin:
+            candidates = await self.scraper.search(str(criteria.isin))
+        if not candidates and criteria.symbol:
+            candidates = await self.scraper.search(str(criteria.symbol))
+        if not candidates and criteria.description:
+            candidates = await self.scraper.search(str(criteria.description))
+
+        if not candidates:
+            return None
+
+        filtered = self._filter_candidates(criteria, candidates)
+        if not filtered:
+            return None
+
+        # Price validation
+        if criteria.target_price:
+            target_dt = self._ensure_datetime(criteria.target_date)
+            start, end = self._get_lookup_window(target_dt)
+            target_pr = self._to_price(criteria.target_price)
+
+            semaphore = asyncio.Semaphore(max(self.max_workers, 1))
+
+            async def is_valid(cand: Symbol) -> bool:
+                async with semaphore:
+                    hist = await self._get_history_range(cand.ticker, start, end)
+                try:
+                    return self._check_price_match(hist, target_dt, target_pr)
+                except PriceVerificationError:
+                    return False
+
+            # Validate concurrently but decide in priority order; cancel the rest on a match
+            tasks = [asyncio.ensure_future(is_valid(cand)) for cand in filtered]
+            try:
+                for cand, task in zip(filtered, tasks, strict=True):
+                    if await task:
+                        return cand
+                return None
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return filtered[0]
+
+    async def get_price(self, ticker: Ticker | str, date: date | None = None) -> Price:
+        """
+        Get the price for a ticker (current or historical).
+        """
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        target_dt = self._ensure_datetime(date)
+        start, end = self._get_lookup_window(target_dt)
+        hist = await self._get_history_range(ticker_val, start, end)
+        return self._price_from_history(hist, ticker_val, target_dt)
+
+    async def history(
+        self, ticker: Ticker | str, period: HistoryPeriod = HistoryPeriod.MO1
+    ) -> History:
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        days = _PERIOD_DAYS.get(period, 30)
+        return self._materialized(await self._get_history(ticker_val, days=days))
+
+    async def history_many(
+        self, tickers: Iterable[Ticker | str], period: HistoryPeriod = HistoryPeriod.MO1
+    ) -> dict[str, History]:
+        """
+        Fetch history for many tickers using batched Chart API requests.
+        Tickers the history cache covers are not fetched again.
+        Returns a mapping of ticker to History; tickers that cannot be fetched are omitted.
+        """
+        days = _PERIOD_DAYS.get(period, 30)
+        cached, missing = self._cached_histories(tickers, days)
+        fetch_days = self._fetch_days(days)
+        fetched = (
+            await self.scraper.get_histories(list(missing), days=fetch_days) if missing else {}
+        )
+        return self._merge_fetched(cached, fetched, fetch_days, days)
+
+    async def validate(
+        self, ticker: Ticker | str, target_date: date, target_price: Price | float
+    ) -> bool:
+        """
+        Validates if the ticker traded near the target price on the target date.
+        """
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        price_val = self._to_price(target_price)
+
+        target_dt = self._ensure_datetime(target_date)
+        start, end = self._get_lookup_window(target_dt)
+        hist = await self._get_history_range(ticker_val, start, end)
+
+        return self._check_price_match(hist, target_dt, price_val)
+
+    async def validate_many(self, trades: Iterable[Trade]) -> AsyncIterator[TradeResult]:
+        """
+        Validate many trades with one history request per ticker.
+        Each ticker's history covers its earliest to latest trade date; tickers are fetched
+        concurrently (`max_workers`) and results are yielded ticker by ticker.
+        """
+        semaphore = asyncio.Semaphore(max(self.max_workers, 1))
+
+        async def validate_group(group: list[Trade]) -> list[TradeResult]:
+            try:
+                async with semaphore:
+                    start, end = self._trades_window(group)
+                    hist = await self._get_history_range(group[0].ticker, start, end)
+            except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+                return self._failed_trades(group, e)
+            return self._validate_trades(hist, group)
+
+        tasks = [
+            asyncio.ensure_future(validate_group(g)) for g in self._group_trades(trades).values()
+        ]
+        try:
+            for task in tasks:
+                for result in await task:
+                    yield result
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def get_prices(
+        self, tickers: Iterable[Ticker | str], dates: Iterable[date]
+    ) -> PriceMatrix:
+        """
+        Close prices as a ticker x date PriceMatrix; see FTDataSource.get_prices.
+        """
+        ticker_list = list(dict.fromkeys(t.root if isinstance(t, Ticker) else t for t in tickers))
+        date_list = self._unique_dates(dates)
+        if not ticker_list or not date_list:
+            return self._price_matrix(ticker_list, date_list, {})
+        start, end = self._dates_window(date_list)
+        semaphore = asyncio.Semaphore(max(self.max_workers, 1))
+
+        async def fetch(ticker: str) -> History | Exception:
+            try:
+                async with semaphore:
+                    return await self._get_history_range(ticker, start, end)
+            except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+                return e
+
+        histories = await asyncio.gather(*(fetch(t) for t in ticker_list))
+        return self._price_matrix(
+            ticker_list, date_list, dict(zip(ticker_list, histories, strict=True))
+        )
@@ -0,0 +1,193 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit/miss counters for a cache instance.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class BaseCache(ABC):
+    """
+    Key/value cache with optional per-entry TTL (seconds).
+    Values must be JSON-serializable so that every backend can store them.
+    Backends guard their store with `_lock`; `_get` is called with it held.
+    """
+
+    def __init__(self, ttl: float | None = None):
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            value = self._get(key)
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._set(key, value, expires_at)
+
+    @abstractmethod
+    def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def _get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    def _set(self, key: str, value: Any, expires_at: float | None) -> None: ...
+
+
+class MemoryCache(BaseCache):
+    """
+    Thread-safe in-memory LRU cache.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        super().__init__(ttl=ttl)
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _get(self, key: str) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def _set(self, key: str, value: Any, expires_at: float | None) -> None:
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class SqliteCache(BaseCache):
+    """
+    Persistent cache backed by a SQLite file.
+    Several caches (and processes) can share one file by using distinct namespaces.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        namespace: str = "cache",
+        ttl: float | None = None,
+        maxsize: int | None = None,
+    ):
+        super().__init__(ttl=ttl)
+        if not re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", namespace):
+            raise ValueError(f"Invalid cache namespace: {namespace!r}")
+        self.path = Path(path)
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {namespace} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, accessed_at REAL NOT NULL)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            row = self._conn.execute(f"SELECT COUNT(*) FROM {self.namespace}").fetchone()  # nosec B608
+        return int(row[0])
+
+    def _get(self, key: str) -> Any | None:
+        now = time.time()
+        with self._conn:
+            row = self._conn.execute(
+                f"SELECT value, expires_at FROM {self.namespace} WHERE key = ?",  # nosec B608
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    f"DELETE FROM {self.namespace} WHERE key = ?",  # nosec B608
+                    (key,),
+                )
+                return None
+            if self.maxsize is not None:
+                self._conn.execute(
+                    f"UPDATE {self.namespace} SET accessed_at = ? WHERE key = ?",  # nosec B608
+                    (now, key),
+                )
+        return json.loads(value)
+
+    def _set(self, key: str, value: Any, expires_at: float | None) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {self.namespace} "  # nosec B608
+                "(key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value), expires_at, time.time()),
+            )
+            if self.maxsize is not None:
+                self._conn.execute(
+                    f"DELETE FROM {self.namespace} WHERE key IN ("  # nosec B608
+                    f"SELECT key FROM {self.namespace} "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.maxsize,),
+                )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"DELETE FROM {self.namespace} WHERE key = ?",  # nosec B608
+                (key,),
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {self.namespace}")  # nosec B608
+
+    def close(self) -> None:
+        self._conn.close()
@@ -14,6 +14,8 @@ from pydantic_settings import (
 
 from .commands.history import HistoryCommand
 from .commands.lookup import LookupCommand
+from .commands.serve import ServeCommand
+from .commands.validate_batch import ValidateBatchCommand
 
 
 def setup_logging(v: bool, vv: bool):
@@ -68,6 +70,8 @@ class AppCLI(BaseSettings, GlobalArgs):
 
     lookup: CliSubCommand[LookupCommand]
     history: CliSubCommand[HistoryCommand]
+    validate_batch: CliSubCommand[ValidateBatchCommand]
+    serve: CliSubCommand[ServeCommand]
 
     def cli_cmd(self) -> None:
         v_main = self.v
@@ -81,6 +85,10 @@ class AppCLI(BaseSettings, GlobalArgs):
                 sub = self.lookup
             elif getattr(self, "history", None):
                 sub = self.history
+            elif getattr(self, "validate_batch", None):
+                sub = self.validate_batch
+            elif getattr(self, "serve", None):
+                sub = self.serve
 
         v_sub = getattr(sub, "v", False) if sub else False
         vv_sub = getattr(sub, "vv", False) if sub else False
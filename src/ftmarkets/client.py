@@ -1,9 +1,64 @@
-from typing import Any
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any, TypedDict
 
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import BaseAdapter, HTTPAdapter
 from urllib3.util.retry import Retry
 
+from .http_cache import ResponseCache, request_key
+from .ratelimit import RateLimiter
+from .singleflight import AsyncSingleFlight, SingleFlight
+from .transport import HTTP2Adapter, backoff_delay, retry_after_delay
+
+if TYPE_CHECKING:
+    import httpx
+
+
+# Points every client at another host, e.g. the stand-in server in ftmarkets.testing.server
+BASE_URL_ENV = "FTMARKETS_BASE_URL"
+
+
+class _PoolArgs(TypedDict):
+    """Connection pool settings shared by HTTPAdapter and RateLimitedAdapter."""
+
+    pool_connections: int
+    pool_maxsize: int
+    pool_block: bool
+    max_retries: Retry
+
+
+def _resolve_base_url(base_url: str | None) -> str:
+    return (base_url or os.environ.get(BASE_URL_ENV) or FTClient.BASE_URL).rstrip("/")
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that passes every network request through a RateLimiter.
+    Throttled attempts retried internally by urllib3 are reported too, via the retry history.
+    """
+
+    def __init__(self, limiter: RateLimiter, **kwargs: Any):
+        self.limiter = limiter
+        super().__init__(**kwargs)
+
+    def send(self, request: requests.PreparedRequest, *args: Any, **kwargs: Any) -> Any:
+        endpoint = self.limiter.acquire(request.url or "")
+        throttled = True
+        try:
+            resp = super().send(request, *args, **kwargs)
+            throttled = self._throttled(resp)
+            return resp
+        finally:
+            self.limiter.release(endpoint, throttled)
+
+    def _throttled(self, resp: requests.Response) -> bool:
+        if resp.status_code in FTClient.RETRY_STATUSES:
+            return True
+        retries = getattr(resp.raw, "retries", None)
+        history = getattr(retries, "history", None) or ()
+        return any(h.error is not None or h.status in FTClient.RETRY_STATUSES for h in history)
+
 
 class FTClient:
     """
@@ -12,39 +67,237 @@ class FTClient:
 
     BASE_URL = "https://markets.ft.com"
 
-    def __init__(self):
+    HEADERS = {
+        "User-Agent": (
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+        ),
+        "Accept": "application/json, text/plain, */*",
+        "Referer": "https://markets.ft.com/data/equities",
+    }
+
+    # Retry strategy
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 1
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    # Connection pool defaults; the module-level client is shared by every thread
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 32
+
+    def __init__(
+        self,
+        response_cache: ResponseCache | None = None,
+        coalesce: bool = True,
+        rate_limiter: RateLimiter | None = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        http2: bool = False,
+        adapter: BaseAdapter | None = None,
+        base_url: str | None = None,
+    ):
+        """
+        pool_connections: number of per-host pools to keep.
+        pool_maxsize: connections kept per host; match it to the number of worker threads.
+        pool_block: wait for a free connection instead of opening a throwaway one.
+        keep_alive: reuse connections between requests (sends `Connection: close` if off).
+        http2: multiplex requests over HTTP/2 through httpx (requires the `http2` extra).
+        adapter: custom transport (e.g. ReplayAdapter); replaces the pool, HTTP/2 and rate
+            limiting settings.
+        base_url: host to talk to instead of BASE_URL; defaults to $FTMARKETS_BASE_URL if set.
+        """
+        self.base_url = _resolve_base_url(base_url)
+        # Opt-in: without a response cache every call goes to the network
+        self.response_cache = response_cache
+        # Concurrent identical requests share one network call (and response object)
+        self.inflight = SingleFlight() if coalesce else None
         self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": (
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                ),
-                "Accept": "application/json, text/plain, */*",
-                "Referer": "https://markets.ft.com/data/equities",
-            }
-        )
+        self.session.headers.update(self.HEADERS)
+
+        if adapter is None:
+            adapter = self._build_adapter(
+                rate_limiter, pool_connections, pool_maxsize, pool_block, keep_alive, http2
+            )
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _build_adapter(
+        self,
+        rate_limiter: RateLimiter | None,
+        pool_connections: int,
+        pool_maxsize: int,
+        pool_block: bool,
+        keep_alive: bool,
+        http2: bool,
+    ) -> BaseAdapter:
+        if http2:
+            return HTTP2Adapter(
+                max_connections=pool_maxsize,
+                max_keepalive_connections=pool_maxsize if keep_alive else 0,
+                max_retries=self.RETRY_TOTAL,
+                backoff_factor=self.RETRY_BACKOFF_FACTOR,
+                retry_statuses=self.RETRY_STATUSES,
+                limiter=rate_limiter,
+            )
 
-        # Retry strategy
         retries = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            total=self.RETRY_TOTAL,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=list(self.RETRY_STATUSES),
             allowed_methods=["HEAD", "GET", "POST", "OPTIONS"],
         )
-        adapter = HTTPAdapter(max_retries=retries)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        pool: _PoolArgs = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "pool_block": pool_block,
+            "max_retries": retries,
+        }
+        if rate_limiter is not None:
+            return RateLimitedAdapter(rate_limiter, **pool)
+        return HTTPAdapter(**pool)
 
     def get(self, path: str, params: dict[str, Any] | None = None, **kwargs) -> requests.Response:
-        url = f"{self.BASE_URL}{path}" if path.startswith("/") else path
+        url = f"{self.base_url}{path}" if path.startswith("/") else path
         kwargs.setdefault("timeout", 10)  # default 10s timeout
-        return self.session.get(url, params=params, **kwargs)
+        return self._send("GET", url, params=params, **kwargs)
 
     def post(self, path: str, json: dict[str, Any] | None = None, **kwargs) -> requests.Response:
-        url = f"{self.BASE_URL}{path}"
+        url = f"{self.base_url}{path}"
         kwargs.setdefault("timeout", 10)
-        return self.session.post(url, json=json, **kwargs)
+        return self._send("POST", url, json_body=json, **kwargs)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+        **kwargs,
+    ) -> requests.Response:
+        # A streamed body can only be consumed once, so it cannot be shared
+        if self.inflight is None or kwargs.get("stream"):
+            return self._request(method, url, params, json_body, **kwargs)
+        key = request_key(method, url, params, json_body)
+        return self.inflight.do(
+            key, lambda: self._request(method, url, params, json_body, **kwargs)
+        )
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        json_body: dict[str, Any] | None,
+        **kwargs,
+    ) -> requests.Response:
+        if self.response_cache is not None:
+            return self.response_cache.send(
+                self.session, method, url, params=params, json_body=json_body, **kwargs
+            )
+        return self.session.request(method, url, params=params, json=json_body, **kwargs)
+
+
+class AsyncFTClient:
+    """
+    Asyncio client for markets.ft.com built on httpx.
+    Mirrors FTClient, including its retry policy. Requires the `async` extra.
+    """
+
+    BASE_URL = FTClient.BASE_URL
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        coalesce: bool = True,
+        http2: bool = False,
+        base_url: str | None = None,
+    ):
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "AsyncFTClient requires httpx. Install with: pip install 'py-ftmarkets[async]'"
+            ) from e
+
+        self._httpx = httpx
+        self.base_url = _resolve_base_url(base_url)
+        self.session = httpx.AsyncClient(
+            headers=FTClient.HEADERS,
+            timeout=10,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=max_connections),
+            http2=http2,
+        )
+        self.inflight = AsyncSingleFlight() if coalesce else None
+
+    async def __aenter__(self) -> "AsyncFTClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    async def get(
+        self, path: str, params: dict[str, Any] | None = None, **kwargs
+    ) -> "httpx.Response":
+        url = f"{self.base_url}{path}" if path.startswith("/") else path
+        return await self._send("GET", url, params=params, **kwargs)
+
+    async def post(
+        self, path: str, json: dict[str, Any] | None = None, **kwargs
+    ) -> "httpx.Response":
+        url = f"{self.base_url}{path}"
+        return await self._send("POST", url, json=json, **kwargs)
+
+    async def _send(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        if self.inflight is None:
+            return await self._request(method, url, **kwargs)
+        key = request_key(method, url, kwargs.get("params"), kwargs.get("json"))
+        return await self.inflight.do(key, lambda: self._request(method, url, **kwargs))
+
+    async def _request(self, method: str, url: str, **kwargs) -> "httpx.Response":
+        # Same policy as urllib3's Retry: exponential backoff, honouring Retry-After
+        retries = 0
+        while True:
+            delay = None
+            try:
+                resp = await self.session.request(method, url, **kwargs)
+            except self._httpx.TransportError as e:
+                if retries >= FTClient.RETRY_TOTAL:
+                    raise self._requests_error(e) from e
+            else:
+                if resp.status_code not in FTClient.RETRY_STATUSES:
+                    return resp
+                if retries >= FTClient.RETRY_TOTAL:
+                    return resp
+                delay = self._retry_after(resp)
+                await resp.aclose()
+
+            retries += 1
+            await asyncio.sleep(delay if delay is not None else self._backoff(retries))
+
+    def _requests_error(self, e: Exception) -> requests.exceptions.RequestException:
+        """
+        The requests exception the sync client raises for a failed transport, so callers
+        handle one error family for both clients.
+        """
+        if isinstance(e, self._httpx.ConnectTimeout):
+            return requests.exceptions.ConnectTimeout(e)
+        if isinstance(e, self._httpx.TimeoutException):
+            return requests.exceptions.ReadTimeout(e)
+        return requests.exceptions.ConnectionError(e)
+
+    def _backoff(self, consecutive_errors: int) -> float:
+        return backoff_delay(consecutive_errors, FTClient.RETRY_BACKOFF_FACTOR)
+
+    def _retry_after(self, resp: "httpx.Response") -> float | None:
+        return retry_after_delay(resp.status_code, resp.headers)
 
 
 # Singleton instance
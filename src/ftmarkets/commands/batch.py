@@ -0,0 +1,120 @@
+import json
+import logging
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, ClassVar, TypeVar
+
+from pydantic import BaseModel, Field
+from pydantic_market_data.cli_models import PATH
+
+from ..ledger import read_rows
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C", bound="BatchArgs")
+
+# Alternative column names accepted in --input files
+_ALIASES = {"symbol": "ticker", "description": "desc"}
+
+
+def row_fields(row: dict[str, Any], fields: Iterable[str]) -> dict[str, Any]:
+    """
+    Command arguments set by one input record. Column names are matched case-insensitively
+    with `-` and `_` interchangeable. Empty values and unknown columns are ignored.
+    """
+    allowed = set(fields)
+    update: dict[str, Any] = {}
+    for key, value in row.items():
+        if key is None or value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        name = str(key).strip().lower().replace("-", "_")
+        name = _ALIASES.get(name, name)
+        if name in allowed:
+            update[name] = value.strip() if isinstance(value, str) else value
+    return update
+
+
+def run_batch(
+    rows: Iterable[tuple[int, dict[str, Any] | ValueError]],
+    handle: Callable[[dict[str, Any]], dict[str, Any]],
+    jobs: int,
+    fields: Iterable[str] = (),
+) -> Iterator[dict[str, Any]]:
+    """
+    Apply handle to every row on `jobs` threads and yield the results in input order.
+    Rows are read as workers free up, so large inputs are never loaded whole. Rows that
+    could not be read are reported as errors without calling handle, with the result
+    `fields` set to None so every record has the same keys.
+    """
+    unread = dict.fromkeys(fields)
+
+    def handle_row(row: dict[str, Any] | ValueError) -> dict[str, Any]:
+        if isinstance(row, ValueError):
+            return {"input": None, **unread, "error": str(row)}
+        return handle(row)
+
+    if jobs <= 1:
+        for line, row in rows:
+            yield {"line": line, **handle_row(row)}
+        return
+
+    pending: deque[tuple[int, Future[dict[str, Any]]]] = deque()
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for line, row in rows:
+            pending.append((line, executor.submit(handle_row, row)))
+            # A few rows queued per worker, so a slow row does not stall the others
+            while len(pending) > jobs * 4 or (pending and pending[0][1].done()):
+                line_done, future = pending.popleft()
+                yield {"line": line_done, **future.result()}
+        while pending:
+            line_done, future = pending.popleft()
+            yield {"line": line_done, **future.result()}
+
+
+class BatchArgs(BaseModel):
+    """
+    Arguments of the --input batch mode shared by the lookup and history commands.
+    """
+
+    input: PATH | None = Field(
+        None, description="Process every record of a CSV or JSON Lines file (- for stdin)"
+    )
+    jobs: int = Field(4, description="Securities processed concurrently in --input mode")
+
+    # Command arguments an input record may set
+    _row_fields: ClassVar[tuple[str, ...]] = ()
+    # Keys of an output record besides input and error
+    _result_fields: ClassVar[tuple[str, ...]] = ()
+
+    def _for_row(self: C, row: dict[str, Any]) -> C:
+        """
+        Copy of the command with the arguments given by one input record. Arguments a record
+        leaves out keep their command-line values.
+        """
+        update = row_fields(row, self._row_fields)
+        parsed = self.model_validate(update)
+        return self.model_copy(update={name: getattr(parsed, name) for name in update})
+
+    def _run_batch(self, handle: Callable[[dict[str, Any]], dict[str, Any]]) -> None:
+        """
+        Run handle for each input record and print one JSON object per line.
+        Exits with status 1 if any record failed or the input could not be read.
+        """
+        assert self.input is not None
+        total = failed = 0
+        try:
+            for record in run_batch(read_rows(self.input), handle, self.jobs, self._result_fields):
+                total += 1
+                if record.get("error"):
+                    failed += 1
+                print(json.dumps(record))
+                sys.stdout.flush()
+        except (OSError, ValueError) as e:
+            logger.error("Could not read input: %s", e)
+            sys.exit(1)
+
+        logger.info("Processed %d record(s), %d failed", total, failed)
+        if failed:
+            sys.exit(1)
@@ -1,42 +1,47 @@
 import logging
 import sys
+from datetime import date, datetime
+from typing import Any, ClassVar
 
+import requests
 from pydantic_market_data.cli_models import HistoryArgs
 from pydantic_market_data.models import HistoryPeriod, Price, PriceVerificationError, StrictDate
 
 from .. import api
+from ..extract.scraper import ScraperError
+from ..history_cache import HistoryCache
 from ..utils import parse_date
+from .batch import BatchArgs
 
 logger = logging.getLogger(__name__)
 
 
-class HistoryCommand(HistoryArgs):
-    """Fetch history and validate"""
-
-    def cli_cmd(self) -> None:
-        ds = api.FTDataSource()
-        target_dt = parse_date(self.date) if self.date else None
+def _range_str(e: PriceVerificationError) -> str:
+    return (
+        f"{e.actual_low:.2f} - {e.actual_high:.2f}"
+        if e.actual_low is not None and e.actual_high is not None
+        else str(e)
+    )
 
-        target_date_vo = StrictDate(root=target_dt) if target_dt else None
-        target_price_vo = Price(root=self.price) if self.price else None
-
-        # Use SecurityCriteria to resolve
-        criteria = api.SecurityCriteria(
-            isin=self.isin,
-            symbol=self.ticker,
-            description=self.desc,
-            target_price=target_price_vo,
-            target_date=target_date_vo.root if target_date_vo else None,
-        )
 
-        sym = ds.resolve(criteria)
+class HistoryCommand(BatchArgs, HistoryArgs):
+    """Fetch history and validate"""
 
-        if not sym:
-            logger.error("Could not resolve ticker.")
-            sys.exit(1)
+    _row_fields: ClassVar[tuple[str, ...]] = (
+        "ticker",
+        "isin",
+        "desc",
+        "exchange",
+        "period",
+        "date",
+        "price",
+    )
+    _result_fields: ClassVar[tuple[str, ...]] = ("ticker", "history", "valid")
 
-        ticker = sym.ticker
-        print(f"Resolved to: {ticker}")
+    def cli_cmd(self) -> None:
+        if self.input:
+            self._run_batch(self._history_row)
+            return
 
         # safely parse HistoryPeriod
         try:
@@ -46,6 +51,18 @@ class HistoryCommand(HistoryArgs):
             logger.error(f"Invalid period '{self.period}'. Valid: {valid_periods}")
             sys.exit(1)
 
+        target_dt = parse_date(self.date) if self.date else None
+        ds = self._datasource()
+        sym = ds.resolve(self._criteria(target_dt))
+
+        if not sym:
+            logger.error("Could not resolve ticker.")
+            sys.exit(1)
+
+        ticker = sym.ticker
+        print(f"Resolved to: {ticker}")
+        self._widen_history(ds, enum_period, target_dt)
+
         hist = ds.history(ticker, period=enum_period)
         df = hist.to_pandas()
 
@@ -71,10 +88,65 @@ class HistoryCommand(HistoryArgs):
                     logger.error("VALIDATION FAILED")
                     sys.exit(1)
             except PriceVerificationError as e:
-                range_str = (
-                    f"{e.actual_low:.2f} - {e.actual_high:.2f}"
-                    if e.actual_low is not None and e.actual_high is not None
-                    else str(e)
-                )
-                logger.error("VALIDATION FAILED (Matched range: %s)", range_str)
+                logger.error("VALIDATION FAILED (Matched range: %s)", _range_str(e))
                 sys.exit(1)
+
+    def _datasource(self) -> api.FTDataSource:
+        return api.FTDataSource(history_cache=HistoryCache())
+
+    def _widen_history(
+        self, ds: api.FTDataSource, period: HistoryPeriod, target_dt: datetime | None
+    ) -> None:
+        """
+        Make the resolved ticker's history fetch cover the printed period and the price
+        check, so validate reads it instead of fetching again. Applied only after resolve,
+        whose candidate checks fetch just the narrow price lookup window.
+        """
+        assert ds.history_cache is not None
+        lookup_dates = [target_dt.date() if target_dt else date.today()] if self.price else []
+        ds.history_cache.min_days = api.lookback_days(period, lookup_dates)
+
+    def _criteria(self, target_dt: datetime | None) -> api.SecurityCriteria:
+        target_date_vo = StrictDate(root=target_dt) if target_dt else None
+        target_price_vo = Price(root=self.price) if self.price else None
+
+        # Use SecurityCriteria to resolve
+        return api.SecurityCriteria(
+            isin=self.isin,
+            symbol=self.ticker,
+            description=self.desc,
+            target_price=target_price_vo,
+            target_date=target_date_vo.root if target_date_vo else None,
+        )
+
+    def _history_row(self, row: dict[str, Any]) -> dict[str, Any]:
+        record: dict[str, Any] = {"input": row, **dict.fromkeys(self._result_fields)}
+        try:
+            args = self._for_row(row)
+            period = HistoryPeriod(args.period)
+            target_dt = parse_date(args.date) if args.date else None
+            if args.date and not target_dt:
+                raise ValueError(f"Invalid date: {args.date}")
+
+            ds = args._datasource()
+            sym = ds.resolve(args._criteria(target_dt))
+            if not sym:
+                return {**record, "error": "Could not resolve ticker."}
+            record["ticker"] = str(sym.ticker)
+            args._widen_history(ds, period, target_dt)
+            record["history"] = ds.history(sym.ticker, period=period).model_dump(mode="json")
+
+            if args.price and target_dt:
+                try:
+                    record["valid"] = ds.validate(sym.ticker, target_dt, Price(root=args.price))
+                except PriceVerificationError as e:
+                    record["valid"] = False
+                    return {
+                        **record,
+                        "error": f"VALIDATION FAILED (Matched range: {_range_str(e)})",
+                    }
+                if not record["valid"]:
+                    return {**record, "error": "VALIDATION FAILED"}
+        except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+            return {**record, "error": str(e)}
+        return {**record, "error": None}
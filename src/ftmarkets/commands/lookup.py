@@ -1,6 +1,7 @@
 import json
 import logging
 import sys
+from typing import Any, ClassVar
 
 import requests
 from pydantic_market_data.cli_models import SearchArgs
@@ -9,22 +10,89 @@ from pydantic_market_data.models import Price, PriceVerificationError, StrictDat
 from .. import api
 from ..extract.scraper import ScraperError
 from ..utils import parse_date
+from .batch import BatchArgs
 
 logger = logging.getLogger(__name__)
 
 
-class LookupCommand(SearchArgs):
+class LookupCommand(BatchArgs, SearchArgs):
     """Lookup a ticker symbol"""
 
+    _row_fields: ClassVar[tuple[str, ...]] = (
+        "ticker",
+        "isin",
+        "desc",
+        "exchange",
+        "currency",
+        "country",
+        "asset_class",
+        "date",
+        "price",
+        "limit",
+    )
+    _result_fields: ClassVar[tuple[str, ...]] = ("symbols",)
+
     def cli_cmd(self) -> None:
         ds = api.FTDataSource()
+        if self.input:
+            self._run_batch(lambda row: self._lookup_row(ds, row))
+            return
 
-        # Priority: ISIN > Symbol > Description
-        query = self.isin or self.ticker or self.desc
-        if not query:
-            logger.error("Please provide --isin, --ticker, or --desc")
+        try:
+            self._check_args()
+        except ValueError as e:
+            logger.error(e)
             sys.exit(1)
 
+        symbols = self._find(ds)
+        if not symbols:
+            logger.error("Ticker not found")
+            sys.exit(1)
+
+        if self.price:
+            for s in symbols:
+                self._print_result(s)
+        elif self.format == "json":
+            data = [s.model_dump(mode="json") for s in symbols]
+            print(json.dumps(data, indent=2))
+        elif self.format == "xml":
+            print("<Results>")
+            for s in symbols:
+                self._print_xml_symbol(s)
+            print("</Results>")
+        else:
+            for s in symbols:
+                print(s.ticker)
+
+    def _lookup_row(self, ds: api.FTDataSource, row: dict[str, Any]) -> dict[str, Any]:
+        try:
+            args = self._for_row(row)
+            args._check_args()
+            symbols = args._find(ds)
+        except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+            return {"input": row, "symbols": [], "error": str(e)}
+        return {
+            "input": row,
+            "symbols": [s.model_dump(mode="json") for s in symbols],
+            "error": None if symbols else "Ticker not found",
+        }
+
+    def _check_args(self) -> None:
+        if not (self.isin or self.ticker or self.desc):
+            raise ValueError("Please provide --isin, --ticker, or --desc")
+        if self.price:
+            if not self.date:
+                raise ValueError("Date is required for price validation")
+            if not parse_date(self.date):
+                raise ValueError("Invalid date format")
+
+    def _find(self, ds: api.FTDataSource) -> list[Symbol]:
+        """
+        Search, filter and (with a price) validate; the matches up to the limit.
+        """
+        # Priority: ISIN > Symbol > Description
+        query = self.isin or self.ticker or self.desc
+        assert query
         results = ds.search(query)
 
         # Filter results
@@ -48,33 +116,25 @@ class LookupCommand(SearchArgs):
                 continue
             filtered.append(s)
 
+        limit = self.limit if self.limit is not None else 100
+
         # Price/Date Validation
         if self.price:
-            if not self.date:
-                logger.error("Date is required for price validation")
-                sys.exit(1)
-
-            target_dt = parse_date(self.date)
-            if not target_dt:
-                logger.error("Invalid date format")
-                sys.exit(1)
-
+            target_dt = parse_date(self.date or "")
+            assert target_dt
             target_price = Price(root=self.price)
             strict_date = StrictDate(root=target_dt)
 
-            validated_count = 0
-            limit = self.limit if self.limit is not None else 100
-
+            validated: list[Symbol] = []
             for s in filtered:
-                if limit > 0 and validated_count >= limit:
+                if limit > 0 and len(validated) >= limit:
                     break
 
                 # Removed bare except Exception to enforce Fail Fast rule.
                 # Let it crash if not BaseScraperError.
                 try:
                     if ds.validate(s.ticker, strict_date.value, target_price):
-                        self._print_result(s)
-                        validated_count += 1
+                        validated.append(s)
                 except PriceVerificationError as e:
                     # Clean up the Matched range format
                     range_str = (
@@ -87,30 +147,9 @@ class LookupCommand(SearchArgs):
                     logger.debug(f"Scraper error during validation of {s.ticker}: {e}")
                 except requests.exceptions.HTTPError as e:
                     logger.debug(f"HTTP error during validation of {s.ticker}: {e}")
+            return validated
 
-            if validated_count == 0:
-                logger.error("Ticker not found")
-                sys.exit(1)
-            return
-
-        limit = self.limit if self.limit is not None else 100
-        symbols = filtered[:limit] if limit > 0 else filtered
-
-        if not symbols:
-            logger.error("Ticker not found")
-            sys.exit(1)
-
-        if self.format == "json":
-            data = [s.model_dump(mode="json") for s in symbols]
-            print(json.dumps(data, indent=2))
-        elif self.format == "xml":
-            print("<Results>")
-            for s in symbols:
-                self._print_xml_symbol(s)
-            print("</Results>")
-        else:
-            for s in symbols:
-                print(s.ticker)
+        return filtered[:limit] if limit > 0 else filtered
 
     def _print_result(self, s: Symbol) -> None:
         if self.format == "json":
@@ -0,0 +1,68 @@
+import signal
+import sys
+
+from pydantic import Field
+from pydantic_market_data.cli_models import PATH, GlobalArgs
+
+from .. import api
+from ..cache import SqliteCache
+from ..extract.scraper import Scraper
+from ..history_cache import HistoryCache
+from ..resolution_cache import ResolutionCache
+from ..service import Service, ServiceServer
+from ..store import HistoryStore
+
+
+class ServeCommand(GlobalArgs):
+    """Serve search, resolve, history, get_price and validate as a local JSON API"""
+
+    host: str = Field("127.0.0.1", description="Address to listen on")
+    port: int = Field(8765, description="TCP port to listen on")
+    socket: PATH | None = Field(None, description="Listen on this Unix socket instead of TCP")
+    jobs: int = Field(8, description="Maximum number of calls running at once")
+    cache_db: PATH | None = Field(
+        None, description="SQLite file persisting the XID, negative and resolution caches"
+    )
+    history_store: PATH | None = Field(None, description="SQLite file storing fetched candles")
+    history_ttl: float = Field(900, description="Seconds a fetched history is served from memory")
+    history_candles: int = Field(
+        2_000_000, description="Candles kept in the in-memory history cache"
+    )
+
+    def cli_cmd(self) -> None:
+        ds = api.FTDataSource(
+            self._scraper(),
+            max_workers=self.jobs,
+            resolution_cache=ResolutionCache(
+                SqliteCache(self.cache_db, namespace="resolve") if self.cache_db else None
+            ),
+            history_cache=HistoryCache(
+                maxsize=4096, ttl=self.history_ttl, max_candles=self.history_candles
+            ),
+        )
+        server = ServiceServer(
+            Service(ds, max_concurrency=self.jobs),
+            host=self.host,
+            port=self.port,
+            socket_path=self.socket,
+        )
+        print(f"Serving on {server.url}", flush=True)
+        # Stop on SIGTERM as on Ctrl-C, so the socket file is removed
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+
+    def _scraper(self) -> Scraper:
+        if not (self.cache_db or self.history_store):
+            return api.scraper
+        return Scraper(
+            xid_cache=SqliteCache(self.cache_db, namespace="xid") if self.cache_db else None,
+            negative_cache=(
+                SqliteCache(self.cache_db, namespace="negative") if self.cache_db else None
+            ),
+            history_store=HistoryStore(self.history_store) if self.history_store else None,
+        )
@@ -0,0 +1,74 @@
+import json
+import logging
+import sys
+from collections.abc import Iterator
+
+from pydantic import Field, PrivateAttr
+from pydantic_market_data.cli_models import PATH, GlobalArgs
+
+from .. import api
+from ..ledger import Trade, TradeResult, iter_trades
+
+logger = logging.getLogger(__name__)
+
+
+class ValidateBatchCommand(GlobalArgs):
+    """Validate a ledger of trades (CSV or JSON Lines)"""
+
+    input: PATH = Field(
+        PATH("-"), description="Trades file (.csv or .jsonl) with ticker, date, price[, id]"
+    )
+    # Malformed rows seen so far
+    _rejected: int = PrivateAttr(0)
+
+    def cli_cmd(self) -> None:
+        ds = api.FTDataSource()
+        self._rejected = 0
+        total = failed = 0
+        try:
+            # Malformed rows are reported while the ledger is read; the rest are validated
+            for result in ds.validate_many(self._read_trades()):
+                total += 1
+                if not result.valid:
+                    failed += 1
+                self._print_result(result)
+                sys.stdout.flush()
+        except OSError as e:
+            logger.error("Could not read trades: %s", e)
+            sys.exit(1)
+
+        logger.info(
+            "Validated %d trade(s), %d failed, %d row(s) rejected", total, failed, self._rejected
+        )
+        if failed or self._rejected:
+            sys.exit(1)
+
+    def _read_trades(self) -> Iterator[Trade]:
+        for line, trade in iter_trades(self.input):
+            if isinstance(trade, ValueError):
+                self._rejected += 1
+                self._print_rejected(line, trade)
+                continue
+            yield trade
+
+    def _print_rejected(self, line: int, error: ValueError) -> None:
+        if self.format == "json":
+            print(json.dumps({"line": line, "valid": None, "error": str(error)}))
+        else:
+            print(f"ERROR {error}")
+        sys.stdout.flush()
+
+    def _print_result(self, result: TradeResult) -> None:
+        if self.format == "json":
+            print(json.dumps(result.to_dict()))
+            return
+
+        trade = result.trade
+        status = {True: "PASSED", False: "FAILED", None: "ERROR"}[result.valid]
+        label = f"{trade.id} " if trade.id else ""
+        detail = (
+            result.error
+            if result.error
+            else f"{result.matched_date} low={result.low} high={result.high} close={result.close}"
+        )
+        print(f"{status} {label}{trade.ticker} {trade.date} @ {trade.price}: {detail}")
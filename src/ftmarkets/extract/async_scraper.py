@@ -0,0 +1,237 @@
+import asyncio
+import logging
+from datetime import date
+from typing import TYPE_CHECKING, cast
+
+import requests
+from pydantic_market_data.models import History, Symbol
+
+from ..cache import BaseCache
+from ..client import AsyncFTClient
+from ..frame import HistoryFrame, as_frame
+from ..store import HistoryStore
+from .schemas import Ticker, Xid
+from .scraper import BaseScraper, ScraperError, SearchBackend
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncScraper(BaseScraper):
+    """
+    Asyncio counterpart of Scraper.
+    Shares parsing and XID caching with Scraper; only the transport differs.
+    """
+
+    def __init__(
+        self,
+        http_client: AsyncFTClient | None = None,
+        xid_cache: BaseCache | None = None,
+        chart_batch_size: int = 20,
+        history_store: HistoryStore | None = None,
+        search_backend: SearchBackend = "html",
+        negative_cache: BaseCache | None = None,
+        negative_ttl: float = 900,
+    ):
+        super().__init__(
+            xid_cache=xid_cache,
+            chart_batch_size=chart_batch_size,
+            history_store=history_store,
+            search_backend=search_backend,
+            negative_cache=negative_cache,
+            negative_ttl=negative_ttl,
+        )
+        self.client = http_client or AsyncFTClient()
+
+    async def search(self, query: str | Ticker) -> list[Symbol]:
+        """
+        Search for a security by ISIN, symbol, or name.
+        With search_backend="json", tries the JSON search API first and falls back to the
+        HTML search page when it fails or finds nothing; otherwise scrapes the HTML page.
+        """
+        query_str = str(query)
+        if self._known_failure("search", query_str) is not None:
+            return []
+        if self.search_backend == "json":
+            try:
+                response = await self.client.get(self.SEARCH_API_PATH, params={"query": query_str})
+                self._raise_for_status(response, self.SEARCH_API_PATH)
+                results = self._parse_search_api(response.content, query_str)
+                if results:
+                    return results
+            except (ValueError, requests.exceptions.RequestException) as e:
+                logger.debug("JSON search failed for %s, using HTML search: %s", query_str, e)
+
+        response = await self.client.get(self.SEARCH_PATH, params={"query": query_str})
+        self._raise_for_status(response, self.SEARCH_PATH)
+        results = self._parse_search_page(response.content, str(response.url), query_str)
+        if not results:
+            self._remember_failure("search", query_str, f"No results for {query_str}")
+        return results
+
+    async def get_history(self, ticker: Ticker | str, days: int = 30) -> History:
+        """
+        Fetch historical data using the strict Chart API schemas.
+        With a history store, only the days missing from the store are requested.
+        """
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        if self.history_store is None:
+            return await self._fetch_history(ticker_val, days)
+
+        fetch_days = self._store_fetch_days(ticker_val, days)
+        if fetch_days:
+            history = await self._fetch_history(ticker_val, fetch_days)
+            self._store_merge(ticker_val, history, fetch_days)
+        return self._store_load(ticker_val, days)
+
+    async def get_history_range(self, ticker: Ticker | str, start: date, end: date) -> History:
+        """
+        Fetch history between start and end (inclusive).
+        Requests the smallest look-back that reaches start and trims the rest client-side.
+        """
+        history = await self.get_history(ticker, days=self._range_days(start))
+        return self._trim_history(history, start, end)
+
+    async def get_history_frame(self, ticker: Ticker | str, days: int = 30) -> HistoryFrame:
+        """
+        Fetch history as a columnar HistoryFrame (NumPy arrays, no per-candle models).
+        """
+        return as_frame(await self.get_history(ticker, days=days))
+
+    async def _fetch_history(self, ticker_val: Ticker, days: int) -> History:
+        self._raise_known_failure("chart", ticker_val.root)
+        xid, from_cache = await self._get_xid(ticker_val)
+
+        resp = await self._post_chart([xid], days)
+        if from_cache and self._is_xid_rejection(resp.status_code):
+            # Stale cache entry: forget it and rediscover the XID from the tearsheet
+            logger.debug("Chart API rejected cached XID %s for %s", xid, ticker_val.root)
+            self.xid_cache.delete(ticker_val.root)
+            xid, _ = await self._get_xid(ticker_val)
+            resp = await self._post_chart([xid], days)
+        self._remember_rejection("chart", ticker_val.root, resp.status_code, self.CHART_PATH)
+        self._raise_for_status(resp, self.CHART_PATH)
+
+        chart_data = self._decode_chart(resp.content)
+        return self._convert_to_history(ticker_val, chart_data)
+
+    async def get_histories(
+        self, tickers: list[Ticker | str], days: int = 30, batch_size: int | None = None
+    ) -> dict[str, History]:
+        """
+        Fetch history for many tickers in batched Chart API requests, issued concurrently.
+        Tickers that cannot be fetched are logged and omitted from the result.
+        """
+        ticker_vals = self._unique_tickers(tickers)
+        if self.history_store is None:
+            return await self._fetch_histories(ticker_vals, days, batch_size)
+
+        plans = {t.root: self._store_fetch_days(t, days) for t in ticker_vals}
+        stale = [t for t in ticker_vals if plans[t.root]]
+        fetched: dict[str, History] = {}
+        if stale:
+            # One request window for every stale ticker keeps them batchable
+            fetch_days = max(cast(int, plans[t.root]) for t in stale)
+            fetched = await self._fetch_histories(stale, fetch_days, batch_size)
+            for t in stale:
+                if t.root in fetched:
+                    self._store_merge(t, fetched[t.root], fetch_days)
+        return {
+            t.root: self._store_load(t, days)
+            for t in ticker_vals
+            if t.root in fetched or plans[t.root] is None
+        }
+
+    async def _fetch_histories(
+        self, ticker_vals: list[Ticker], days: int, batch_size: int | None
+    ) -> dict[str, History]:
+        batch_size = batch_size or self.chart_batch_size
+
+        async def batch_xid(ticker: Ticker) -> Xid:
+            self._raise_known_failure("chart", ticker.root)
+            return await self.get_xid(ticker)
+
+        xids = await asyncio.gather(*(batch_xid(t) for t in ticker_vals), return_exceptions=True)
+
+        resolved: list[tuple[Ticker, Xid]] = []
+        for t, xid in zip(ticker_vals, xids, strict=True):
+            if isinstance(xid, BaseException):
+                if not isinstance(xid, ScraperError | requests.exceptions.RequestException):
+                    raise xid
+                logger.warning("Skipping %s: %s", t.root, xid)
+                continue
+            resolved.append((t, xid))
+
+        results: dict[str, History] = {}
+        await asyncio.gather(
+            *(
+                self._fetch_batch(resolved[i : i + batch_size], days, results)
+                for i in range(0, len(resolved), batch_size)
+            )
+        )
+        # Restore the caller's order, which concurrent batches do not preserve
+        return {t.root: results[t.root] for t in ticker_vals if t.root in results}
+
+    async def _fetch_batch(
+        self, batch: list[tuple[Ticker, Xid]], days: int, results: dict[str, History]
+    ) -> None:
+        if len(batch) == 1:
+            # Single ticker: go through _fetch_history so stale cached XIDs get refreshed
+            ticker = batch[0][0]
+            try:
+                results[ticker.root] = await self._fetch_history(ticker, days)
+            except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+                logger.warning("Failed to fetch history for %s: %s", ticker.root, e)
+            return
+
+        try:
+            resp = await self._post_chart([xid for _, xid in batch], days)
+            self._raise_for_status(resp, self.CHART_PATH)
+            chart_data = self._decode_chart(resp.content)
+        except (ValueError, requests.exceptions.RequestException) as e:
+            logger.debug("Chart batch of %d failed (%s); splitting", len(batch), e)
+            mid = len(batch) // 2
+            await asyncio.gather(
+                self._fetch_batch(batch[:mid], days, results),
+                self._fetch_batch(batch[mid:], days, results),
+            )
+            return
+
+        for ticker, xid in batch:
+            results[ticker.root] = self._convert_to_history(ticker, chart_data, xid=xid)
+
+    async def _post_chart(self, xids: list[Xid], days: int) -> "httpx.Response":
+        return await self.client.post(self.CHART_PATH, json=self._chart_payload(xids, days))
+
+    async def get_xid(self, ticker: Ticker) -> Xid:
+        """
+        Extract internal XID for a ticker.
+        Consults the XID cache before downloading the tearsheet page.
+        """
+        xid, _ = await self._get_xid(ticker)
+        return xid
+
+    async def _get_xid(self, ticker: Ticker) -> tuple[Xid, bool]:
+        cached = self._cached_xid(ticker)
+        if cached is not None:
+            return cached, True
+        self._raise_known_failure("xid", ticker.root)
+
+        url_summary = self._tearsheet_path(ticker)
+        resp = await self.client.get(url_summary)
+        self._remember_rejection("xid", ticker.root, resp.status_code, url_summary)
+        self._raise_for_status(resp, url_summary)
+
+        xid = self._parse_xid_or_remember(ticker, resp.content, resp.text)
+        self.xid_cache.set(ticker.root, xid.root)
+        return xid, False
+
+    def _raise_for_status(self, resp: "httpx.Response", url: str) -> None:
+        # Raise the same exception type as the sync Scraper so callers handle one error family
+        if resp.status_code < 400:
+            return
+        if resp.status_code == 400:
+            logger.debug("HTTP 400 Error for %s: %s", url, resp.text)
+        raise requests.exceptions.HTTPError(f"{resp.status_code} Error for url: {resp.url}")
@@ -94,7 +94,8 @@ class ComponentSeries(BaseModel):
     """
 
     type: ComponentSeriesType = Field(..., alias="Type")
-    values: list[float] = Field(..., alias="Values")
+    # Null where the symbol has no value for a date shared with other requested symbols
+    values: list[float | None] = Field(..., alias="Values")
 
 
 class ChartElementResponse(BaseModel):
@@ -115,3 +116,13 @@ class ChartResponse(BaseModel):
 
     dates: list[datetime] = Field(..., alias="Dates")
     elements: list[ChartElementResponse] = Field(..., alias="Elements")
+
+
+class RawChartResponse(ChartResponse):
+    """
+    Chart API response with dates kept as ISO 8601 strings.
+    Decoding path for bulk data: the dates are parsed in one vectorized step
+    (numpy datetime64) instead of one datetime object per day.
+    """
+
+    dates: list[str] = Field(..., alias="Dates")  # type: ignore[assignment]
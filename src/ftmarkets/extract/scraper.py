@@ -2,17 +2,24 @@ import html as html_lib
 import json
 import logging
 import re
-from typing import Any, cast
+from collections.abc import Iterable, Iterator
+from datetime import date, timedelta
+from typing import Any, Literal, cast
 from urllib.parse import parse_qs, urlparse
 
+import numpy as np
 import requests
-from lxml import html
+from lxml import etree, html
 from lxml.html import HtmlElement
 from pydantic_extra_types.country import CountryAlpha2
 from pydantic_extra_types.currency_code import Currency
-from pydantic_market_data.models import OHLCV, History, Symbol
+from pydantic_market_data.models import History, Symbol
 
+from ..cache import BaseCache, MemoryCache
 from ..client import FTClient, client
+from ..frame import HistoryFrame, as_frame, trim_history
+from ..singleflight import SingleFlight
+from ..store import HistoryStore
 from .schemas import (
     ChartElementType,
     ChartRequest,
@@ -21,87 +28,183 @@ from .schemas import (
     ComponentSeries,
     DataPeriod,
     Isin,
+    RawChartResponse,
     Ticker,
     Xid,
 )
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `fast` extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Mapping for FT tab IDs/names to standard types
+_ASSET_CLASS_MAP = {
+    "etf-panel": "ETF",
+    "equity-panel": "Equity",
+    "fund-panel": "Fund",
+    "index-panel": "Index",
+    "ETFs": "ETF",
+    "Equities": "Equity",
+    "Funds": "Fund",
+    "Indices": "Index",
+    "Indicies": "Index",
+    "etfs": "ETF",
+    "equities": "Equity",
+    "funds": "Fund",
+    "indices": "Index",
+}
+
+
+SearchBackend = Literal["json", "html"]
+
+# First xid inside a data-mod-config attribute, HTML-escaped ("...) or single-quoted ('...)
+_XID_CONFIG_RE = re.compile(
+    rb"""data-mod-config=(?:"[^"]*?&quot;xid&quot;\s*:\s*(?:&quot;)?"""
+    rb"""|'[^']*?"xid"\s*:\s*"?)(\d+)"""
+)
+_XID_MARKER = b"data-mod-config"
+
+# Search page XPaths, compiled once. Panels and tearsheet links come from one document walk.
+_SEARCH_NODES_XPATH = etree.XPath(
+    '//div[@role="tabpanel"] | //div[contains(@class, "mod-search-results__section")]'
+    ' | //a[contains(@href, "tearsheet/summary?s=")]'
+)
+_PANEL_HEADER_XPATH = etree.XPath("(.//h3)[1]")
+_PANEL_ROWS_XPATH = etree.XPath('.//table[contains(@class, "mod-ui-table")]/tbody/tr')
+_ROW_CELLS_XPATH = etree.XPath("./td")
+# A data-mod-config attribute longer than this may be missed by the incremental scan
+_XID_SCAN_WINDOW = 64 * 1024
+
+
+def _json_loads(content: bytes) -> Any:
+    return orjson.loads(content) if orjson is not None else json.loads(content)
+
 
 class ScraperError(Exception):
     """Scraper error."""
 
 
-class Scraper:
+class BaseScraper:
     """
-    Strictly typed scraper for FT Markets data.
-    Encapsulates all logic for interacting with markets.ft.com.
+    Transport-independent part of the scraper: XID caching, request building and parsing.
+    Subclasses provide the network I/O (see Scraper and AsyncScraper).
     """
 
-    def __init__(self, http_client: FTClient | None = None):
-        self.client = http_client or client
+    SEARCH_PATH = "/data/search"
+    SEARCH_API_PATH = "/data/searchapi/searchsecurities"
+    CHART_PATH = "/data/chartapi/series"
+    # Tearsheet read size; the XID usually sits in the first few chunks of the page
+    XID_CHUNK_SIZE = 16 * 1024
 
-    def search(self, query: str | Ticker) -> list[Symbol]:
+    def __init__(
+        self,
+        xid_cache: BaseCache | None = None,
+        chart_batch_size: int = 20,
+        history_store: HistoryStore | None = None,
+        search_backend: SearchBackend = "html",
+        negative_cache: BaseCache | None = None,
+        negative_ttl: float = 900,
+    ):
+        # XIDs never change for a ticker, so the default in-memory cache has no TTL
+        self.xid_cache = xid_cache if xid_cache is not None else MemoryCache(maxsize=4096)
+        self.chart_batch_size = chart_batch_size
+        self.history_store = history_store
+        # HTML by default: the JSON endpoint is undocumented and may rank or filter hits
+        # differently from the search page. resolve() takes the first valid candidate in that
+        # order, and the HTML fallback only catches failed or empty JSON searches, so a
+        # different ranking would silently change which listing a query resolves to
+        self.search_backend = search_backend
+        # Known dead ends (empty searches, missing XIDs, rejected chart requests) are
+        # remembered for negative_ttl seconds and fail fast; 0 disables negative caching
+        self.negative_cache = (
+            negative_cache if negative_cache is not None else MemoryCache(maxsize=4096)
+        )
+        self.negative_ttl = negative_ttl
+
+    def _parse_search_api(self, content: bytes, query: str) -> list[Symbol]:
         """
-        Search for a security by ISIN, symbol, or name.
-        Parsing logic is strict but resilient to HTML changes where possible.
+        Parse a searchsecurities JSON response.
+        XIDs included in the response are stored in the XID cache, saving a tearsheet request.
         """
-        query_str = str(query)
-        url = "/data/search"
-        response = self.client.get(url, params={"query": query_str})
-        try:
-            response.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if response.status_code == 400:
-                logger.debug("HTTP 400 Error for %s: %s", url, response.text)
-            raise e
+        payload = _json_loads(content)
+        if not isinstance(payload, dict):
+            raise ValueError("Unexpected searchsecurities payload")
+
+        results: list[Symbol] = []
+        seen: set[str] = set()
+        for item in self._iter_search_items(payload.get("data")):
+            ticker = item.get("symbol") if isinstance(item.get("symbol"), str) else None
+            ticker = item.get("ticker") or ticker
+            if not ticker or ticker in seen:
+                continue
+            seen.add(ticker)
+
+            raw_class = item.get("assetClass") or item.get("type")
+            asset_type = _ASSET_CLASS_MAP.get(raw_class, raw_class) if raw_class else None
+            exchange = item.get("exchange") or item.get("exchangeCode")
+            country = item.get("countryCode") or item.get("country")
+            self._add_to_results(
+                results,
+                ticker,
+                item.get("name") or ticker,
+                exchange,
+                country,
+                asset_type,
+                query,
+                currency=item.get("currency"),
+            )
+            if item.get("xid"):
+                self.xid_cache.set(ticker, str(item["xid"]))
+        return results
 
-        tree = cast(HtmlElement, html.fromstring(response.content))
+    def _iter_search_items(self, node: Any) -> Iterator[dict[str, Any]]:
+        # The documented shape is {"data": {"symbol": {...}}}; accept lists and nesting as well
+        if isinstance(node, list):
+            for child in node:
+                yield from self._iter_search_items(child)
+        elif isinstance(node, dict):
+            if isinstance(node.get("ticker"), str) or (
+                isinstance(node.get("symbol"), str) and "name" in node
+            ):
+                yield node
+                return
+            for child in node.values():
+                yield from self._iter_search_items(child)
+
+    def _parse_search_page(self, content: bytes, url: str, query: str) -> list[Symbol]:
+        tree = cast(HtmlElement, html.fromstring(content))
 
         # Check for direct redirect (tearsheet)
-        if "tearsheet" in response.url:
-            return self._parse_tearsheet_as_search_result(response.url, tree, query_str)
+        if "tearsheet" in url:
+            return self._parse_tearsheet_as_search_result(url, tree, query)
 
         # Standard search results page
-        return self._parse_search_results(tree, query_str)
+        return self._parse_search_results(tree, query)
 
     def _parse_search_results(self, tree: HtmlElement, query: str) -> list[Symbol]:
         results: list[Symbol] = []
-        # Mapping for FT tab IDs/names to standard types
-        asset_class_map = {
-            "etf-panel": "ETF",
-            "equity-panel": "Equity",
-            "fund-panel": "Fund",
-            "index-panel": "Index",
-            "ETFs": "ETF",
-            "Equities": "Equity",
-            "Funds": "Fund",
-            "Indices": "Index",
-            "Indicies": "Index",
-            "etfs": "ETF",
-            "equities": "Equity",
-            "funds": "Fund",
-            "indices": "Index",
-        }
+        seen: set[str] = set()
 
-        xpath_query = (
-            '//div[@role="tabpanel"] | //div[contains(@class, "mod-search-results__section")]'
-        )
-        panels = tree.xpath(xpath_query)
+        panels: list[HtmlElement] = []
+        links: list[HtmlElement] = []
+        for node in cast(list[HtmlElement], _SEARCH_NODES_XPATH(tree)):
+            (links if node.tag == "a" else panels).append(node)
 
         # 1. Standard Panel Results
         for panel in panels:
             panel_id = panel.get("id")
-            asset_type = asset_class_map.get(panel_id)
+            asset_type = _ASSET_CLASS_MAP.get(panel_id) if panel_id else None
             if not asset_type:
-                header = panel.xpath(".//h3")
-                if header:
+                header = cast(list[HtmlElement], _PANEL_HEADER_XPATH(panel))
+                if header and header[0].text:
                     ft_name = header[0].text.strip()
-                    asset_type = asset_class_map.get(ft_name, ft_name)
+                    asset_type = _ASSET_CLASS_MAP.get(ft_name, ft_name)
 
-            rows = panel.xpath('.//table[contains(@class, "mod-ui-table")]/tbody/tr')
-            for row in rows:
-                cols = row.xpath("./td")
+            for row in cast(list[HtmlElement], _PANEL_ROWS_XPATH(panel)):
+                cols = cast(list[HtmlElement], _ROW_CELLS_XPATH(row))
                 if len(cols) >= 2:
                     name = cols[0].text_content().strip()
                     ticker_str = cols[1].text_content().strip()
@@ -110,23 +213,23 @@ class Scraper:
                     self._add_to_results(
                         results, ticker_str, name, exchange, country, asset_type, query
                     )
+                    seen.add(str(results[-1].ticker))
 
         # 2. Capture ALL tearsheet links on the page (covers "Best Match" and other lists)
         # Avoid duplicates and ensure they look like tickers
-        all_links = tree.xpath('//a[contains(@href, "tearsheet/summary?s=")]')
-        for link in all_links:
-            href = link.get("href")
-            parsed = urlparse(href)
-            qs = parse_qs(parsed.query)
+        for link in links:
+            href = link.get("href") or ""
+            qs = parse_qs(urlparse(href).query)
             ticker_str = qs.get("s", [None])[0]
-            name = link.text_content().strip()
-            if ticker_str and not any(str(r.ticker) == ticker_str for r in results):
+            if ticker_str and ticker_str not in seen:
+                name = link.text_content().strip()
                 link_asset_type = None
                 for at_key in ["equities", "etfs", "funds", "indices"]:
                     if f"/{at_key}/" in href:
-                        link_asset_type = asset_class_map.get(at_key, at_key.capitalize())
+                        link_asset_type = _ASSET_CLASS_MAP.get(at_key, at_key.capitalize())
                         break
                 self._add_to_results(results, ticker_str, name, None, None, link_asset_type, query)
+                seen.add(str(results[-1].ticker))
 
         return results
 
@@ -139,9 +242,14 @@ class Scraper:
         country: str | None,
         asset_type: str | None,
         query: str,
+        currency: str | None = None,
     ) -> None:
         country_code = self._map_country_to_code(country)
-        currency = self._extract_currency(ticker) or self._map_country_to_currency(country_code)
+        currency = (
+            currency.upper()
+            if currency
+            else self._extract_currency(ticker) or self._map_country_to_currency(country_code)
+        )
         isin_val = query if self._is_isin(query) else None
 
         # pass raw strings to Symbol model
@@ -188,62 +296,65 @@ class Scraper:
 
         return [Symbol(ticker=symbol_code, name=name, isin=isin_val, asset_class=asset_class)]
 
-    def get_history(self, ticker: Ticker | str, days: int = 30) -> History:
-        """
-        Fetch historical data using the strict Chart API schemas.
-        """
-        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
-        xid = self.get_xid(ticker_val)
-
-        # Clean xid (remove quotes if present)
-        # xid is a strictly typed Xid, convert to string for manipulation if needed,
-        # but Xid.root is string.
-        xid_val = xid.root.strip('"').strip("'")
+    def _chart_payload(self, xids: list[Xid], days: int) -> dict[str, Any]:
+        elements = []
+        for xid in xids:
+            # Clean xid (remove quotes if present)
+            xid_val = Xid(root=xid.root.strip('"').strip("'"))
+            elements.append(ChartRequestElement(Type=ChartElementType.PRICE, Symbol=xid_val))
+            elements.append(ChartRequestElement(Type=ChartElementType.VOLUME, Symbol=xid_val))
 
         # Map days to period/interval if needed, but API accepts raw days
         # We use a standard configuration
-        request_model = ChartRequest(
-            days=days,
-            dataPeriod=DataPeriod.DAY,
-            elements=[
-                ChartRequestElement(Type=ChartElementType.PRICE, Symbol=Xid(root=xid_val)),
-                ChartRequestElement(Type=ChartElementType.VOLUME, Symbol=Xid(root=xid_val)),
-            ],
-        )
+        request_model = ChartRequest(days=days, dataPeriod=DataPeriod.DAY, elements=elements)
+        return request_model.model_dump(by_alias=True)
 
-        resp = self.client.post(
-            "/data/chartapi/series", json=request_model.model_dump(by_alias=True)
-        )
-        try:
-            resp.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if resp.status_code == 400:
-                logger.debug("HTTP 400 Error for /data/chartapi/series: %s", resp.text)
-            raise e
-
-        # Parse with Pydantic
-        chart_data = ChartResponse(**resp.json())
-
-        return self._convert_to_history(ticker_val, chart_data)
-
-    def get_xid(self, ticker: Ticker) -> Xid:
+    def _decode_chart(self, content: bytes) -> RawChartResponse:
         """
-        Extract internal XID for a ticker.
+        Decode a Chart API response body straight from bytes.
+        Uses orjson when installed, otherwise pydantic's native JSON parser.
         """
-        url_summary = f"/data/equities/tearsheet/summary?s={ticker.root}"
+        if orjson is not None:
+            return RawChartResponse.model_validate(orjson.loads(content))
+        return RawChartResponse.model_validate_json(content)
+
+    def _tearsheet_path(self, ticker: Ticker) -> str:
         # Note: Valid for Equities/ETFs/Indices usually, if not we might need adaptive URLs
         # But commonly ?s=TICKER works for lookup or redirects
-        resp = self.client.get(url_summary)
-        try:
-            resp.raise_for_status()
-        except requests.exceptions.HTTPError as e:
-            if resp.status_code == 400:
-                logger.debug("HTTP 400 Error for %s: %s", url_summary, resp.text)
-            raise e
+        return f"/data/equities/tearsheet/summary?s={ticker.root}"
 
-        tree = html.fromstring(resp.content)
-
-        xid_str = None
+    def _scan_xid(self, chunks: Iterable[bytes]) -> tuple[str | None, bytes]:
+        """
+        Scan tearsheet bytes for the first data-mod-config XID without building a DOM.
+        Stops reading `chunks` at the first match. Returns the XID (None on a miss) and the
+        bytes read so far, which on a miss is the whole page.
+        """
+        read: list[bytes] = []
+        tail = b""
+        for chunk in chunks:
+            if not chunk:
+                continue
+            read.append(chunk)
+            buf = tail + chunk
+            match = _XID_CONFIG_RE.search(buf)
+            # Digits at the very end of the buffer may continue in the next chunk
+            if match and match.end() < len(buf):
+                return match.group(1).decode(), b"".join(read)
+            # Carry over the last (possibly unfinished) attribute into the next chunk
+            start = buf.rfind(_XID_MARKER)
+            if start == -1 or len(buf) - start > _XID_SCAN_WINDOW:
+                start = max(len(buf) - len(_XID_MARKER), 0)
+            tail = buf[min(start, match.start()) if match else start :]
+        match = _XID_CONFIG_RE.search(tail)
+        return (match.group(1).decode() if match else None), b"".join(read)
+
+    def _parse_xid(self, ticker: Ticker, content: bytes, text: str) -> Xid:
+        # Fast path: a byte scan finds the XID without parsing the page
+        xid_str, _ = self._scan_xid([content])
+        if xid_str:
+            return Xid(root=xid_str)
+
+        tree = html.fromstring(content)
 
         # Method A: data-mod-config
         divs = cast(list[Any], tree.xpath("//div[@data-mod-config] | //section[@data-mod-config]"))
@@ -265,7 +376,7 @@ class Scraper:
         if not xid_str:
             # Method B: Regex fallback
             regex = r'(?:xid|&quot;xid&quot;)\s*[:=]\s*(?:["\']|&quot;)?(\d+)(?:["\']|&quot;)?'
-            match = re.search(regex, resp.text)
+            match = re.search(regex, text)
             if match:
                 xid_str = match.group(1)
 
@@ -274,55 +385,141 @@ class Scraper:
 
         return Xid(root=xid_str)
 
-    def _convert_to_history(self, ticker: Ticker, data: ChartResponse) -> History:
+    def _parse_xid_or_remember(self, ticker: Ticker, content: bytes, text: str) -> Xid:
+        try:
+            return self._parse_xid(ticker, content, text)
+        except ScraperError as e:
+            self._remember_failure("xid", ticker.root, str(e))
+            raise
+
+    def _unique_tickers(self, tickers: list[Ticker | str]) -> list[Ticker]:
+        ticker_vals = [Ticker(root=t) if isinstance(t, str) else t for t in tickers]
+        # Deduplicate while keeping the caller's order
+        return list({t.root: t for t in ticker_vals}.values())
+
+    def _store_fetch_days(self, ticker: Ticker, days: int) -> int | None:
+        """
+        Days to request from the Chart API, or None when the history store already has them.
+        """
+        if self.history_store is None:
+            return days
+        return self.history_store.missing_days(ticker.root, days)
+
+    def _store_merge(self, ticker: Ticker, history: History, fetched_days: int) -> None:
+        if self.history_store is None:
+            return
+        today = date.today()
+        self.history_store.save(
+            ticker.root, as_frame(history), today - timedelta(days=fetched_days), today
+        )
+
+    def _store_load(self, ticker: Ticker, days: int) -> History:
+        assert self.history_store is not None
+        start = date.today() - timedelta(days=days)
+        return self.history_store.load_frame(ticker.root, start).to_history()
+
+    def _range_days(self, start: date) -> int:
+        # The Chart API only takes a look-back in days, so request the smallest one reaching start
+        return max((date.today() - start).days + 1, 2)
+
+    def _trim_history(self, history: History, start: date, end: date) -> History:
+        return trim_history(history, start, end)
+
+    def _cached_xid(self, ticker: Ticker) -> Xid | None:
+        cached = self.xid_cache.get(ticker.root)
+        return Xid(root=cached) if cached is not None else None
+
+    def _convert_to_history(
+        self, ticker: Ticker, data: ChartResponse, xid: Xid | None = None
+    ) -> History:
         """
         Convert strictly typed API response to pydantic-market-data History.
+        Candles are materialized lazily from the columnar frame.
+        """
+        return self._convert_to_frame(ticker, data, xid=xid).to_history()
+
+    def _convert_to_frame(
+        self, ticker: Ticker, data: ChartResponse, xid: Xid | None = None
+    ) -> HistoryFrame:
+        """
+        Build a columnar HistoryFrame straight from the component series.
+        When the response covers several symbols, `xid` selects the elements to use.
         """
-        ranges = []
+        symbol = Symbol(ticker=ticker, name=ticker.root)
 
         # Find Price and Volume elements
-        price_el = next((e for e in data.elements if e.type == ChartElementType.PRICE), None)
-        vol_el = next((e for e in data.elements if e.type == ChartElementType.VOLUME), None)
+        elements = data.elements
+        if xid is not None:
+            xid_val = xid.root.strip('"').strip("'")
+            elements = [e for e in elements if e.symbol == xid_val]
+        price_el = next((e for e in elements if e.type == ChartElementType.PRICE), None)
+        vol_el = next((e for e in elements if e.type == ChartElementType.VOLUME), None)
 
         if not price_el:
-            return History(symbol=Symbol(ticker=ticker, name=ticker.root), candles=[])
+            return HistoryFrame.from_series(symbol, [], {})
 
         # Extract series
         # Helper to get values list safely
-        def get_values(series_list: list[ComponentSeries], type_name: str) -> list[float]:
+        def get_values(series_list: list[ComponentSeries], type_name: str) -> list[float | None]:
             found = next((s for s in series_list if s.type == type_name), None)
             return found.values if found else []
 
-        highs = get_values(price_el.component_series, "High")
-        lows = get_values(price_el.component_series, "Low")
-        opens = get_values(price_el.component_series, "Open")
-        closes = get_values(price_el.component_series, "Close")
-        vols = get_values(vol_el.component_series, "Volume") if vol_el else []
-
-        for i, dt in enumerate(data.dates):
-            c_open = opens[i] if i < len(opens) else None
-            c_high = highs[i] if i < len(highs) else None
-            c_low = lows[i] if i < len(lows) else None
-            c_close = closes[i] if i < len(closes) else None
-            c_vol = vols[i] if i < len(vols) else None
-
-            # Pydantic-market-data expects datetime (naive or aware)
-            # data.dates are strictly typed datetime from CheckRequest
-            ranges.append(
-                OHLCV(
-                    date=dt,
-                    open=c_open,
-                    high=c_high,
-                    low=c_low,
-                    close=c_close,
-                    volume=c_vol,
-                )
-            )
+        frame = HistoryFrame.from_series(
+            symbol,
+            data.dates,
+            {
+                "open": get_values(price_el.component_series, "Open"),
+                "high": get_values(price_el.component_series, "High"),
+                "low": get_values(price_el.component_series, "Low"),
+                "close": get_values(price_el.component_series, "Close"),
+                "volume": get_values(vol_el.component_series, "Volume") if vol_el else [],
+            },
+        )
 
-        return History(symbol=Symbol(ticker=ticker, name=ticker.root), candles=ranges)
+        if xid is not None:
+            # Multi-symbol responses share one date axis; drop dates this symbol did not trade
+            prices = np.vstack([frame.open, frame.high, frame.low, frame.close])
+            frame = frame.select(~np.isnan(prices).all(axis=0))
+        return frame
 
     # --- Helpers ---
 
+    def _is_xid_rejection(self, status_code: int) -> bool:
+        # 429 is throttling, not a verdict on the XID
+        return 400 <= status_code < 500 and status_code != 429
+
+    def _known_failure(self, kind: str, name: str) -> dict[str, Any] | None:
+        if self.negative_ttl <= 0:
+            return None
+        return self.negative_cache.get(f"{kind}:{name}")
+
+    def _remember_failure(
+        self, kind: str, name: str, error: str, status_code: int | None = None
+    ) -> None:
+        if self.negative_ttl > 0:
+            entry = {"error": error, "status": status_code}
+            self.negative_cache.set(f"{kind}:{name}", entry, ttl=self.negative_ttl)
+
+    def _remember_rejection(self, kind: str, name: str, status_code: int, url: str) -> None:
+        """
+        Remember a 4xx response (other than 429) as a failure for `name`.
+        """
+        if self._is_xid_rejection(status_code):
+            self._remember_failure(
+                kind, name, f"{status_code} Client Error for url: {url}", status_code
+            )
+
+    def _raise_known_failure(self, kind: str, name: str) -> None:
+        """
+        Re-raise a remembered failure: ScraperError for a missing XID, HTTPError for a 4xx.
+        """
+        entry = self._known_failure(kind, name)
+        if entry is None:
+            return
+        if entry["status"] is None:
+            raise ScraperError(entry["error"])
+        raise requests.exceptions.HTTPError(f"{entry['error']} (cached)")
+
     def _extract_isin_from_tearsheet(self, tree: HtmlElement) -> str | None:
         isin_els = tree.xpath("//th[text()='ISIN']/following-sibling::td")
         if isin_els and isin_els[0].text:
@@ -332,6 +529,9 @@ class Scraper:
     def _map_country_to_code(self, country_name: str | None) -> str | None:
         if not country_name:
             return None
+        # The JSON search API gives ISO codes rather than names
+        if len(country_name) == 2 and country_name.isalpha():
+            return country_name.upper()
         mapping = {
             "United Kingdom": "GB",
             "United States": "US",
@@ -443,5 +643,228 @@ class Scraper:
         return len(query) == 12 and query[:2].isalpha() and query[2:].isalnum()
 
 
+class Scraper(BaseScraper):
+    """
+    Strictly typed scraper for FT Markets data.
+    Encapsulates all logic for interacting with markets.ft.com.
+    """
+
+    def __init__(
+        self,
+        http_client: FTClient | None = None,
+        xid_cache: BaseCache | None = None,
+        chart_batch_size: int = 20,
+        history_store: HistoryStore | None = None,
+        search_backend: SearchBackend = "html",
+        negative_cache: BaseCache | None = None,
+        negative_ttl: float = 900,
+    ):
+        super().__init__(
+            xid_cache=xid_cache,
+            chart_batch_size=chart_batch_size,
+            history_store=history_store,
+            search_backend=search_backend,
+            negative_cache=negative_cache,
+            negative_ttl=negative_ttl,
+        )
+        self.client = http_client or client
+        # Streamed tearsheet requests bypass the client's coalescing, so concurrent lookups
+        # of one ticker share a download here instead
+        self.xid_flight = SingleFlight()
+
+    def search(self, query: str | Ticker) -> list[Symbol]:
+        """
+        Search for a security by ISIN, symbol, or name.
+        With search_backend="json", tries the JSON search API first and falls back to the
+        HTML search page when it fails or finds nothing; otherwise scrapes the HTML page.
+        Parsing logic is strict but resilient to HTML changes where possible.
+        """
+        query_str = str(query)
+        if self._known_failure("search", query_str) is not None:
+            return []
+        if self.search_backend == "json":
+            try:
+                response = self.client.get(self.SEARCH_API_PATH, params={"query": query_str})
+                self._raise_for_status(response, self.SEARCH_API_PATH)
+                results = self._parse_search_api(response.content, query_str)
+                if results:
+                    return results
+            except (ValueError, requests.exceptions.RequestException) as e:
+                logger.debug("JSON search failed for %s, using HTML search: %s", query_str, e)
+
+        response = self.client.get(self.SEARCH_PATH, params={"query": query_str})
+        self._raise_for_status(response, self.SEARCH_PATH)
+        results = self._parse_search_page(response.content, response.url, query_str)
+        if not results:
+            self._remember_failure("search", query_str, f"No results for {query_str}")
+        return results
+
+    def get_history(self, ticker: Ticker | str, days: int = 30) -> History:
+        """
+        Fetch historical data using the strict Chart API schemas.
+        With a history store, only the days missing from the store are requested.
+        """
+        ticker_val = Ticker(root=ticker) if isinstance(ticker, str) else ticker
+        if self.history_store is None:
+            return self._fetch_history(ticker_val, days)
+
+        fetch_days = self._store_fetch_days(ticker_val, days)
+        if fetch_days:
+            self._store_merge(ticker_val, self._fetch_history(ticker_val, fetch_days), fetch_days)
+        return self._store_load(ticker_val, days)
+
+    def get_history_range(self, ticker: Ticker | str, start: date, end: date) -> History:
+        """
+        Fetch history between start and end (inclusive).
+        Requests the smallest look-back that reaches start and trims the rest client-side.
+        """
+        history = self.get_history(ticker, days=self._range_days(start))
+        return self._trim_history(history, start, end)
+
+    def get_history_frame(self, ticker: Ticker | str, days: int = 30) -> HistoryFrame:
+        """
+        Fetch history as a columnar HistoryFrame (NumPy arrays, no per-candle models).
+        """
+        return as_frame(self.get_history(ticker, days=days))
+
+    def _fetch_history(self, ticker_val: Ticker, days: int) -> History:
+        self._raise_known_failure("chart", ticker_val.root)
+        xid, from_cache = self._get_xid(ticker_val)
+
+        resp = self._post_chart([xid], days)
+        if from_cache and self._is_xid_rejection(resp.status_code):
+            # Stale cache entry: forget it and rediscover the XID from the tearsheet
+            logger.debug("Chart API rejected cached XID %s for %s", xid, ticker_val.root)
+            self.xid_cache.delete(ticker_val.root)
+            xid, _ = self._get_xid(ticker_val)
+            resp = self._post_chart([xid], days)
+        self._remember_rejection("chart", ticker_val.root, resp.status_code, self.CHART_PATH)
+        self._raise_for_status(resp, self.CHART_PATH)
+
+        chart_data = self._decode_chart(resp.content)
+
+        return self._convert_to_history(ticker_val, chart_data)
+
+    def get_histories(
+        self, tickers: list[Ticker | str], days: int = 30, batch_size: int | None = None
+    ) -> dict[str, History]:
+        """
+        Fetch history for many tickers, packing several XIDs into each Chart API request.
+        Failed batches are split in half and retried; tickers that still fail on their own
+        are logged and omitted from the result.
+        """
+        ticker_vals = self._unique_tickers(tickers)
+        if self.history_store is None:
+            return self._fetch_histories(ticker_vals, days, batch_size)
+
+        plans = {t.root: self._store_fetch_days(t, days) for t in ticker_vals}
+        stale = [t for t in ticker_vals if plans[t.root]]
+        fetched: dict[str, History] = {}
+        if stale:
+            # One request window for every stale ticker keeps them batchable
+            fetch_days = max(cast(int, plans[t.root]) for t in stale)
+            fetched = self._fetch_histories(stale, fetch_days, batch_size)
+            for t in stale:
+                if t.root in fetched:
+                    self._store_merge(t, fetched[t.root], fetch_days)
+        return {
+            t.root: self._store_load(t, days)
+            for t in ticker_vals
+            if t.root in fetched or plans[t.root] is None
+        }
+
+    def _fetch_histories(
+        self, ticker_vals: list[Ticker], days: int, batch_size: int | None
+    ) -> dict[str, History]:
+        batch_size = batch_size or self.chart_batch_size
+
+        resolved: list[tuple[Ticker, Xid]] = []
+        for t in ticker_vals:
+            try:
+                self._raise_known_failure("chart", t.root)
+                resolved.append((t, self.get_xid(t)))
+            except (ScraperError, requests.exceptions.RequestException) as e:
+                logger.warning("Skipping %s: %s", t.root, e)
+
+        results: dict[str, History] = {}
+        for i in range(0, len(resolved), batch_size):
+            self._fetch_batch(resolved[i : i + batch_size], days, results)
+        return results
+
+    def _fetch_batch(
+        self, batch: list[tuple[Ticker, Xid]], days: int, results: dict[str, History]
+    ) -> None:
+        if len(batch) == 1:
+            # Single ticker: go through _fetch_history so stale cached XIDs get refreshed
+            ticker = batch[0][0]
+            try:
+                results[ticker.root] = self._fetch_history(ticker, days)
+            except (ScraperError, ValueError, requests.exceptions.RequestException) as e:
+                logger.warning("Failed to fetch history for %s: %s", ticker.root, e)
+            return
+
+        try:
+            resp = self._post_chart([xid for _, xid in batch], days)
+            self._raise_for_status(resp, self.CHART_PATH)
+            chart_data = self._decode_chart(resp.content)
+        except (ValueError, requests.exceptions.RequestException) as e:
+            logger.debug("Chart batch of %d failed (%s); splitting", len(batch), e)
+            mid = len(batch) // 2
+            self._fetch_batch(batch[:mid], days, results)
+            self._fetch_batch(batch[mid:], days, results)
+            return
+
+        for ticker, xid in batch:
+            results[ticker.root] = self._convert_to_history(ticker, chart_data, xid=xid)
+
+    def _post_chart(self, xids: list[Xid], days: int) -> requests.Response:
+        return self.client.post(self.CHART_PATH, json=self._chart_payload(xids, days))
+
+    def get_xid(self, ticker: Ticker) -> Xid:
+        """
+        Extract internal XID for a ticker.
+        Consults the XID cache before downloading the tearsheet page.
+        """
+        xid, _ = self._get_xid(ticker)
+        return xid
+
+    def _get_xid(self, ticker: Ticker) -> tuple[Xid, bool]:
+        """
+        Return the XID for a ticker and whether it was served from the cache.
+        """
+        cached = self._cached_xid(ticker)
+        if cached is not None:
+            return cached, True
+        self._raise_known_failure("xid", ticker.root)
+        return self.xid_flight.do(ticker.root, lambda: self._fetch_xid(ticker)), False
+
+    def _fetch_xid(self, ticker: Ticker) -> Xid:
+        url_summary = self._tearsheet_path(ticker)
+        # Streamed, so the rest of the page is never downloaded once the XID has been seen
+        resp = self.client.get(url_summary, stream=True)
+        try:
+            self._remember_rejection("xid", ticker.root, resp.status_code, url_summary)
+            self._raise_for_status(resp, url_summary)
+            xid_str, content = self._scan_xid(resp.iter_content(self.XID_CHUNK_SIZE))
+        finally:
+            resp.close()
+
+        if xid_str:
+            xid = Xid(root=xid_str)
+        else:
+            text = content.decode(resp.encoding or "utf-8", errors="replace")
+            xid = self._parse_xid_or_remember(ticker, content, text)
+        self.xid_cache.set(ticker.root, xid.root)
+        return xid
+
+    def _raise_for_status(self, resp: requests.Response, url: str) -> None:
+        try:
+            resp.raise_for_status()
+        except requests.exceptions.HTTPError as e:
+            if resp.status_code == 400:
+                logger.debug("HTTP 400 Error for %s: %s", url, resp.text)
+            raise e
+
+
 # Singleton instance not strictly needed but useful for API
 scraper = Scraper()
@@ -0,0 +1,269 @@
+import math
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+from pydantic import PrivateAttr, SerializerFunctionWrapHandler, model_serializer
+from pydantic_market_data.models import OHLCV, History, Symbol
+
+_COLUMNS = ("open", "high", "low", "close", "volume")
+
+
+def _nan_to_none(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def as_frame(history: History) -> "HistoryFrame":
+    """
+    Columnar view of any History, reusing the backing frame of an FTHistory.
+    """
+    if isinstance(history, FTHistory):
+        return history.frame
+    return HistoryFrame.from_candles(history.symbol, history.candles)
+
+
+def trim_history(history: History, start: date, end: date) -> History:
+    """
+    Candles between start and end (inclusive). An FTHistory is trimmed without materializing.
+    """
+    if isinstance(history, FTHistory):
+        return history.trim(start, end)
+    candles = [c for c in history.candles if start <= c.date.date() <= end]
+    return History(symbol=history.symbol, candles=candles)
+
+
+@dataclass
+class HistoryFrame:
+    """
+    Columnar OHLCV history: one datetime64 array for dates and one float array per field.
+    Missing values are NaN. Built straight from Chart API series, without per-candle models.
+    """
+
+    symbol: Symbol
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    # (days ascending, their positions in the frame), built on the first nearest() call
+    _day_index: tuple[np.ndarray, np.ndarray] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_series(
+        cls, symbol: Symbol, dates: Any, series: dict[str, list[float | None]]
+    ) -> "HistoryFrame":
+        """
+        Build a frame from a date axis and per-field value lists.
+        Lists shorter than the date axis are padded with NaN.
+        """
+        dates_arr = np.asarray(dates, dtype="datetime64[s]")
+        n = len(dates_arr)
+        columns = {}
+        for name in _COLUMNS:
+            values = series.get(name) or []
+            col = np.full(n, np.nan)
+            if values:
+                m = min(n, len(values))
+                col[:m] = np.asarray(values[:m], dtype=float)
+            columns[name] = col
+        return cls(symbol=symbol, dates=dates_arr, **columns)
+
+    @classmethod
+    def from_candles(cls, symbol: Symbol, candles: list[OHLCV]) -> "HistoryFrame":
+        series = {name: [getattr(c, name) for c in candles] for name in _COLUMNS}
+        return cls.from_series(symbol, [c.date for c in candles], series)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def select(self, mask: np.ndarray) -> "HistoryFrame":
+        return HistoryFrame(
+            symbol=self.symbol,
+            dates=self.dates[mask],
+            **{name: getattr(self, name)[mask] for name in _COLUMNS},
+        )
+
+    def trim(self, start: date, end: date) -> "HistoryFrame":
+        days = self.dates.astype("datetime64[D]")
+        return self.select((days >= np.datetime64(start)) & (days <= np.datetime64(end)))
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Same layout as History.to_pandas(): indexed by Date with Title Case columns.
+        """
+        if not len(self):
+            return pd.DataFrame()
+        df = pd.DataFrame(
+            {name.capitalize(): getattr(self, name) for name in _COLUMNS},
+            index=pd.DatetimeIndex(self.dates, name="Date"),
+        )
+        return df
+
+    def rows(self) -> list[tuple[Any, ...]]:
+        """
+        (date, open, high, low, close, volume) tuples, with None for missing values.
+        """
+        return [
+            (dt, *(_nan_to_none(v) for v in values))
+            for dt, *values in zip(
+                self.dates.astype(datetime).tolist(),
+                self.open.tolist(),
+                self.high.tolist(),
+                self.low.tolist(),
+                self.close.tolist(),
+                self.volume.tolist(),
+                strict=True,
+            )
+        ]
+
+    def day_index(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Candle days in ascending order and the frame position of each. Built once per frame.
+        """
+        if self._day_index is None:
+            days = self.dates.astype("datetime64[D]")
+            order = np.argsort(days, kind="stable")
+            self._day_index = (days[order], order)
+        return self._day_index
+
+    def nearest(self, targets: Any, window: int) -> np.ndarray:
+        """
+        Frame position of the candle nearest each target day, or -1 when none is within
+        `window` days. An exact match wins; ties go to the earlier day. Where several candles
+        share a day, the first one in the frame is used. O(log n) per target.
+        """
+        targets = np.atleast_1d(np.asarray(targets, dtype="datetime64[D]"))
+        days, order = self.day_index()
+        positions = np.full(len(targets), -1, dtype=np.int64)
+        if not len(days):
+            return positions
+
+        # Candidates: the first candle on or after the target, and the day before it
+        after = np.searchsorted(days, targets, side="left")
+        after_idx = np.minimum(after, len(days) - 1)
+        before_idx = np.maximum(after - 1, 0)
+        before_idx = np.searchsorted(days, days[before_idx], side="left")
+        out_of_window = window + 1
+        dist_after = np.where(
+            after < len(days), (days[after_idx] - targets).astype(np.int64), out_of_window
+        )
+        dist_before = np.where(
+            after > 0, (targets - days[before_idx]).astype(np.int64), out_of_window
+        )
+
+        # dist_before is never 0, so an exact match always wins
+        idx = np.where(dist_after < dist_before, after_idx, before_idx)
+        found = np.minimum(dist_after, dist_before) <= window
+        positions[found] = order[idx[found]]
+        return positions
+
+    def candle(self, i: int) -> OHLCV:
+        o, h, lo, c, v = (_nan_to_none(float(getattr(self, name)[i])) for name in _COLUMNS)
+        return OHLCV.model_construct(
+            date=self.dates[i].astype(datetime), open=o, high=h, low=lo, close=c, volume=v
+        )
+
+    def to_candles(self) -> list[OHLCV]:
+        # Values come from typed arrays, so validation can be skipped
+        return [
+            OHLCV.model_construct(date=dt, open=o, high=h, low=lo, close=c, volume=v)
+            for dt, o, h, lo, c, v in self.rows()
+        ]
+
+    def to_history(self) -> "FTHistory":
+        return FTHistory.from_frame(self)
+
+
+class FTHistory(History):
+    """
+    History backed by a HistoryFrame.
+    Candles are only built when first accessed; to_pandas() reads the frame directly.
+    """
+
+    _frame: HistoryFrame | None = PrivateAttr(default=None)
+
+    @classmethod
+    def from_frame(cls, frame: HistoryFrame) -> "FTHistory":
+        obj = cls.model_construct(symbol=frame.symbol)
+        obj._frame = frame
+        return obj
+
+    @property
+    def frame(self) -> HistoryFrame:
+        if self._frame is None:
+            self._frame = HistoryFrame.from_candles(self.symbol, self.candles)
+        return self._frame
+
+    if not TYPE_CHECKING:
+        # Like BaseModel.__getattr__, only defined at runtime so attribute typos still type-check
+
+        def __getattr__(self, name: str) -> Any:
+            if name == "candles" and self._frame is not None:
+                candles = self._frame.to_candles()
+                self.__dict__["candles"] = candles
+                self.__pydantic_fields_set__.add("candles")
+                return candles
+            return super().__getattr__(name)
+
+    def materialized(self) -> "FTHistory":
+        """
+        This history with its candles built, sharing the frame. Pydantic serializes a History
+        nested in another model (or dumped through a TypeAdapter) from the instance's fields,
+        so histories handed to callers must not be lazy. Returns a copy when the candles are
+        not built yet, leaving this (possibly cached) instance lazy.
+        """
+        if "candles" in self.__dict__ or self._frame is None:
+            return self
+        copy = FTHistory.from_frame(self._frame)
+        copy._materialize()
+        return copy
+
+    def trim(self, start: date, end: date) -> History:
+        """
+        Candles between start and end (inclusive), without materializing the rest.
+        """
+        if "candles" not in self.__dict__:
+            return self.frame.trim(start, end).to_history()
+        candles = [c for c in self.candles if start <= c.date.date() <= end]
+        return History(symbol=self.symbol, candles=candles)
+
+    def _materialize(self) -> None:
+        self.candles  # noqa: B018
+
+    def to_pandas(self) -> pd.DataFrame:
+        # Once materialized, candles may have been modified: treat them as the source of truth
+        if self._frame is not None and "candles" not in self.__dict__:
+            return self._frame.to_pandas()
+        return super().to_pandas()
+
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        self._materialize()
+        return handler(self)
+
+    def model_copy(self, **kwargs: Any) -> "FTHistory":
+        self._materialize()
+        return super().model_copy(**kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        if isinstance(other, FTHistory):
+            other._materialize()
+        return super().__eq__(other)
+
+    def __iter__(self) -> Any:
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self) -> Any:
+        self._materialize()
+        return super().__repr_args__()
+
+    def __getstate__(self) -> dict[Any, Any]:
+        self._materialize()
+        return super().__getstate__()
@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from pydantic_market_data.models import History
+
+from .cache import CacheStats
+from .frame import FTHistory, trim_history
+
+
+def last_days(history: History, days: int) -> History:
+    """
+    The part of a history a Chart API request for `days` days would have returned.
+    """
+    today = date.today()
+    return trim_history(history, today - timedelta(days=days - 1), today)
+
+
+def candle_count(history: History) -> int:
+    """
+    Number of candles in a history, without materializing an FTHistory.
+    """
+    if isinstance(history, FTHistory) and "candles" not in history.__dict__:
+        return len(history.frame)
+    return len(history.candles)
+
+
+@dataclass
+class _Entry:
+    day: date
+    fetched_at: float
+    days: int
+    history: History
+    candles: int
+
+
+class HistoryCache:
+    """
+    Histories fetched during one session (e.g. a CLI run), keyed by ticker.
+
+    Each entry remembers the look-back in days it was fetched with. A later request for the
+    same ticker and an equal or shorter look-back is served by trimming the entry instead of
+    fetching again. `min_days` widens every fetch, so when the longest window a session
+    needs is known up front, its first request covers every later one. Entries only count
+    on the day they were fetched, and for at most `ttl` seconds when set.
+
+    Least recently used entries are evicted beyond `maxsize` entries or, when set,
+    `max_candles` candles in total; a single history above `max_candles` is not cached.
+    """
+
+    def __init__(
+        self,
+        min_days: int = 0,
+        maxsize: int = 256,
+        ttl: float | None = None,
+        max_candles: int | None = None,
+    ):
+        self.min_days = min_days
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_candles = max_candles
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._candles = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def fetch_days(self, days: int) -> int:
+        return max(days, self.min_days)
+
+    def get(self, ticker: str, days: int) -> History | None:
+        """
+        The last `days` days of history for ticker, trimmed from a wider fetch if needed.
+        """
+        with self._lock:
+            entry = self._entries.get(ticker)
+            if entry is not None and not self._fresh(entry):
+                self._remove(ticker)
+                entry = None
+            if entry is None or entry.days < days:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(ticker)
+            self.stats.hits += 1
+        return entry.history if entry.days == days else last_days(entry.history, days)
+
+    def put(self, ticker: str, days: int, history: History) -> None:
+        candles = candle_count(history)
+        # A history larger than the whole cache would only evict everything else
+        if self.max_candles is not None and candles > self.max_candles:
+            return
+        with self._lock:
+            current = self._entries.get(ticker)
+            # Keep the wider of two fresh fetches
+            if current is not None and self._fresh(current) and current.days > days:
+                return
+            if current is not None:
+                self._remove(ticker)
+            entry = _Entry(date.today(), time.monotonic(), days, history, candles)
+            self._entries[ticker] = entry
+            self._candles += entry.candles
+            while len(self._entries) > self.maxsize or (
+                self.max_candles is not None and self._candles > self.max_candles
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._candles = 0
+
+    def _fresh(self, entry: _Entry) -> bool:
+        if entry.day != date.today():
+            return False
+        return self.ttl is None or time.monotonic() - entry.fetched_at < self.ttl
+
+    def _remove(self, ticker: str) -> None:
+        self._candles -= self._entries.pop(ticker).candles
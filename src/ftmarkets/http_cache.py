@@ -0,0 +1,161 @@
+import base64
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .cache import BaseCache, CacheStats, MemoryCache
+
+# Freshness per endpoint, matched by longest path prefix. Search results and tearsheets
+# rarely change within a day; chart series gain a new candle during the trading day.
+DEFAULT_TTLS: dict[str, float] = {
+    "/data/search": 3600,
+    "/data/searchapi/": 3600,
+    "/data/chartapi/series": 300,
+    "/data/equities/tearsheet/": 86400,
+    "/data/etfs/tearsheet/": 86400,
+    "/data/funds/tearsheet/": 86400,
+    "/data/indices/tearsheet/": 86400,
+}
+
+_CACHEABLE_METHODS = ("GET", "POST")
+_REPLAYED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Location")
+
+
+def request_key(
+    method: str, url: str, params: dict[str, Any] | None = None, json_body: Any | None = None
+) -> str:
+    """
+    Stable identity of a request: method, URL, query parameters and JSON body.
+    """
+    raw = json.dumps(
+        [method.upper(), url, sorted((params or {}).items()), json_body],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@dataclass
+class ResponseCacheStats(CacheStats):
+    """
+    CacheStats for HTTP responses. A response revalidated with a 304 counts as a hit.
+    """
+
+    revalidations: int = 0
+    bytes_saved: int = 0
+
+
+class ResponseCache:
+    """
+    HTTP response cache for FTClient.
+
+    Entries are keyed on method, URL, query parameters and JSON body. A response is served
+    from the cache while fresh (per-endpoint TTL). Once stale, it is revalidated with
+    If-None-Match / If-Modified-Since when the server sent an ETag or Last-Modified; a 304
+    reply renews the entry without downloading the body again.
+    Eviction is left to the backend, so pass a size-bounded MemoryCache or SqliteCache.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCache | None = None,
+        ttl: float = 300,
+        ttls: dict[str, float] | None = None,
+    ):
+        # The backend keeps stale entries around for revalidation, so it must not expire them
+        self.backend = backend if backend is not None else MemoryCache(maxsize=512)
+        self.ttl = ttl
+        self.ttls = DEFAULT_TTLS if ttls is None else ttls
+        self.stats = ResponseCacheStats()
+
+    def ttl_for(self, url: str) -> float:
+        path = urlparse(url).path
+        matches = [prefix for prefix in self.ttls if path.startswith(prefix)]
+        return self.ttls[max(matches, key=len)] if matches else self.ttl
+
+    def key(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json_body: Any | None = None,
+    ) -> str:
+        return request_key(method, url, params, json_body)
+
+    def send(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json_body: Any | None = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Perform a request through the cache.
+        """
+        ttl = self.ttl_for(url)
+        if method.upper() not in _CACHEABLE_METHODS or ttl <= 0:
+            return session.request(method, url, params=params, json=json_body, **kwargs)
+
+        key = self.key(method, url, params, json_body)
+        entry = self.backend.get(key)
+        if entry is not None and entry["fresh_until"] > time.time():
+            return self._hit(entry)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        resp = session.request(
+            method, url, params=params, json=json_body, headers=headers or None, **kwargs
+        )
+        if entry is not None and resp.status_code == 304:
+            entry["fresh_until"] = time.time() + ttl
+            self.backend.set(key, entry)
+            self.stats.revalidations += 1
+            return self._hit(entry)
+
+        self.stats.misses += 1
+        if resp.status_code == 200 and "no-store" not in resp.headers.get("Cache-Control", ""):
+            self.backend.set(key, self._to_entry(resp, ttl))
+        return resp
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def _hit(self, entry: dict[str, Any]) -> requests.Response:
+        resp = self._from_entry(entry)
+        self.stats.hits += 1
+        self.stats.bytes_saved += len(resp.content)
+        return resp
+
+    def _to_entry(self, resp: requests.Response, ttl: float) -> dict[str, Any]:
+        return {
+            "status": resp.status_code,
+            "url": resp.url,
+            "headers": {k: resp.headers[k] for k in _REPLAYED_HEADERS if k in resp.headers},
+            "content": base64.b64encode(resp.content).decode("ascii"),
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fresh_until": time.time() + ttl,
+        }
+
+    def _from_entry(self, entry: dict[str, Any]) -> requests.Response:
+        resp = requests.Response()
+        resp.status_code = entry["status"]
+        resp.url = entry["url"]
+        resp.headers = CaseInsensitiveDict(entry["headers"])
+        resp._content = base64.b64decode(entry["content"])
+        resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+        return resp
@@ -0,0 +1,169 @@
+import csv
+import itertools
+import json
+import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Any, TextIO
+
+from .utils import parse_date
+
+
+@dataclass(frozen=True)
+class Trade:
+    """
+    A trade to validate: the ticker traded at `price` on `date`.
+    """
+
+    ticker: str
+    date: date
+    price: float
+    id: str | None = None
+
+
+@dataclass
+class TradeResult:
+    """
+    Outcome of validating one Trade against the nearest candle.
+    `valid` is None when the check could not run (see `error`).
+    """
+
+    trade: Trade
+    valid: bool | None
+    matched_date: date | None = None
+    low: float | None = None
+    high: float | None = None
+    close: float | None = None
+    error: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.trade.id,
+            "ticker": self.trade.ticker,
+            "date": self.trade.date.isoformat(),
+            "price": self.trade.price,
+            "valid": self.valid,
+            "matched_date": self.matched_date.isoformat() if self.matched_date else None,
+            "low": self.low,
+            "high": self.high,
+            "close": self.close,
+            "error": self.error,
+        }
+
+
+def _parse_trade(row: dict[str, Any], line: int) -> Trade:
+    ticker = row.get("ticker") or row.get("symbol")
+    raw_date = row.get("date")
+    raw_price = row.get("price")
+    if not ticker or not raw_date or raw_price in (None, ""):
+        raise ValueError(f"Line {line}: a trade needs ticker, date and price")
+    parsed = parse_date(str(raw_date))
+    if parsed is None:
+        raise ValueError(f"Line {line}: invalid date {raw_date!r}")
+    try:
+        price = float(raw_price)
+    except (TypeError, ValueError):
+        raise ValueError(f"Line {line}: invalid price {raw_price!r}") from None
+    if not price > 0:
+        raise ValueError(f"Line {line}: price must be positive, got {raw_price!r}")
+    trade_id = row.get("id")
+    return Trade(
+        ticker=str(ticker),
+        date=parsed.date(),
+        price=price,
+        id=str(trade_id) if trade_id not in (None, "") else None,
+    )
+
+
+def parse_rows(
+    stream: Iterable[str], fmt: str = "jsonl"
+) -> Iterator[tuple[int, dict[str, Any] | ValueError]]:
+    """
+    Read (line number, record) pairs from CSV (with a header row) or JSON Lines.
+    A JSON Lines record that cannot be decoded is yielded as a ValueError, so callers can
+    report it and go on with the next line.
+    """
+    if fmt == "csv":
+        yield from enumerate(csv.DictReader(stream), start=2)
+        return
+    if fmt != "jsonl":
+        raise ValueError(f"Unsupported input format: {fmt!r}")
+    for line, text in enumerate(stream, start=1):
+        if not text.strip():
+            continue
+        try:
+            record = json.loads(text)
+        except ValueError as e:
+            yield line, ValueError(f"Line {line}: invalid JSON ({e})")
+            continue
+        if not isinstance(record, dict):
+            yield line, ValueError(f"Line {line}: expected a JSON object")
+            continue
+        yield line, record
+
+
+def read_rows(
+    path: str | Path, fmt: str | None = None
+) -> Iterator[tuple[int, dict[str, Any] | ValueError]]:
+    """
+    Read records from a file, or from stdin when path is "-".
+    The format defaults to CSV for `.csv` files and JSON Lines otherwise; on stdin it is
+    detected from the first line.
+    """
+    if str(path) == "-":
+        if fmt is None:
+            # No extension to go by: JSON Lines records start with "{", anything else is CSV
+            first = sys.stdin.readline()
+            fmt = "jsonl" if first.lstrip().startswith("{") or not first.strip() else "csv"
+            yield from parse_rows(itertools.chain([first], sys.stdin), fmt)
+            return
+        yield from parse_rows(sys.stdin, fmt)
+        return
+    fmt = fmt or ("csv" if str(path).lower().endswith(".csv") else "jsonl")
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from parse_rows(f, fmt)
+
+
+def _trade_or_error(line: int, row: dict[str, Any] | ValueError) -> Trade | ValueError:
+    if isinstance(row, ValueError):
+        return row
+    try:
+        return _parse_trade(row, line)
+    except ValueError as e:
+        return e
+
+
+def parse_trades(stream: TextIO, fmt: str = "jsonl") -> Iterator[Trade]:
+    """
+    Read trades from CSV (with a header row) or JSON Lines.
+    Each record needs `ticker` (or `symbol`), `date` and a positive `price`; `id` is optional.
+    """
+    for line, row in parse_rows(stream, fmt):
+        trade = _trade_or_error(line, row)
+        if isinstance(trade, ValueError):
+            raise trade
+        yield trade
+
+
+def read_trades(path: str | Path, fmt: str | None = None) -> Iterator[Trade]:
+    """
+    Read trades from a file, or from stdin when path is "-".
+    The format defaults to CSV for `.csv` files and JSON Lines otherwise.
+    """
+    for _, trade in iter_trades(path, fmt):
+        if isinstance(trade, ValueError):
+            raise trade
+        yield trade
+
+
+def iter_trades(
+    path: str | Path, fmt: str | None = None
+) -> Iterator[tuple[int, Trade | ValueError]]:
+    """
+    Like read_trades, but a malformed record is yielded as (line, ValueError) instead of
+    ending the read.
+    """
+    for line, row in read_rows(path, fmt):
+        yield line, _trade_or_error(line, row)
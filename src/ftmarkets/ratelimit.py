@@ -0,0 +1,160 @@
+import threading
+import time
+from dataclasses import dataclass
+from urllib.parse import urlparse
+
+
+@dataclass(frozen=True)
+class EndpointLimit:
+    """
+    Throttling policy for one endpoint: a token bucket of `rate` requests/second holding up to
+    `burst` tokens, and an adaptive cap on concurrent requests between the two bounds.
+    """
+
+    rate: float
+    burst: int = 1
+    max_concurrency: int = 8
+    min_concurrency: int = 1
+
+
+DEFAULT_LIMITS: dict[str, EndpointLimit] = {
+    "search": EndpointLimit(rate=5, burst=5, max_concurrency=4),
+    "tearsheet": EndpointLimit(rate=5, burst=10, max_concurrency=8),
+    "chartapi": EndpointLimit(rate=10, burst=10, max_concurrency=8),
+}
+DEFAULT_LIMIT = EndpointLimit(rate=5, burst=5, max_concurrency=4)
+
+
+def endpoint_of(url: str) -> str:
+    """
+    Endpoint group of a markets.ft.com URL: search, tearsheet, chartapi or default.
+    """
+    path = urlparse(url).path
+    if "/tearsheet/" in path:
+        return "tearsheet"
+    if path.startswith("/data/chartapi"):
+        return "chartapi"
+    if path.startswith("/data/search"):
+        return "search"
+    return "default"
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens are reserved in arrival order, so waiters are spaced
+    1/rate apart instead of all waking at once.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how long to wait (seconds) before using it.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(-self._tokens / self.rate, 0.0)
+
+    def try_acquire(self) -> bool:
+        """
+        Take a token only if one is available now.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def acquire(self) -> None:
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency cap adjusted AIMD-style: each success adds increase/limit (about +1 per
+    round of requests), a throttled response multiplies the limit by `decrease`.
+    Decreases are spaced by `cooldown` seconds so one burst of 429s counts once.
+    """
+
+    def __init__(
+        self,
+        maximum: int,
+        minimum: int = 1,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+    ):
+        self.maximum = maximum
+        self.minimum = minimum
+        self.increase = increase
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.limit = float(maximum)
+        self.in_flight = 0
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self.in_flight >= max(int(self.limit), self.minimum):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            now = time.monotonic()
+            if throttled:
+                if now - self._last_decrease >= self.cooldown:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._last_decrease = now
+            else:
+                self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+            self._cond.notify_all()
+
+
+class RateLimiter:
+    """
+    Per-endpoint token buckets and adaptive concurrency caps for FTClient.
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, EndpointLimit] | None = None,
+        default: EndpointLimit = DEFAULT_LIMIT,
+    ):
+        limits = {**DEFAULT_LIMITS, **(limits or {}), "default": default}
+        self.buckets = {name: TokenBucket(lim.rate, lim.burst) for name, lim in limits.items()}
+        self.concurrency = {
+            name: AdaptiveConcurrency(lim.max_concurrency, lim.min_concurrency)
+            for name, lim in limits.items()
+        }
+
+    def acquire(self, url: str) -> str:
+        """
+        Block until a request to url may start. Returns the endpoint to pass to release().
+        """
+        endpoint = endpoint_of(url)
+        self.concurrency[endpoint].acquire()
+        try:
+            self.buckets[endpoint].acquire()
+        except BaseException:
+            self.concurrency[endpoint].release()
+            raise
+        return endpoint
+
+    def release(self, endpoint: str, throttled: bool = False) -> None:
+        self.concurrency[endpoint].release(throttled)
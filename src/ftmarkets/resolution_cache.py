@@ -0,0 +1,100 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import date
+from typing import Any
+
+from pydantic_market_data.models import Price, SecurityCriteria, Symbol
+
+from .cache import BaseCache, CacheStats, MemoryCache
+
+# Resolved symbols rarely change; misses are retried sooner in case a listing appears
+DEFAULT_TTL = 30 * 86400
+DEFAULT_NEGATIVE_TTL = 86400
+
+
+def criteria_key(criteria: SecurityCriteria) -> str:
+    """
+    Stable identity of a resolve() call. Case and whitespace differences that do not change
+    the search are normalized away. Without a target date, price checks run against today,
+    so today's date is part of the key.
+    """
+
+    def norm(value: Any) -> str | None:
+        return " ".join(str(value).split()).upper() if value is not None else None
+
+    target_date = criteria.target_date
+    price = criteria.target_price
+    if isinstance(price, Price):
+        price = price.root
+    if criteria.target_price is not None and target_date is None:
+        target_date = date.today()
+    raw = json.dumps(
+        [
+            norm(criteria.isin),
+            norm(criteria.symbol),
+            norm(criteria.description),
+            float(price) if price is not None else None,
+            target_date.isoformat() if target_date is not None else None,
+            norm(criteria.currency),
+            norm(criteria.exchange),
+        ],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@dataclass
+class ResolutionCacheStats(CacheStats):
+    """
+    CacheStats for resolutions. Hits include negative hits (cached "no match" results).
+    """
+
+    negative_hits: int = 0
+
+
+class ResolutionCache:
+    """
+    Cache of FTDataSource.resolve() results keyed by normalized SecurityCriteria.
+
+    Matches are kept for `ttl` seconds and "no match" results for `negative_ttl`, so unknown
+    identifiers are retried sooner. Use a SqliteCache backend to share resolutions between
+    runs and processes; the default is an in-memory LRU.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCache | None = None,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+    ):
+        self.backend = backend if backend is not None else MemoryCache(maxsize=4096)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stats = ResolutionCacheStats()
+
+    def lookup(self, criteria: SecurityCriteria) -> tuple[bool, Symbol | None]:
+        """
+        Return (found, symbol). found is False on a miss; symbol is None for a cached
+        "no match".
+        """
+        entry = self.backend.get(criteria_key(criteria))
+        if entry is None:
+            self.stats.misses += 1
+            return False, None
+        self.stats.hits += 1
+        if entry["symbol"] is None:
+            self.stats.negative_hits += 1
+            return True, None
+        return True, Symbol.model_validate(entry["symbol"])
+
+    def store(self, criteria: SecurityCriteria, symbol: Symbol | None) -> None:
+        value = symbol.model_dump(mode="json") if symbol is not None else None
+        ttl = self.ttl if symbol is not None else self.negative_ttl
+        self.backend.set(criteria_key(criteria), {"symbol": value}, ttl=ttl)
+
+    def invalidate(self, criteria: SecurityCriteria) -> None:
+        self.backend.delete(criteria_key(criteria))
+
+    def clear(self) -> None:
+        self.backend.clear()
@@ -0,0 +1,426 @@
+"""
+Long-running JSON API over one warm FTDataSource, so short-lived clients share its HTTP
+session, XID, resolution and history caches instead of starting cold in every process.
+
+    POST /search     {"query": "Apple"}
+    POST /resolve    {"isin": "...", "symbol": "...", "target_price": 1.0, "target_date": "..."}
+    POST /history    {"ticker": "AAPL:NSQ", "period": "1mo"}
+    POST /get_price  {"ticker": "AAPL:NSQ", "date": "2025-01-15"}
+    POST /validate   {"ticker": "AAPL:NSQ", "date": "2025-01-15", "price": 1.0}
+    POST /batch      {"calls": [{"method": "history", "params": {...}}, ...]}
+    GET  /health, GET /metrics
+
+Replies are {"result": ...} or {"error": "..."} with a 4xx/5xx status. Served over TCP or a
+Unix socket by `ftmarkets serve`.
+"""
+
+import json
+import logging
+import os
+import socketserver
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import requests
+from pydantic_market_data.models import (
+    History,
+    HistoryPeriod,
+    PriceVerificationError,
+    SecurityCriteria,
+)
+
+from .api import FTDataSource
+from .extract.scraper import ScraperError
+from .utils import parse_date
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceError(Exception):
+    """
+    A call that failed with an HTTP status other than 500.
+    """
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class MethodStats:
+    calls: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+
+def _param(params: dict[str, Any], name: str) -> Any:
+    value = params.get(name)
+    if value in (None, ""):
+        raise ValueError(f"Missing parameter: {name}")
+    return value
+
+
+def _date_param(params: dict[str, Any], name: str, required: bool = True) -> Any:
+    raw = _param(params, name) if required else params.get(name)
+    if raw in (None, ""):
+        return None
+    parsed = parse_date(str(raw))
+    if parsed is None:
+        raise ValueError(f"Invalid {name}: {raw!r}")
+    return parsed.date()
+
+
+class Service:
+    """
+    Dispatches JSON calls to one FTDataSource.
+
+    At most `max_concurrency` calls run at once; a call that cannot start within
+    `queue_timeout` seconds is refused with 503. Batches run their calls concurrently, and
+    history calls with the same period are fetched together through history_many, which
+    packs their tickers into shared Chart API requests.
+    """
+
+    METHODS = ("search", "resolve", "history", "get_price", "validate")
+
+    def __init__(
+        self,
+        datasource: FTDataSource,
+        max_concurrency: int = 8,
+        queue_timeout: float = 5.0,
+        max_batch: int = 100,
+    ):
+        self.datasource = datasource
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.max_batch = max_batch
+        self.started = time.monotonic()
+        self.in_flight = 0
+        self.rejected = 0
+        self.stats = {method: MethodStats() for method in (*self.METHODS, "batch")}
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="serve")
+        self._handlers: dict[str, Callable[[dict[str, Any]], Any]] = {
+            "search": self._search,
+            "resolve": self._resolve,
+            "history": self._history,
+            "get_price": self._get_price,
+            "validate": self._validate,
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def call(self, method: str, params: dict[str, Any]) -> Any:
+        handler = self._handlers.get(method)
+        if handler is None:
+            raise ServiceError(404, f"Unknown method: {method}")
+        if not isinstance(params, dict):
+            raise ValueError("Parameters must be a JSON object")
+        return self._run(method, partial(handler, params))
+
+    def batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Run many calls; one {"result": ...} or {"error": ..., "status": ...} per call, in order.
+        """
+        with self._track("batch"):
+            return self._batch(calls)
+
+    def _batch(self, calls: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        if not isinstance(calls, list):
+            raise ValueError("calls must be a list")
+        if len(calls) > self.max_batch:
+            raise ServiceError(413, f"At most {self.max_batch} calls per batch")
+
+        replies: list[dict[str, Any] | None] = [None] * len(calls)
+        futures: dict[int, Future[dict[str, Any]]] = {}
+        histories: dict[HistoryPeriod, list[tuple[int, str]]] = {}
+        for i, item in enumerate(calls):
+            try:
+                method, params = self._split_call(item)
+                if method == "history":
+                    period = HistoryPeriod(params.get("period") or HistoryPeriod.MO1)
+                    ticker = str(_param(params, "ticker"))
+                    histories.setdefault(period, []).append((i, ticker))
+                    continue
+            except ValueError as e:
+                replies[i] = {"error": str(e), "status": 400}
+                continue
+            futures[i] = self._pool.submit(self._reply, method, params)
+
+        fetches = {}
+        for period, group in histories.items():
+            if len(group) == 1:
+                i, ticker = group[0]
+                futures[i] = self._pool.submit(
+                    self._reply, "history", {"ticker": ticker, "period": period}
+                )
+                continue
+            tickers = [ticker for _, ticker in group]
+            # One history_many call packs the group's tickers into shared Chart API requests
+            fetches[period] = self._pool.submit(
+                self._run, "history", partial(self.datasource.history_many, tickers, period)
+            )
+
+        for i, future in futures.items():
+            replies[i] = future.result()
+        for period, fetched in fetches.items():
+            for i, ticker in histories[period]:
+                replies[i] = self._history_reply(fetched, ticker)
+        return [reply or {"error": "Not run", "status": 500} for reply in replies]
+
+    def _history_reply(self, fetched: Future[dict[str, History]], ticker: str) -> dict[str, Any]:
+        try:
+            hist = fetched.result().get(ticker)
+        except Exception as e:
+            return {"error": str(e), "status": self._status(e)}
+        if hist is None:
+            return {"error": f"No history for {ticker}", "status": 404}
+        return {"result": hist.model_dump(mode="json")}
+
+    def health(self) -> dict[str, Any]:
+        return {"status": "ok", "uptime": round(time.monotonic() - self.started, 3)}
+
+    def metrics(self) -> dict[str, Any]:
+        ds = self.datasource
+        scraper = ds.scraper
+        caches = {
+            "xid": scraper.xid_cache.stats,
+            "resolution": ds.resolution_cache.stats if ds.resolution_cache else None,
+            "history": ds.history_cache.stats if ds.history_cache else None,
+            "http": getattr(scraper.client.response_cache, "stats", None),
+            "coalesced": getattr(scraper.client.inflight, "stats", None),
+        }
+        return {
+            **self.health(),
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "rejected": self.rejected,
+            "methods": {name: asdict(stats) for name, stats in self.stats.items()},
+            "caches": {
+                name: asdict(stats) if stats is not None else None for name, stats in caches.items()
+            },
+        }
+
+    def _split_call(self, item: Any) -> tuple[str, dict[str, Any]]:
+        if not isinstance(item, dict) or not isinstance(item.get("method"), str):
+            raise ValueError('Each call needs a "method" and optional "params"')
+        params = item.get("params") or {}
+        if not isinstance(params, dict):
+            raise ValueError("Parameters must be a JSON object")
+        return item["method"], params
+
+    def _reply(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return {"result": self.call(method, params)}
+        except Exception as e:
+            return {"error": str(e), "status": self._status(e)}
+
+    def _status(self, e: Exception) -> int:
+        if isinstance(e, ServiceError):
+            return e.status
+        if isinstance(e, ValueError):
+            return 400
+        if isinstance(e, ScraperError):
+            return 404
+        if isinstance(e, requests.exceptions.RequestException):
+            return 502
+        return 500
+
+    def _run(self, method: str, fn: Callable[[], Any]) -> Any:
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._lock:
+                self.rejected += 1
+            raise ServiceError(503, "Too many concurrent requests")
+        with self._lock:
+            self.in_flight += 1
+        try:
+            with self._track(method):
+                return fn()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    @contextmanager
+    def _track(self, method: str) -> Iterator[None]:
+        """
+        Count a call to method, its time and whether it raised.
+        """
+        stats = self.stats[method]
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            with self._lock:
+                stats.errors += 1
+            raise
+        finally:
+            with self._lock:
+                stats.calls += 1
+                stats.seconds += time.perf_counter() - start
+
+    # --- Methods ---
+
+    def _search(self, params: dict[str, Any]) -> list[dict[str, Any]]:
+        return [s.model_dump(mode="json") for s in self.datasource.search(_param(params, "query"))]
+
+    def _resolve(self, params: dict[str, Any]) -> dict[str, Any] | None:
+        sym = self.datasource.resolve(SecurityCriteria.model_validate(params))
+        return sym.model_dump(mode="json") if sym else None
+
+    def _history(self, params: dict[str, Any]) -> dict[str, Any]:
+        period = HistoryPeriod(params.get("period") or HistoryPeriod.MO1)
+        # history() hands back a copy, so dumping it leaves the cached entry lazy
+        hist = self.datasource.history(str(_param(params, "ticker")), period=period)
+        return hist.model_dump(mode="json")
+
+    def _get_price(self, params: dict[str, Any]) -> float:
+        ticker = str(_param(params, "ticker"))
+        try:
+            price = self.datasource.get_price(ticker, _date_param(params, "date", required=False))
+        except RuntimeError as e:
+            raise ServiceError(404, str(e)) from e
+        return float(price.root)
+
+    def _validate(self, params: dict[str, Any]) -> dict[str, Any]:
+        ticker = str(_param(params, "ticker"))
+        target_date = _date_param(params, "date")
+        price = float(_param(params, "price"))
+        try:
+            return {"valid": self.datasource.validate(ticker, target_date, price)}
+        except PriceVerificationError as e:
+            return {"valid": False, "low": e.actual_low, "high": e.actual_high}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_HTTPServer | _UnixServer"
+
+    def do_GET(self) -> None:
+        service = self.server.service
+        if self.path == "/health":
+            self._send(200, service.health())
+        elif self.path == "/metrics":
+            self._send(200, service.metrics())
+        else:
+            self._send(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self) -> None:
+        service = self.server.service
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length) or b"{}")
+            name = self.path.strip("/")
+            if name == "batch":
+                calls: Any = body.get("calls") if isinstance(body, dict) else body
+                self._send(200, {"results": service.batch(calls)})
+            else:
+                self._send(200, {"result": service.call(name, body)})
+        except Exception as e:
+            status = service._status(e)
+            if status == 500:
+                logger.exception("Unhandled error in %s", self.path)
+            headers = {"Retry-After": "1"} if status == 503 else {}
+            self._send(status, {"error": str(e)}, headers)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(format, *args)
+
+    def _send(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    service: Service
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    service: Service
+
+    def get_request(self) -> tuple[Any, Any]:
+        # BaseHTTPRequestHandler expects a (host, port) client address
+        conn, _ = super().get_request()
+        return conn, ("unix", 0)
+
+
+class ServiceServer:
+    """
+    Serves a Service over TCP (`host`, `port`; port 0 picks a free one) or, with
+    `socket_path`, a Unix socket. A stale socket file left by a previous run is replaced.
+    """
+
+    def __init__(
+        self,
+        service: Service,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        socket_path: str | None = None,
+    ):
+        self.service = service
+        self.host = host
+        self.port: int | None = None
+        self.socket_path = socket_path
+        self._httpd: _HTTPServer | _UnixServer
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self._httpd = _UnixServer(socket_path, _Handler)
+        else:
+            httpd = _HTTPServer((host, port), _Handler)
+            # The bound port, when port 0 picked a free one
+            self.port = httpd.server_port
+            self._httpd = httpd
+        self._httpd.service = service
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        if self.socket_path:
+            return f"unix://{self.socket_path}"
+        return f"http://{self.host}:{self.port}"
+
+    def start(self) -> "ServiceServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="ftmarkets-serve", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.close()
+
+    def close(self) -> None:
+        self._httpd.server_close()
+        self.service.close()
+        if self.socket_path and os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+    def __enter__(self) -> "ServiceServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
@@ -0,0 +1,127 @@
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from pydantic_market_data.models import OHLCV, Symbol
+
+from .frame import HistoryFrame
+
+
+class HistoryStore:
+    """
+    Local OHLCV store keyed by ticker, backed by a SQLite file.
+
+    Alongside the candles it records the date range each ticker has been fetched for,
+    so the scraper only needs to request the gap between the last fetch and today.
+    A range fetched on a given calendar day is treated as complete for that day.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS candles ("
+                "ticker TEXT NOT NULL, date TEXT NOT NULL, "
+                "open REAL, high REAL, low REAL, close REAL, volume REAL, "
+                "PRIMARY KEY (ticker, date))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                "ticker TEXT PRIMARY KEY, start TEXT NOT NULL, end TEXT NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+
+    def coverage(self, ticker: str) -> tuple[date, date] | None:
+        """
+        Return the (start, end) dates fetched for a ticker, or None if it is unknown.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT start, end FROM coverage WHERE ticker = ?", (ticker,)
+            ).fetchone()
+        if row is None:
+            return None
+        return date.fromisoformat(row[0]), date.fromisoformat(row[1])
+
+    def missing_days(self, ticker: str, days: int, today: date | None = None) -> int | None:
+        """
+        Return the `days` value to request so the store covers the last `days` days,
+        or None if it already does.
+        """
+        today = today or date.today()
+        cov = self.coverage(ticker)
+        if cov is None or cov[0] > today - timedelta(days=days):
+            return days
+        if cov[1] >= today:
+            return None
+        # Overlap the last stored day so a partial final candle gets refreshed
+        return max((today - cov[1]).days + 1, 2)
+
+    def load(self, ticker: str, start: date, end: date | None = None) -> list[OHLCV]:
+        return self.load_frame(ticker, start, end).to_candles()
+
+    def load_frame(self, ticker: str, start: date, end: date | None = None) -> HistoryFrame:
+        end = end or date.max
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT date, open, high, low, close, volume FROM candles "
+                "WHERE ticker = ? AND date >= ? AND date <= ? ORDER BY date",
+                (ticker, start.isoformat(), end.isoformat()),
+            ).fetchall()
+        columns: list[tuple[Any, ...]] = list(zip(*rows, strict=True)) if rows else [()] * 6
+        return HistoryFrame.from_series(
+            Symbol(ticker=ticker, name=ticker),
+            columns[0],
+            {
+                "open": list(columns[1]),
+                "high": list(columns[2]),
+                "low": list(columns[3]),
+                "close": list(columns[4]),
+                "volume": list(columns[5]),
+            },
+        )
+
+    def save(
+        self, ticker: str, candles: list[OHLCV] | HistoryFrame, start: date, end: date
+    ) -> None:
+        """
+        Merge candles into the store and extend the ticker's coverage to [start, end].
+        Candles for dates already stored are replaced.
+        """
+        frame = (
+            candles
+            if isinstance(candles, HistoryFrame)
+            else HistoryFrame.from_candles(Symbol(ticker=ticker, name=ticker), candles)
+        )
+        rows = [(ticker, d.date().isoformat(), *values) for d, *values in frame.rows()]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO candles "
+                "(ticker, date, open, high, low, close, volume) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.execute(
+                "INSERT INTO coverage (ticker, start, end, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(ticker) DO UPDATE SET "
+                "start = MIN(start, excluded.start), end = MAX(end, excluded.end), "
+                "updated_at = excluded.updated_at",
+                (ticker, start.isoformat(), end.isoformat(), time.time()),
+            )
+
+    def clear(self, ticker: str | None = None) -> None:
+        with self._lock, self._conn:
+            if ticker is None:
+                self._conn.execute("DELETE FROM candles")
+                self._conn.execute("DELETE FROM coverage")
+            else:
+                self._conn.execute("DELETE FROM candles WHERE ticker = ?", (ticker,))
+                self._conn.execute("DELETE FROM coverage WHERE ticker = ?", (ticker,))
+
+    def close(self) -> None:
+        self._conn.close()
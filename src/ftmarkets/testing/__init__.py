@@ -0,0 +1,8 @@
+"""
+Offline tooling: synthetic markets.ft.com responses and a record/replay transport.
+"""
+
+from .replay import Cassette, CassetteMiss, RecordingAdapter, ReplayAdapter
+from .synthetic import SyntheticAdapter
+
+__all__ = ["Cassette", "CassetteMiss", "RecordingAdapter", "ReplayAdapter", "SyntheticAdapter"]
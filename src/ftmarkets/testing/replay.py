@@ -0,0 +1,157 @@
+"""
+Record/replay transport for FTClient.
+
+A Cassette is a JSON file of recorded request/response pairs. RecordingAdapter captures the
+responses of a real (or synthetic) transport into it; ReplayAdapter serves them back offline.
+"""
+
+import base64
+import io
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from ..http_cache import request_key
+
+# Bodies are stored decoded, so transfer framing headers no longer apply
+_SKIPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+class CassetteMiss(requests.exceptions.ConnectionError):
+    """No recorded response matches the request."""
+
+
+class Cassette:
+    """
+    Recorded responses keyed by method, URL (including the query string) and JSON body.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: str | Path | None = None):
+        self.path = Path(path) if path is not None else None
+        self.interactions: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str | Path) -> "Cassette":
+        cassette = cls(path)
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')!r}")
+        for interaction in data["interactions"]:
+            cassette.interactions[interaction["key"]] = interaction
+        return cassette
+
+    def save(self, path: str | Path | None = None) -> None:
+        path = Path(path or self.path or "")
+        if not path.name:
+            raise ValueError("Cassette has no path to save to")
+        with self._lock:
+            interactions = list(self.interactions.values())
+        path.write_text(
+            json.dumps({"version": self.VERSION, "interactions": interactions}, indent=1),
+            encoding="utf-8",
+        )
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def key(self, request: requests.PreparedRequest) -> str:
+        body: Any = request.body
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", errors="replace")
+        try:
+            # Match on the JSON value, not its serialisation
+            body = json.loads(body) if body else None
+        except ValueError:
+            pass
+        return request_key(request.method or "GET", request.url or "", None, body)
+
+    def record(self, request: requests.PreparedRequest, response: requests.Response) -> None:
+        content = response.content
+        try:
+            body = {"encoding": "utf-8", "data": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            body = {"encoding": "base64", "data": base64.b64encode(content).decode("ascii")}
+        interaction: dict[str, Any] = {
+            "key": self.key(request),
+            "request": {"method": request.method, "url": request.url},
+            "response": {
+                "status": response.status_code,
+                "url": response.url,
+                "headers": {
+                    k: v for k, v in response.headers.items() if k.lower() not in _SKIPPED_HEADERS
+                },
+                "body": body,
+            },
+        }
+        with self._lock:
+            self.interactions[interaction["key"]] = interaction
+
+    def play(self, request: requests.PreparedRequest) -> requests.Response | None:
+        interaction = self.interactions.get(self.key(request))
+        if interaction is None:
+            return None
+        recorded = interaction["response"]
+        body = recorded["body"]
+        resp = requests.Response()
+        resp.status_code = recorded["status"]
+        resp.url = recorded["url"]
+        resp.headers = CaseInsensitiveDict(recorded["headers"])
+        resp.encoding = requests.utils.get_encoding_from_headers(resp.headers)
+        resp.request = request
+        # Served through raw so streamed reads (iter_content) work as on a live response
+        resp.raw = io.BytesIO(
+            body["data"].encode("utf-8")
+            if body["encoding"] == "utf-8"
+            else base64.b64decode(body["data"])
+        )
+        return resp
+
+
+class RecordingAdapter(BaseAdapter):
+    """
+    Sends requests through `inner` (a plain HTTPAdapter by default) and records the responses.
+    """
+
+    def __init__(self, cassette: Cassette, inner: BaseAdapter | None = None):
+        super().__init__()
+        self.cassette = cassette
+        self.inner = inner or HTTPAdapter()
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        resp = self.inner.send(request, *args, **kwargs)
+        self.cassette.record(request, resp)
+        return resp
+
+    def close(self) -> None:
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Serves recorded responses; raises CassetteMiss for requests missing from the cassette.
+    """
+
+    def __init__(self, cassette: Cassette):
+        super().__init__()
+        self.cassette = cassette
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        resp = self.cassette.play(request)
+        if resp is None:
+            raise CassetteMiss(f"No recorded response for {request.method} {request.url}")
+        return resp
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,197 @@
+"""
+Local stand-in for markets.ft.com, for load testing without touching the real site.
+
+Serves the search pages, tearsheets and chart API from the deterministic synthetic data in
+`ftmarkets.testing.synthetic`, with configurable latency and injected errors and throttling.
+Point a client at it with `FTClient(base_url=server.url)` or the FTMARKETS_BASE_URL
+environment variable:
+
+    python -m ftmarkets.testing.server --port 8080 --latency 0.05 --throttle-rate 0.01
+"""
+
+import argparse
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from ..ratelimit import TokenBucket
+from .synthetic import respond
+
+
+@dataclass
+class ServerStats:
+    requests: int = 0
+    errors: int = 0
+    throttled: int = 0
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # Keep-alive, so clients exercise their connection pools as they would against the site
+    protocol_version = "HTTP/1.1"
+    server: "_Server"
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _handle(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        stand_in = self.server.stand_in
+        stand_in.delay()
+
+        fault = stand_in.fault()
+        if fault is not None:
+            status, headers = fault
+            self._send(status, b"", headers)
+            return
+        result = respond(self.command, f"http://{stand_in.host}{self.path}", body)
+        self._send(result.status, result.content, result.headers)
+
+    def _send(self, status: int, content: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stand_in: "StandInServer"
+
+
+class StandInServer:
+    """
+    Threaded HTTP server answering markets.ft.com requests from synthetic data.
+
+    Each request is delayed by `latency` seconds plus up to `jitter` more. A `throttle_rate`
+    fraction of requests gets 429 with Retry-After, and an `error_rate` fraction a 500 or 503.
+    With `max_rps`, requests beyond that rate are also answered with 429, like the real site.
+    Injected faults come from a generator seeded with `seed`, so runs are repeatable.
+    Port 0 picks a free port; see `url`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        max_rps: float | None = None,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        self.host = host
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.bucket = TokenBucket(max_rps, max(int(max_rps), 1)) if max_rps else None
+        self.stats = ServerStats()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = _Server((host, port), _Handler)
+        self._httpd.stand_in = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def delay(self) -> None:
+        with self._lock:
+            extra = self._random.uniform(0, self.jitter) if self.jitter else 0.0
+        if self.latency or extra:
+            time.sleep(self.latency + extra)
+
+    def fault(self) -> tuple[int, dict[str, str]] | None:
+        """
+        Pick the injected failure for one request, if any, as (status, headers).
+        """
+        with self._lock:
+            self.stats.requests += 1
+            roll = self._random.random()
+            if (self.bucket is not None and not self.bucket.try_acquire()) or (
+                roll < self.throttle_rate
+            ):
+                self.stats.throttled += 1
+                return 429, {"Retry-After": str(self.retry_after)}
+            if roll < self.throttle_rate + self.error_rate:
+                self.stats.errors += 1
+                return self._random.choice((500, 503)), {}
+        return None
+
+    def start(self) -> "StandInServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="ftmarkets-stand-in", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra latency, max")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of 500/503s")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of 429s")
+    parser.add_argument("--max-rps", type=float, help="Answer 429 above this request rate")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    server = StandInServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        max_rps=args.max_rps,
+        seed=args.seed,
+    )
+    print(f"Serving synthetic markets.ft.com on {server.url} (FTMARKETS_BASE_URL={server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+"""
+Deterministic stand-ins for markets.ft.com responses.
+
+Every ticker gets a stable XID, name and price path derived from the ticker string, so
+offline tests, benchmarks and the stand-in server return the same data for the same request.
+"""
+
+import hashlib
+import html
+import io
+import json
+import re
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+# (exchange code, exchange name, country) of the listings returned for a name or ISIN query
+_LISTINGS = (
+    ("NSQ", "Nasdaq", "United States"),
+    ("LSE", "London Stock Exchange", "United Kingdom"),
+    ("GER", "XETRA", "Germany"),
+)
+_JSON = {"Content-Type": "application/json; charset=utf-8"}
+_HTML = {"Content-Type": "text/html; charset=utf-8"}
+
+
+@dataclass
+class SyntheticResponse:
+    status: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+def xid_for(ticker: str) -> str:
+    digest = hashlib.sha1(ticker.encode(), usedforsecurity=False).hexdigest()
+    return str(int(digest[:8], 16) % 100_000_000 + 1)
+
+
+def name_for(ticker: str) -> str:
+    return f"{ticker.split(':')[0].title()} Synthetic Holdings"
+
+
+def isin_for(n: int, country: str = "US") -> str:
+    """
+    A valid ISIN (correct check digit) for a sequence number.
+    """
+    body = f"{country}{n:09d}"
+    digits = "".join(str(int(c, 36)) for c in body)
+    total = 0
+    for i, d in enumerate(reversed(digits)):
+        v = int(d) * (2 if i % 2 == 0 else 1)
+        total += v // 10 + v % 10
+    return f"{body}{(10 - total % 10) % 10}"
+
+
+def listings_for(query: str) -> list[tuple[str, str, str]]:
+    """
+    (ticker, exchange, country) listings matching a query. A ticker query matches itself.
+    """
+    if ":" in query:
+        return [(query, query.split(":")[1], "")]
+    root = re.sub(r"[^A-Z0-9]", "", query.upper())[:4] or "SYN"
+    return [(f"{root}:{code}", exchange, country) for code, exchange, country in _LISTINGS]
+
+
+def trading_days(days: int, today: date | None = None) -> np.ndarray:
+    """
+    Weekdays within the last `days` calendar days, up to and including today.
+    """
+    end = np.datetime64(today or date.today(), "D") + 1
+    span = np.arange(end - days, end, dtype="datetime64[D]")
+    return span[np.is_busday(span)]
+
+
+def ohlcv(xid: str, dates: np.ndarray) -> dict[str, np.ndarray]:
+    """
+    Price path as a pure function of (xid, date), so any date range is consistent with any other.
+    """
+    seed = int(xid)
+    n = dates.astype("datetime64[D]").astype(np.int64).astype(float)
+    base = 10 + seed % 490
+    phase = (seed % 1000) / 100
+    close = base * (1 + 0.3 * np.sin(n / 90 + phase)) + 0.02 * base * np.sin(n * 1.7 + phase)
+    return {
+        "Open": np.round(close * (1 + 0.004 * np.sin(n * 2.3)), 3),
+        "High": np.round(close * 1.01, 3),
+        "Low": np.round(close * 0.99, 3),
+        "Close": np.round(close, 3),
+        "Volume": np.round(1e6 * (1.5 + np.sin(n / 7 + phase))),
+    }
+
+
+def search_json(query: str) -> bytes:
+    results = [
+        {"ticker": t, "name": name_for(t), "exchange": exchange, "xid": xid_for(t)}
+        for t, exchange, _ in listings_for(query)
+    ]
+    return json.dumps({"data": {"symbols": results}}).encode()
+
+
+def search_html(query: str) -> bytes:
+    rows = "".join(
+        f"<tr><td>{html.escape(name_for(t))}</td><td>{t}</td>"
+        f"<td>{html.escape(exchange)}</td><td>{html.escape(country)}</td></tr>"
+        for t, exchange, country in listings_for(query)
+    )
+    return (
+        '<html><body><div id="equity-panel" role="tabpanel">'
+        f'<table class="mod-ui-table"><tbody>{rows}</tbody></table>'
+        "</div></body></html>"
+    ).encode()
+
+
+def tearsheet_html(ticker: str) -> bytes:
+    config = html.escape(json.dumps({"xid": xid_for(ticker), "symbol": ticker}), quote=True)
+    return (
+        "<html><body>"
+        f'<h1 class="mod-tearsheet-overview__header__name">{html.escape(name_for(ticker))}</h1>'
+        f'<section class="mod-tearsheet-overview" data-mod-config="{config}"></section>'
+        "</body></html>"
+    ).encode()
+
+
+def chart_json(request: dict[str, Any], today: date | None = None) -> bytes:
+    dates = trading_days(int(request.get("days", 30)), today)
+    stamps = np.datetime_as_string(dates.astype("datetime64[s]"), unit="s").tolist()
+    elements = []
+    for element in request.get("elements", []):
+        xid = str(element["Symbol"])
+        series = ohlcv(xid, dates)
+        names = ["Volume"] if element["Type"] == "volume" else ["Open", "High", "Low", "Close"]
+        elements.append(
+            {
+                "Type": element["Type"],
+                "Symbol": xid,
+                "ComponentSeries": [
+                    {"Type": name, "Values": series[name].tolist()} for name in names
+                ],
+            }
+        )
+    return json.dumps({"Dates": stamps, "Elements": elements}).encode()
+
+
+def respond(method: str, url: str, body: bytes | str | None = None) -> SyntheticResponse:
+    """
+    Answer a markets.ft.com request the way the site would, from synthetic data.
+    """
+    parsed = urlparse(url)
+    query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+    path = parsed.path
+
+    if method == "GET" and path == "/data/searchapi/searchsecurities":
+        return SyntheticResponse(200, search_json(query.get("query", "")), dict(_JSON))
+    if method == "GET" and path == "/data/search":
+        return SyntheticResponse(200, search_html(query.get("query", "")), dict(_HTML))
+    if method == "GET" and path.endswith("/tearsheet/summary") and query.get("s"):
+        return SyntheticResponse(200, tearsheet_html(query["s"]), dict(_HTML))
+    if method == "POST" and path == "/data/chartapi/series":
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return SyntheticResponse(400, b"Invalid JSON", dict(_HTML))
+        return SyntheticResponse(200, chart_json(payload), dict(_JSON))
+    return SyntheticResponse(404, b"Not Found", dict(_HTML))
+
+
+class SyntheticAdapter(BaseAdapter):
+    """
+    requests transport adapter answering from `respond()` without any network access.
+    """
+
+    def send(
+        self, request: requests.PreparedRequest, *args: Any, **kwargs: Any
+    ) -> requests.Response:
+        result = respond(request.method or "GET", request.url or "", request.body)
+        resp = requests.Response()
+        resp.status_code = result.status
+        resp.headers = CaseInsensitiveDict(result.headers)
+        resp.encoding = "utf-8"
+        resp.url = request.url or ""
+        resp.request = request
+        resp.raw = io.BytesIO(result.content)
+        return resp
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,242 @@
+import email.utils
+import io
+import os
+import ssl
+import threading
+import time
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers, select_proxy
+
+from .ratelimit import RateLimiter
+
+if TYPE_CHECKING:
+    import httpx
+
+
+def backoff_delay(consecutive_errors: int, factor: float) -> float:
+    """
+    Same schedule as urllib3's Retry: no delay on the first retry, then factor * 2^(n-1).
+    """
+    if consecutive_errors <= 1:
+        return 0.0
+    return min(factor * 2 ** (consecutive_errors - 1), 120.0)
+
+
+def retry_after_delay(status_code: int, headers: Mapping[str, str]) -> float | None:
+    """
+    Seconds requested by a Retry-After header on a 413/429/503 response, if any.
+    """
+    value = headers.get("Retry-After")
+    if value is None or status_code not in (413, 429, 503):
+        return None
+    if value.strip().isdigit():
+        return float(value)
+    parsed = email.utils.parsedate_to_datetime(value)
+    return max(parsed.timestamp() - time.time(), 0.0)
+
+
+class _StreamedBody:
+    """
+    File-like view of a streamed httpx response, read by requests' iter_content(). Closing it
+    stops the download.
+    """
+
+    def __init__(self, resp: "httpx.Response", request: requests.PreparedRequest):
+        import httpx
+
+        self._resp = resp
+        self._request = request
+        self._chunks: Iterator[bytes] = resp.iter_bytes()
+        self._buffer = b""
+        self._errors = httpx.TransportError
+
+    def read(self, size: int = -1) -> bytes:
+        try:
+            while size < 0 or len(self._buffer) < size:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                self._buffer += chunk
+        except self._errors as e:
+            raise requests.exceptions.ConnectionError(e, request=self._request) from e
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def close(self) -> None:
+        self._resp.close()
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    requests transport adapter that sends requests through an httpx.Client with HTTP/2, so
+    concurrent requests to one host are multiplexed over a few connections instead of each
+    thread holding its own. Retries follow the same policy as FTClient's urllib3 Retry.
+    `stream`, `verify`, `cert` and proxies are honoured per request; requests needing
+    non-default TLS or proxy settings get their own httpx.Client. Requires the `http2` extra.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 5.0,
+        max_retries: int = 3,
+        backoff_factor: float = 1,
+        retry_statuses: Sequence[int] = (429, 500, 502, 503, 504),
+        limiter: RateLimiter | None = None,
+    ):
+        super().__init__()
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "HTTP/2 requires httpx with h2. Install with: pip install 'py-ftmarkets[http2]'"
+            ) from e
+        self._httpx = httpx
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.client = self._new_client(True, None)
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_statuses = tuple(retry_statuses)
+        self.limiter = limiter
+        # Clients for requests with non-default verify, cert or proxy settings
+        self._clients: dict[Hashable, httpx.Client] = {}
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        url = request.url or ""
+        client = self._client_for(verify, cert, select_proxy(url, proxies or {}))
+        retries = 0
+        while True:
+            limiter = self.limiter
+            endpoint = limiter.acquire(url) if limiter is not None else None
+            resp = None
+            started = time.perf_counter()
+            try:
+                resp = client.send(
+                    client.build_request(
+                        request.method or "GET",
+                        url,
+                        headers=dict(request.headers),
+                        content=request.body,
+                        timeout=self._timeout(timeout),
+                    ),
+                    stream=True,
+                )
+                final = resp.status_code not in self.retry_statuses or retries >= self.max_retries
+                if final and not stream:
+                    resp.read()
+            except self._httpx.TransportError as e:
+                if resp is not None:
+                    resp.close()
+                    resp = None
+                if retries >= self.max_retries:
+                    raise requests.exceptions.ConnectionError(e, request=request) from e
+            finally:
+                if limiter is not None and endpoint is not None:
+                    throttled = resp is None or resp.status_code in self.retry_statuses
+                    limiter.release(endpoint, throttled)
+
+            if resp is not None:
+                if final:
+                    out = self._to_response(request, resp, stream)
+                    out.elapsed = timedelta(seconds=time.perf_counter() - started)
+                    return out
+                resp.close()
+                delay = retry_after_delay(resp.status_code, resp.headers)
+            else:
+                delay = None
+            retries += 1
+            time.sleep(delay if delay is not None else backoff_delay(retries, self.backoff_factor))
+
+    def close(self) -> None:
+        self.client.close()
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+            self._clients.clear()
+
+    def _new_client(self, verify: "ssl.SSLContext | bool", proxy: str | None) -> "httpx.Client":
+        return self._httpx.Client(
+            http2=True,
+            follow_redirects=False,  # requests.Session handles redirects
+            limits=self.limits,
+            verify=verify,
+            proxy=proxy,
+            # requests has already merged environment proxies and CA bundles into the call
+            trust_env=False,
+        )
+
+    def _client_for(self, verify: Any, cert: Any, proxy: str | None) -> "httpx.Client":
+        if verify is True and not cert and not proxy:
+            return self.client
+        key = (verify, tuple(cert) if isinstance(cert, list | tuple) else cert, proxy)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = self._new_client(
+                    self._ssl_context(verify, cert), proxy
+                )
+        return client
+
+    def _ssl_context(self, verify: Any, cert: Any) -> ssl.SSLContext:
+        """
+        TLS settings of a requests call: verify may be a bool or a CA bundle file or
+        directory, cert a client certificate file or a (cert, key) pair.
+        """
+        if isinstance(verify, str) and os.path.isdir(verify):
+            ctx = ssl.create_default_context(capath=verify)
+        elif isinstance(verify, str):
+            ctx = ssl.create_default_context(cafile=verify)
+        else:
+            ctx = self._httpx.create_ssl_context(verify=bool(verify), trust_env=False)
+        if isinstance(cert, str):
+            ctx.load_cert_chain(cert)
+        elif cert:
+            ctx.load_cert_chain(*cert)
+        return ctx
+
+    def _timeout(self, timeout: Any) -> "httpx.Timeout":
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return self._httpx.Timeout(read, connect=connect)
+        return self._httpx.Timeout(timeout)
+
+    def _to_response(
+        self, request: requests.PreparedRequest, resp: "httpx.Response", stream: bool
+    ) -> requests.Response:
+        out = requests.Response()
+        out.status_code = resp.status_code
+        out.reason = resp.reason_phrase
+        out.headers = CaseInsensitiveDict(resp.headers)
+        out.encoding = get_encoding_from_headers(out.headers)
+        out.url = str(resp.url)
+        out.request = request
+        if stream:
+            # Read as iter_content() asks for it; closing the response stops the download
+            out.raw = _StreamedBody(resp, request)
+        else:
+            out.raw = io.BytesIO(resp.content)
+            resp.close()
+        return out
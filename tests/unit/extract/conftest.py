@@ -0,0 +1,24 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+
+def _page(html_content, chunk_size=None, **kwargs):
+    """
+    Mock tearsheet response; iter_content serves the body in chunks like a streamed response.
+    """
+    content = html_content.encode()
+    size = chunk_size or len(content) or 1
+    resp = MagicMock(
+        status_code=200, content=content, text=html_content, encoding="utf-8", **kwargs
+    )
+    resp.iter_content.side_effect = lambda n=None: iter(
+        [content[i : i + size] for i in range(0, len(content), size)]
+    )
+    return resp
+
+
+@pytest.fixture
+def page():
+    """Factory of mock tearsheet responses: page(html_content, chunk_size=None, **attrs)."""
+    return _page
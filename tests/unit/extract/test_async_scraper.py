@@ -0,0 +1,177 @@
+import asyncio
+import json
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import requests
+from pydantic_market_data.models import OHLCV, History, Price, SecurityCriteria, Symbol
+
+from ftmarkets.api import AsyncFTDataSource
+from ftmarkets.client import AsyncFTClient
+from ftmarkets.extract.async_scraper import AsyncScraper
+from ftmarkets.extract.schemas import Ticker
+from ftmarkets.ledger import Trade
+
+httpx = pytest.importorskip("httpx")
+
+CHART_JSON = {
+    "Dates": ["2023-01-01T00:00:00"],
+    "Elements": [
+        {
+            "Type": "price",
+            "Symbol": "111222",
+            "ComponentSeries": [
+                {"Type": "Open", "Values": [100.0]},
+                {"Type": "High", "Values": [110.0]},
+                {"Type": "Low", "Values": [90.0]},
+                {"Type": "Close", "Values": [105.0]},
+            ],
+        }
+    ],
+}
+
+
+@pytest.fixture
+def mock_client():
+    return MagicMock(spec=AsyncFTClient, get=AsyncMock(), post=AsyncMock())
+
+
+@pytest.fixture
+def scraper(mock_client):
+    return AsyncScraper(http_client=mock_client)
+
+
+def test_async_get_history(scraper, mock_client):
+    xid_html = """<div data-mod-config='{"xid":"111222"}'></div>"""
+    mock_client.get.return_value = MagicMock(
+        status_code=200, content=xid_html.encode(), text=xid_html
+    )
+    mock_client.post.return_value = MagicMock(
+        status_code=200, content=json.dumps(CHART_JSON).encode()
+    )
+
+    hist = asyncio.run(scraper.get_history("AAPL:NSQ", days=10))
+
+    assert hist.candles[0].close == 105.0
+    assert mock_client.post.call_args.kwargs["json"]["elements"][0]["Symbol"] == "111222"
+    # Second call is served from the XID cache
+    asyncio.run(scraper.get_history("AAPL:NSQ", days=10))
+    assert mock_client.get.call_count == 1
+
+
+def test_async_search_http_error(scraper, mock_client):
+    mock_client.get.return_value = MagicMock(status_code=500, url="https://x/data/search")
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        asyncio.run(scraper.search(Ticker(root="TEST")))
+
+
+def test_async_datasource_resolve_with_price():
+    mock_scraper = MagicMock(spec=AsyncScraper, search=AsyncMock(), get_history_range=AsyncMock())
+    ds = AsyncFTDataSource(scraper_instance=mock_scraper)
+    cand = Symbol(ticker="VALID:EX", name="Valid")
+    mock_scraper.search.return_value = [cand]
+    mock_scraper.get_history_range.return_value = History(
+        symbol=cand,
+        candles=[OHLCV(date=datetime(2023, 1, 15), open=100, high=105, low=95, close=100)],
+    )
+
+    criteria = SecurityCriteria(
+        symbol="VALID", target_price=Price(root=100.0), target_date=datetime(2023, 1, 15)
+    )
+    result = asyncio.run(ds.resolve(criteria))
+
+    assert result is not None
+    assert result.ticker.root == "VALID:EX"
+    assert asyncio.run(ds.get_price("VALID:EX", datetime(2023, 1, 15))) == Price(root=100.0)
+
+
+def test_async_client_retries_like_sync_client(monkeypatch):
+    statuses = [503, 503, 200]
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), json={})
+
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+
+    async def run():
+        async with AsyncFTClient() as ac:
+            ac.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            return await ac.get("/data/search")
+
+    resp = asyncio.run(run())
+
+    assert resp.status_code == 200
+    assert sleeps == [0.0, 2.0]
+
+
+def test_async_transport_errors_are_handled_like_sync(monkeypatch):
+    def handler(request):
+        raise httpx.ConnectError("down")
+
+    async def no_sleep(delay):
+        pass
+
+    monkeypatch.setattr(asyncio, "sleep", no_sleep)
+
+    async def run():
+        async with AsyncFTClient() as ac:
+            ac.session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            ds = AsyncFTDataSource(scraper_instance=AsyncScraper(http_client=ac))
+            with pytest.raises(requests.exceptions.ConnectionError):
+                await ac.get("/data/search")
+            histories = await ds.scraper.get_histories(["A:EX", "B:EX"])
+            trades = [Trade("A:EX", date(2023, 1, 3), 1.0), Trade("B:EX", date(2023, 1, 3), 1.0)]
+            results = [r async for r in ds.validate_many(trades)]
+            matrix = await ds.get_prices(["A:EX"], [date(2023, 1, 3)])
+            return histories, results, matrix
+
+    histories, results, matrix = asyncio.run(run())
+
+    assert histories == {}
+    assert [r.valid for r in results] == [None, None]
+    assert all(r.error for r in results)
+    assert list(matrix.errors) == ["A:EX"]
+
+
+def test_async_datasource_resolve_returns_first_valid_in_priority_order():
+    mock_scraper = MagicMock(spec=AsyncScraper, search=AsyncMock(), get_history_range=AsyncMock())
+    ds = AsyncFTDataSource(scraper_instance=mock_scraper)
+    mock_scraper.search.return_value = [
+        Symbol(ticker="A:EX", name="A"),
+        Symbol(ticker="B:EX", name="B"),
+        Symbol(ticker="C:EX", name="C"),
+    ]
+    cancelled = []
+
+    async def get_history_range(ticker, start, end):
+        if ticker.root == "C:EX":
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(ticker.root)
+                raise
+        close = 50 if ticker.root == "A:EX" else 100
+        return History(
+            symbol=Symbol(ticker=ticker.root, name=ticker.root),
+            candles=[
+                OHLCV(date=datetime(2023, 1, 15), open=close, high=close, low=close, close=close)
+            ],
+        )
+
+    mock_scraper.get_history_range.side_effect = get_history_range
+    criteria = SecurityCriteria(
+        symbol="X", target_price=Price(root=100.0), target_date=datetime(2023, 1, 15)
+    )
+
+    result = asyncio.run(ds.resolve(criteria))
+
+    assert result is not None
+    assert result.ticker.root == "B:EX"
+    assert cancelled == ["C:EX"]
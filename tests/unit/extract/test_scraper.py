@@ -1,8 +1,15 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
-from pydantic_market_data.models import Symbol
+import requests
+from lxml import html
+from pydantic_market_data.models import SecurityCriteria, Symbol
 
+from ftmarkets.api import FTDataSource
 from ftmarkets.client import FTClient
 from ftmarkets.extract.schemas import Ticker
 from ftmarkets.extract.scraper import Scraper, Xid
@@ -13,7 +20,7 @@ def mock_client():
     mock = MagicMock(spec=FTClient)
     # Mock responses
     mock.get.return_value = MagicMock(status_code=200, content=b"<html></html>", text="")
-    mock.post.return_value = MagicMock(status_code=200, json=lambda: {})
+    mock.post.return_value = MagicMock(status_code=200, content=json.dumps({}).encode())
     return mock
 
 
@@ -22,7 +29,7 @@ def scraper(mock_client):
     return Scraper(http_client=mock_client)
 
 
-def test_get_xid_extraction(scraper, mock_client):
+def test_get_xid_extraction(scraper, mock_client, page):
     # Setup mock HTML with xid in data-mod-config
     html_content = """
     <html>
@@ -31,19 +38,17 @@ def test_get_xid_extraction(scraper, mock_client):
         </body>
     </html>
     """
-    mock_client.get.return_value = MagicMock(
-        status_code=200, content=html_content.encode(), text=html_content
-    )
+    mock_client.get.return_value = page(html_content)
 
     xid = scraper.get_xid(Ticker(root="TEST:EX"))
 
     assert isinstance(xid, Xid)
     assert xid.root == "123456"
     assert str(xid) == "123456"
-    mock_client.get.assert_called_with("/data/equities/tearsheet/summary?s=TEST:EX")
+    mock_client.get.assert_called_with("/data/equities/tearsheet/summary?s=TEST:EX", stream=True)
 
 
-def test_get_xid_regex_fallback(scraper, mock_client):
+def test_get_xid_regex_fallback(scraper, mock_client, page):
     # Setup mock HTML with xid in script or other text
     html_content = """
     <html>
@@ -52,9 +57,7 @@ def test_get_xid_regex_fallback(scraper, mock_client):
         </script>
     </html>
     """
-    mock_client.get.return_value = MagicMock(
-        status_code=200, content=html_content.encode(), text=html_content
-    )
+    mock_client.get.return_value = page(html_content)
 
     xid = scraper.get_xid(Ticker(root="TEST:REGEX"))
 
@@ -92,7 +95,96 @@ def test_search_parsing(scraper, mock_client):
     assert sym.asset_class == "Equity"
 
 
-def test_get_history(scraper, mock_client):
+def test_search_json_api(mock_client):
+    scraper = Scraper(http_client=mock_client, search_backend="json")
+    payload = {
+        "data": {
+            "symbol": {
+                "ticker": "AAPL:NSQ",
+                "name": "Apple Inc",
+                "exchange": "Nasdaq",
+                "xid": "36276",
+            }
+        }
+    }
+    mock_client.get.return_value = MagicMock(status_code=200, content=json.dumps(payload).encode())
+
+    results = scraper.search("AAPL")
+
+    assert [str(s.ticker) for s in results] == ["AAPL:NSQ"]
+    assert results[0].name == "Apple Inc"
+    assert results[0].exchange == "Nasdaq"
+    mock_client.get.assert_called_once_with(Scraper.SEARCH_API_PATH, params={"query": "AAPL"})
+    # The XID from the search response saves the tearsheet request
+    assert scraper.get_xid(Ticker(root="AAPL:NSQ")).root == "36276"
+    assert mock_client.get.call_count == 1
+
+
+def test_search_json_api_fills_currency_country_and_class(mock_client):
+    payload = {
+        "data": {
+            "symbols": [
+                {
+                    "ticker": "AAPL:LSE",
+                    "name": "Apple Inc",
+                    "currency": "GBp",
+                    "countryCode": "GB",
+                    "assetClass": "Equities",
+                },
+                {
+                    "ticker": "AAPL:NSQ",
+                    "name": "Apple Inc",
+                    "exchange": "Nasdaq",
+                    "currency": "USD",
+                    "countryCode": "US",
+                    "assetClass": "Equities",
+                },
+            ]
+        }
+    }
+    mock_client.get.return_value = MagicMock(status_code=200, content=json.dumps(payload).encode())
+    ds = FTDataSource(Scraper(http_client=mock_client, search_backend="json"))
+
+    symbol = ds.resolve(SecurityCriteria(isin="US0378331005", currency="USD"))
+
+    assert symbol is not None
+    assert str(symbol.ticker) == "AAPL:NSQ"
+    assert str(symbol.country) == "US"
+    assert symbol.asset_class == "Equity"
+    mock_client.get.assert_called_once_with(
+        Scraper.SEARCH_API_PATH, params={"query": "US0378331005"}
+    )
+
+
+def test_html_search_is_the_default_backend(scraper):
+    assert scraper.search_backend == "html"
+
+
+def test_search_json_api_falls_back_to_html(mock_client):
+    scraper = Scraper(http_client=mock_client, search_backend="json")
+    html_content = """
+    <html>
+        <div id="equity-panel" role="tabpanel">
+            <table class="mod-ui-table"><tbody>
+                <tr><td>Apple Inc</td><td>AAPL:NSQ</td><td>Nasdaq</td><td>United States</td></tr>
+            </tbody></table>
+        </div>
+    </html>
+    """
+    not_found = MagicMock(status_code=404)
+    not_found.raise_for_status.side_effect = requests.exceptions.HTTPError("404")
+    mock_client.get.side_effect = [
+        not_found,
+        MagicMock(status_code=200, content=html_content.encode()),
+    ]
+
+    results = scraper.search("AAPL")
+
+    assert [str(s.ticker) for s in results] == ["AAPL:NSQ"]
+    assert mock_client.get.call_args.args[0] == Scraper.SEARCH_PATH
+
+
+def test_get_history(scraper, mock_client, page):
     # 1. Mock get_xid call
     # We can rely on internal logic or just mock get_xid if we want unit test isolation
     # But since Scraper calls get_xid internally, let's mock the network call for xid first
@@ -123,12 +215,10 @@ def test_get_history(scraper, mock_client):
     # Side effect for get/post to return different things
     # get -> xid page, post -> chart data
     def side_effect(*args, **kwargs):
-        return MagicMock(status_code=200, json=lambda: chart_json)
+        return MagicMock(status_code=200, content=json.dumps(chart_json).encode())
 
     mock_client.post.side_effect = side_effect
-    mock_client.get.return_value = MagicMock(
-        status_code=200, content=xid_html.encode(), text=xid_html
-    )
+    mock_client.get.return_value = page(xid_html)
 
     hist = scraper.get_history(Ticker(root="AAPL:NSQ"), days=10)
 
@@ -165,12 +255,10 @@ def test_search_tearsheet_redirect(scraper, mock_client):
     assert str(results[0].isin) == "US0378331005"
 
 
-def test_get_xid_fails(scraper, mock_client):
+def test_get_xid_fails(scraper, mock_client, page):
     from ftmarkets.extract.scraper import ScraperError
 
-    mock_client.get.return_value = MagicMock(
-        status_code=200, content=b"no xid here", text="no xid here"
-    )
+    mock_client.get.return_value = page("no xid here")
 
     with pytest.raises(ScraperError, match="Could not determine internal FT ID"):
         scraper.get_xid(Ticker(root="UNKNOWN"))
@@ -239,3 +327,328 @@ def test_extract_currency_heuristics(scraper):
 def test_map_country_to_currency(scraper):
     assert str(scraper._map_country_to_currency("US")) == "USD"
     assert scraper._map_country_to_currency(None) is None
+
+
+def test_get_xid_uses_cache(scraper, mock_client, page):
+    html_content = """<div data-mod-config='{"xid":"123456"}'></div>"""
+    mock_client.get.return_value = page(html_content)
+
+    first = scraper.get_xid(Ticker(root="TEST:EX"))
+    second = scraper.get_xid(Ticker(root="TEST:EX"))
+
+    assert first == second == Xid(root="123456")
+    assert mock_client.get.call_count == 1
+    assert scraper.xid_cache.stats.hits == 1
+    assert scraper.xid_cache.stats.misses == 1
+
+
+def test_concurrent_get_xid_shares_one_download(scraper, mock_client, page):
+    entered, release = threading.Event(), threading.Event()
+
+    def get(url, **kwargs):
+        entered.set()
+        release.wait(5)
+        return page("""<div data-mod-config='{"xid":"123456"}'></div>""")
+
+    mock_client.get.side_effect = get
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        first = ex.submit(scraper.get_xid, Ticker(root="TEST:EX"))
+        entered.wait(5)
+        others = [ex.submit(scraper.get_xid, Ticker(root="TEST:EX")) for _ in range(2)]
+        deadline = time.monotonic() + 5
+        while scraper.xid_flight.stats.shared < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        results = [f.result() for f in (first, *others)]
+
+    assert results == [Xid(root="123456")] * 3
+    assert mock_client.get.call_count == 1
+    assert scraper.xid_flight.stats.shared == 2
+
+
+def test_get_history_refreshes_rejected_cached_xid(scraper, mock_client, page):
+    scraper.xid_cache.set("AAPL:NSQ", "999")
+    xid_html = """<div data-mod-config='{"xid":"111222"}'></div>"""
+    mock_client.get.return_value = page(xid_html)
+    chart_json = {"Dates": [], "Elements": []}
+    mock_client.post.side_effect = [
+        MagicMock(status_code=400),
+        MagicMock(status_code=200, content=json.dumps(chart_json).encode()),
+    ]
+
+    scraper.get_history("AAPL:NSQ")
+
+    payloads = [c.kwargs["json"] for c in mock_client.post.call_args_list]
+    assert [p["elements"][0]["Symbol"] for p in payloads] == ["999", "111222"]
+    assert scraper.xid_cache.get("AAPL:NSQ") == "111222"
+
+
+def _batch_chart_json(xids):
+    elements = []
+    for n, xid in enumerate(xids):
+        price = 100.0 + n
+        elements.append(
+            {
+                "Type": "price",
+                "Symbol": xid,
+                "ComponentSeries": [
+                    {"Type": "Open", "Values": [price, None]},
+                    {"Type": "High", "Values": [price, None]},
+                    {"Type": "Low", "Values": [price, None]},
+                    {"Type": "Close", "Values": [price, None]},
+                ],
+            }
+        )
+        elements.append(
+            {
+                "Type": "volume",
+                "Symbol": xid,
+                "ComponentSeries": [{"Type": "Volume", "Values": [10, None]}],
+            }
+        )
+    return {"Dates": ["2023-01-02T00:00:00", "2023-01-03T00:00:00"], "Elements": elements}
+
+
+def test_get_histories_batches_and_demultiplexes(scraper, mock_client):
+    for n, t in enumerate(["A:EX", "B:EX", "C:EX"]):
+        scraper.xid_cache.set(t, str(n + 1))
+
+    def post(path, **kwargs):
+        xids = [e["Symbol"] for e in kwargs["json"]["elements"] if e["Type"] == "price"]
+        return MagicMock(status_code=200, content=json.dumps(_batch_chart_json(xids)).encode())
+
+    mock_client.post.side_effect = post
+
+    results = scraper.get_histories(["A:EX", "B:EX", "C:EX"], days=5, batch_size=2)
+
+    assert list(results) == ["A:EX", "B:EX", "C:EX"]
+    assert mock_client.post.call_count == 2
+    assert [c.close for c in results["A:EX"].candles] == [100.0]
+    assert results["B:EX"].candles[0].close == 101.0
+    assert results["C:EX"].candles[0].close == 100.0
+
+
+def test_get_histories_splits_failed_batch(scraper, mock_client):
+    scraper.xid_cache.set("A:EX", "1")
+    scraper.xid_cache.set("BAD:EX", "2")
+
+    def post(path, **kwargs):
+        xids = [e["Symbol"] for e in kwargs["json"]["elements"] if e["Type"] == "price"]
+        if "2" in xids:
+            resp = MagicMock(status_code=500)
+            resp.raise_for_status.side_effect = requests.exceptions.HTTPError("Server Error")
+            return resp
+        return MagicMock(status_code=200, content=json.dumps(_batch_chart_json(xids)).encode())
+
+    mock_client.post.side_effect = post
+
+    results = scraper.get_histories(["A:EX", "BAD:EX"], days=5)
+
+    assert list(results) == ["A:EX"]
+    assert mock_client.post.call_count == 3
+
+
+def test_get_history_with_store_fetches_only_gap(mock_client, tmp_path):
+    from datetime import date, datetime, timedelta
+
+    from pydantic_market_data.models import OHLCV
+
+    from ftmarkets.store import HistoryStore
+
+    store = HistoryStore(tmp_path / "history.db")
+    today = date.today()
+    old = today - timedelta(days=10)
+    store.save(
+        "AAPL:NSQ",
+        [OHLCV(date=datetime.combine(old, datetime.min.time()), close=1.0)],
+        today - timedelta(days=400),
+        today - timedelta(days=3),
+    )
+    scraper = Scraper(http_client=mock_client, history_store=store)
+    scraper.xid_cache.set("AAPL:NSQ", "111222")
+    chart_json = {
+        "Dates": [today.isoformat() + "T00:00:00"],
+        "Elements": [
+            {
+                "Type": "price",
+                "Symbol": "111222",
+                "ComponentSeries": [{"Type": "Close", "Values": [2.0]}],
+            }
+        ],
+    }
+    mock_client.post.return_value = MagicMock(
+        status_code=200, content=json.dumps(chart_json).encode()
+    )
+
+    hist = scraper.get_history("AAPL:NSQ", days=365)
+
+    assert mock_client.post.call_args.kwargs["json"]["days"] == 4
+    assert [c.close for c in hist.candles] == [1.0, 2.0]
+
+    # Fully covered now: served from the store without a request
+    scraper.get_history("AAPL:NSQ", days=365)
+    assert mock_client.post.call_count == 1
+
+
+def test_get_history_range_trims_window(scraper, mock_client):
+    from datetime import date, timedelta
+
+    scraper.xid_cache.set("AAPL:NSQ", "111222")
+    today = date.today()
+    days = [today - timedelta(days=n) for n in (12, 10, 8)]
+    chart_json = {
+        "Dates": [d.isoformat() + "T00:00:00" for d in days],
+        "Elements": [
+            {
+                "Type": "price",
+                "Symbol": "111222",
+                "ComponentSeries": [{"Type": "Close", "Values": [1.0, 2.0, 3.0]}],
+            }
+        ],
+    }
+    mock_client.post.return_value = MagicMock(
+        status_code=200, content=json.dumps(chart_json).encode()
+    )
+
+    hist = scraper.get_history_range("AAPL:NSQ", days[0] + timedelta(days=1), days[1])
+
+    assert mock_client.post.call_args.kwargs["json"]["days"] == 12
+    assert [c.close for c in hist.candles] == [2.0]
+
+
+def test_get_history_frame(scraper, mock_client):
+    scraper.xid_cache.set("AAPL:NSQ", "111222")
+    chart_json = {
+        "Dates": ["2023-01-02T00:00:00", "2023-01-03T00:00:00"],
+        "Elements": [
+            {
+                "Type": "price",
+                "Symbol": "111222",
+                "ComponentSeries": [{"Type": "Close", "Values": [1.0, 2.0]}],
+            }
+        ],
+    }
+    mock_client.post.return_value = MagicMock(
+        status_code=200, content=json.dumps(chart_json).encode()
+    )
+
+    frame = scraper.get_history_frame("AAPL:NSQ", days=5)
+
+    assert frame.close.tolist() == [1.0, 2.0]
+    assert str(frame.symbol.ticker) == "AAPL:NSQ"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, None])
+def test_scan_xid_across_chunk_boundaries(scraper, mock_client, chunk_size, page):
+    html_content = (
+        "<html>" + "<p>filler</p>" * 50 + '<div data-mod-config="{&quot;other&quot;:1}"></div>'
+        '<section data-mod-config="{&quot;xid&quot;:&quot;4242&quot;,&quot;s&quot;:1}">'
+        "</section></html>"
+    )
+    mock_client.get.return_value = page(html_content, chunk_size=chunk_size)
+
+    assert scraper.get_xid(Ticker(root="TEST:EX")).root == "4242"
+
+
+def test_scan_xid_stops_reading_at_first_match(scraper):
+    read = []
+
+    def chunks():
+        for chunk in [b'<div data-mod-config=\'{"xid":', b'"77"}\'>', b"x" * 100, b"y" * 100]:
+            read.append(chunk)
+            yield chunk
+
+    xid, _ = scraper._scan_xid(chunks())
+
+    assert xid == "77"
+    assert len(read) == 2
+
+
+def test_scan_xid_miss_returns_wholepage(scraper, page):
+    xid, content = scraper._scan_xid([b"<html>", b"<script>xid: 5</script>", b"</html>"])
+
+    assert xid is None
+    assert content == b"<html><script>xid: 5</script></html>"
+
+
+def test_search_links_deduplicated_against_panel_rows(scraper):
+    html_content = """
+    <html>
+        <a href="/data/etfs/tearsheet/summary?s=BEST:EX">Best Match</a>
+        <div id="equity-panel" role="tabpanel">
+            <table class="mod-ui-table"><tbody>
+                <tr><td>Row One</td><td>ROW1:EX</td></tr>
+                <tr><td>Row Two</td><td>ROW2:EX</td></tr>
+            </tbody></table>
+        </div>
+        <a href="/data/equities/tearsheet/summary?s=ROW1:EX">Row One</a>
+        <a href="/data/etfs/tearsheet/summary?s=BEST:EX">Best Match again</a>
+    </html>
+    """
+    results = scraper._parse_search_results(html.fromstring(html_content), "TEST")
+
+    # Panel rows first, then links not already listed, in document order
+    assert [str(r.ticker) for r in results] == ["ROW1:EX", "ROW2:EX", "BEST:EX"]
+    assert results[2].asset_class == "ETF"
+
+
+def test_empty_search_is_cached_negatively(scraper, mock_client):
+    mock_client.get.return_value = MagicMock(status_code=200, content=b"<html></html>", url="")
+
+    assert scraper.search("US0000000010") == []
+    calls = mock_client.get.call_count
+    assert scraper.search("US0000000010") == []
+    assert mock_client.get.call_count == calls
+
+
+def test_missing_xid_is_cached_negatively(scraper, mock_client, page):
+    from ftmarkets.extract.scraper import ScraperError
+
+    mock_client.get.return_value = page("no xid here")
+
+    for _ in range(2):
+        with pytest.raises(ScraperError, match="Could not determine internal FT ID"):
+            scraper.get_xid(Ticker(root="UNKNOWN"))
+    assert mock_client.get.call_count == 1
+
+
+def test_tearsheet_404_is_cached_but_429_is_not(scraper, mock_client, page):
+    for status, expected_calls in [(404, 1), (429, 2)]:
+        mock_client.get.reset_mock()
+        resp = page("")
+        resp.status_code = status
+        resp.raise_for_status.side_effect = requests.exceptions.HTTPError(f"{status}")
+        mock_client.get.return_value = resp
+        ticker = Ticker(root=f"T{status}:EX")
+
+        for _ in range(2):
+            with pytest.raises(requests.exceptions.HTTPError):
+                scraper.get_xid(ticker)
+        assert mock_client.get.call_count == expected_calls
+
+
+def test_rejected_chart_request_is_cached_negatively(scraper, mock_client, page):
+    scraper.xid_cache.set("BAD:EX", "111")
+    mock_client.get.return_value = page("""<div data-mod-config='{"xid":"111"}'></div>""")
+    rejected = MagicMock(status_code=400, text="Bad Request")
+    rejected.raise_for_status.side_effect = requests.exceptions.HTTPError("400")
+    mock_client.post.return_value = rejected
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        scraper.get_history("BAD:EX")
+    posts = mock_client.post.call_count
+    with pytest.raises(requests.exceptions.HTTPError, match="cached"):
+        scraper.get_history("BAD:EX")
+    assert scraper.get_histories(["BAD:EX"]) == {}
+    assert mock_client.post.call_count == posts
+
+
+def test_negative_ttl_zero_disables_negative_caching(mock_client):
+    scraper = Scraper(http_client=mock_client, negative_ttl=0)
+    mock_client.get.return_value = MagicMock(status_code=200, content=b"<html></html>", url="")
+
+    scraper.search("NOTHING")
+    calls = mock_client.get.call_count
+    scraper.search("NOTHING")
+
+    assert mock_client.get.call_count == 2 * calls
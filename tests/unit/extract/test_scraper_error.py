@@ -29,12 +29,10 @@ def test_search_http_error_handling(scraper, mock_client):
         scraper.search("TEST")
 
 
-def test_get_history_http_error_handling(scraper, mock_client):
+def test_get_history_http_error_handling(scraper, mock_client, page):
     # Mock get_xid success then chart API failure
     xid_html = """<div data-mod-config='{"xid":"111222"}'></div>"""
-    mock_client.get.return_value = MagicMock(
-        status_code=200, content=xid_html.encode(), text=xid_html
-    )
+    mock_client.get.return_value = page(xid_html)
 
     mock_resp = MagicMock()
     mock_resp.status_code = 400
@@ -56,7 +56,7 @@ class TestFTDataSource(unittest.TestCase):
 
         # Mock history showing match
         candles = [OHLCV(date=datetime(2023, 1, 1), open=149.0, high=151.0, low=148.0, close=150.0)]
-        self.mock_scraper.get_history.return_value = History(symbol=cand, candles=candles)
+        self.mock_scraper.get_history_range.return_value = History(symbol=cand, candles=candles)
 
         res = self.ds.resolve(criteria)
         self.assertIsNotNone(res)
@@ -70,7 +70,7 @@ class TestFTDataSource(unittest.TestCase):
             self.ds._ensure_datetime(12345)  # type: ignore
 
     def test_validate(self):
-        self.mock_scraper.get_history.return_value = History(
+        self.mock_scraper.get_history_range.return_value = History(
             symbol=Symbol(ticker="AAPL", name="Apple"),
             candles=[OHLCV(date=datetime(2023, 1, 1), close=150.0)],
         )
@@ -136,7 +136,7 @@ class TestFTDataSource(unittest.TestCase):
         self.mock_scraper.search.return_value = [cand]
         # Mock history showing mismatch
         candles = [OHLCV(date=datetime(2023, 1, 1), close=200.0)]
-        self.mock_scraper.get_history.return_value = History(symbol=cand, candles=candles)
+        self.mock_scraper.get_history_range.return_value = History(symbol=cand, candles=candles)
 
         res = self.ds.resolve(criteria)
         self.assertIsNone(res)
@@ -146,7 +146,7 @@ class TestFTDataSource(unittest.TestCase):
         target_date = date(2023, 1, 1)
         cand = Symbol(ticker="AAPL", name="Apple")
         candles = [OHLCV(date=datetime(2023, 1, 1), close=150.0)]
-        self.mock_scraper.get_history.return_value = History(symbol=cand, candles=candles)
+        self.mock_scraper.get_history_range.return_value = History(symbol=cand, candles=candles)
 
         price = self.ds.get_price(ticker, target_date)
         self.assertEqual(price, Price(root=150.0))
@@ -160,7 +160,7 @@ class TestFTDataSource(unittest.TestCase):
             OHLCV(date=datetime(2023, 1, 1), close=140.0),
             OHLCV(date=datetime(2023, 1, 5), close=160.0),
         ]
-        self.mock_scraper.get_history.return_value = History(symbol=cand, candles=candles)
+        self.mock_scraper.get_history_range.return_value = History(symbol=cand, candles=candles)
 
         # Should match Jan 1 (diff 2) over Jan 5 (diff 2) if same diff,
         # but let's make one closer
@@ -168,7 +168,7 @@ class TestFTDataSource(unittest.TestCase):
             OHLCV(date=datetime(2023, 1, 1), close=140.0),  # diff 2
             OHLCV(date=datetime(2023, 1, 2), close=145.0),  # diff 1
         ]
-        self.mock_scraper.get_history.return_value = History(symbol=cand, candles=candles)
+        self.mock_scraper.get_history_range.return_value = History(symbol=cand, candles=candles)
         price = self.ds.get_price(ticker, target_date)
         self.assertEqual(price, Price(root=145.0))
 
@@ -176,7 +176,7 @@ class TestFTDataSource(unittest.TestCase):
         ticker = "AAPL"
         target_date = date(2023, 1, 1)
         cand = Symbol(ticker="AAPL", name="Apple")
-        self.mock_scraper.get_history.return_value = History(symbol=cand, candles=[])
+        self.mock_scraper.get_history_range.return_value = History(symbol=cand, candles=[])
 
         with self.assertRaises(RuntimeError):
             self.ds.get_price(ticker, target_date)
@@ -191,3 +191,13 @@ class TestFTDataSource(unittest.TestCase):
         res = self.ds.history(ticker, HistoryPeriod.D5)
         self.mock_scraper.get_history.assert_called()
         self.assertEqual(res.symbol.ticker.root, "AAPL")
+
+    def test_history_many(self):
+        cand = Symbol(ticker="AAPL", name="Apple")
+        self.mock_scraper.get_histories.return_value = {"AAPL": History(symbol=cand, candles=[])}
+
+        from pydantic_market_data.models import HistoryPeriod
+
+        res = self.ds.history_many(["AAPL"], HistoryPeriod.Y1)
+        self.mock_scraper.get_histories.assert_called_with(["AAPL"], days=365)
+        self.assertEqual(list(res), ["AAPL"])
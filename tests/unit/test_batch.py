@@ -0,0 +1,177 @@
+import io
+import json
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ftmarkets import api
+from ftmarkets.client import FTClient
+from ftmarkets.commands.batch import row_fields, run_batch
+from ftmarkets.commands.history import HistoryCommand
+from ftmarkets.commands.lookup import LookupCommand
+from ftmarkets.commands.validate_batch import ValidateBatchCommand
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.ledger import read_rows
+from ftmarkets.testing import SyntheticAdapter
+from ftmarkets.testing.synthetic import ohlcv, trading_days, xid_for
+
+
+@pytest.fixture
+def synthetic(monkeypatch):
+    scraper = Scraper(http_client=FTClient(adapter=SyntheticAdapter()), search_backend="html")
+    monkeypatch.setattr(api, "scraper", scraper)
+    return scraper
+
+
+def _close(ticker: str, day: np.datetime64) -> float:
+    return float(ohlcv(xid_for(ticker), np.array([day]))["Close"][0])
+
+
+def _records(capsys) -> list[dict]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_row_fields_normalizes_columns():
+    row = {"Symbol": " APPL:NSQ ", "Asset-Class": "Equity", "price": "", "extra": "x", None: ["y"]}
+
+    assert row_fields(row, ("ticker", "asset_class", "price")) == {
+        "ticker": "APPL:NSQ",
+        "asset_class": "Equity",
+    }
+
+
+def test_run_batch_keeps_input_order_and_runs_concurrently():
+    active = []
+    peak = [0]
+    lock = threading.Lock()
+
+    def handle(row):
+        with lock:
+            active.append(row["n"])
+            peak[0] = max(peak[0], len(active))
+        time.sleep(0.02 if row["n"] % 2 else 0.001)
+        with lock:
+            active.remove(row["n"])
+        return {"n": row["n"]}
+
+    rows = ((i + 1, {"n": i}) for i in range(12))
+    records = list(run_batch(rows, handle, jobs=4))
+
+    assert [r["n"] for r in records] == list(range(12))
+    assert [r["line"] for r in records] == list(range(1, 13))
+    assert peak[0] > 1
+
+
+def test_lookup_batch_streams_ndjson(synthetic, tmp_path, capsys):
+    path = tmp_path / "lookup.jsonl"
+    path.write_text(
+        json.dumps({"ticker": "APPL:NSQ"})
+        + "\n"
+        + json.dumps({"desc": "Microsoft", "exchange": "London"})
+        + "\n"
+        + json.dumps({"exchange": "NSQ"})
+        + "\n"
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        LookupCommand(input=str(path), jobs=2).cli_cmd()
+
+    records = _records(capsys)
+    assert exc.value.code == 1
+    assert [r["line"] for r in records] == [1, 2, 3]
+    assert [s["ticker"] for s in records[0]["symbols"]] == ["APPL:NSQ"]
+    assert records[0]["error"] is None
+    assert [s["ticker"] for s in records[1]["symbols"]] == ["MICR:LSE"]
+    assert records[2]["error"] == "Please provide --isin, --ticker, or --desc"
+
+
+def test_history_batch_validates_each_row(synthetic, tmp_path, capsys):
+    day = trading_days(10)[-3]
+    path = tmp_path / "history.csv"
+    path.write_text(
+        "ticker,date,price,period\n"
+        f"APPL:NSQ,{day},{_close('APPL:NSQ', day)},5d\n"
+        f"MSFT:NSQ,{day},{_close('MSFT:NSQ', day) * 2},\n"
+    )
+
+    with pytest.raises(SystemExit):
+        HistoryCommand(input=str(path), jobs=2).cli_cmd()
+
+    passed, failed = _records(capsys)
+    assert passed["line"] == 2
+    assert passed["ticker"] == "APPL:NSQ"
+    assert passed["valid"] is True and passed["error"] is None
+    assert passed["history"]["candles"]
+    # A ticker whose price does not match does not resolve, as in single-security mode
+    assert failed["ticker"] is None
+    assert failed["error"] == "Could not resolve ticker."
+
+
+def test_history_batch_succeeds_without_failures(synthetic, tmp_path, capsys):
+    path = tmp_path / "history.jsonl"
+    path.write_text(json.dumps({"ticker": "APPL:NSQ", "period": "1mo"}) + "\n")
+
+    HistoryCommand(input=str(path)).cli_cmd()
+
+    (record,) = _records(capsys)
+    assert record["ticker"] == "APPL:NSQ"
+    assert len(record["history"]["candles"]) == len(trading_days(30))
+
+
+@pytest.mark.parametrize(
+    "text",
+    ['{"ticker": "APPL:NSQ"}\n{"ticker": "MSFT:NSQ"}\n', "ticker\nAPPL:NSQ\nMSFT:NSQ\n"],
+    ids=["jsonl", "csv"],
+)
+def test_stdin_format_is_detected(text, monkeypatch):
+    monkeypatch.setattr("sys.stdin", io.StringIO(text))
+
+    rows = [row for _, row in read_rows("-")]
+
+    assert rows == [{"ticker": "APPL:NSQ"}, {"ticker": "MSFT:NSQ"}]
+
+
+def test_validate_batch_reports_bad_rows_and_validates_the_rest(synthetic, tmp_path, capsys):
+    day = trading_days(10)[-3]
+    path = tmp_path / "trades.csv"
+    path.write_text(
+        "id,ticker,date,price\n"
+        f"1,APPL:NSQ,{day},0\n"
+        f"2,APPL:NSQ,someday,1\n"
+        f"3,APPL:NSQ,{day},{_close('APPL:NSQ', day)}\n"
+    )
+
+    with pytest.raises(SystemExit) as exc:
+        ValidateBatchCommand(input=str(path), format="json").cli_cmd()
+
+    records = _records(capsys)
+    assert exc.value.code == 1
+    assert [r.get("line") for r in records[:2]] == [2, 3]
+    assert all(r["valid"] is None for r in records[:2])
+    assert records[2]["id"] == "3" and records[2]["valid"] is True
+
+
+@pytest.mark.parametrize(
+    ("command", "row", "fields"),
+    [
+        (LookupCommand, {"ticker": "APPL:NSQ"}, {"symbols"}),
+        (HistoryCommand, {"ticker": "APPL:NSQ", "period": "5d"}, {"ticker", "history", "valid"}),
+    ],
+    ids=["lookup", "history"],
+)
+def test_unreadable_rows_keep_the_record_shape(command, row, fields, synthetic, tmp_path, capsys):
+    path = tmp_path / "rows.jsonl"
+    path.write_text(json.dumps(row) + "\n{not json\n" + json.dumps(row) + "\n")
+
+    with pytest.raises(SystemExit) as exc:
+        command(input=str(path), jobs=2).cli_cmd()
+
+    good, bad, again = _records(capsys)
+    assert exc.value.code == 1
+    keys = {"line", "input", "error"} | fields
+    assert set(good) == set(bad) == set(again) == keys
+    assert good["error"] is None and again["error"] is None
+    assert bad["line"] == 2 and bad["input"] is None and bad["error"]
+    assert all(bad[name] is None for name in fields)
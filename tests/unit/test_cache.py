@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+
+from ftmarkets.cache import BaseCache, MemoryCache, SqliteCache
+
+
+def test_memory_cache_lru_eviction():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"  # "a" becomes most recently used
+    cache.set("c", "3")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+    assert len(cache) == 2
+
+
+def test_memory_cache_ttl_and_stats():
+    cache = MemoryCache(ttl=0.01)
+    cache.set("a", "1")
+    cache.set("b", "2", ttl=60)
+    assert cache.get("a") == "1"
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "2"
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_ratio == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_stats_are_exact_under_concurrent_gets(backend, tmp_path):
+    cache = MemoryCache() if backend == "memory" else SqliteCache(tmp_path / "cache.db")
+    cache.set("a", "1")
+
+    def lookups():
+        for _ in range(200):
+            cache.get("a")
+            cache.get("missing")
+
+    threads = [threading.Thread(target=lookups) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert (cache.stats.hits, cache.stats.misses) == (1600, 1600)
+
+
+def test_sqlite_cache_persists_across_instances(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = SqliteCache(path, namespace="xid")
+    cache.set("AAPL:NSQ", "36276")
+    cache.set("payload", {"xid": "1", "tags": [1, 2]})
+    cache.close()
+
+    reopened = SqliteCache(path, namespace="xid")
+    assert reopened.get("AAPL:NSQ") == "36276"
+    assert reopened.get("payload") == {"xid": "1", "tags": [1, 2]}
+
+    reopened.delete("AAPL:NSQ")
+    assert reopened.get("AAPL:NSQ") is None
+
+
+def test_sqlite_cache_ttl_and_maxsize(tmp_path):
+    cache = SqliteCache(tmp_path / "cache.db", maxsize=2)
+    cache.set("old", "x", ttl=-1)
+    assert cache.get("old") is None
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.set("c", "3")
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") == "3"
+
+
+def test_sqlite_cache_rejects_bad_namespace(tmp_path):
+    with pytest.raises(ValueError):
+        SqliteCache(tmp_path / "cache.db", namespace="x; DROP TABLE y")
+
+
+def test_base_cache_requires_backend_methods():
+    class Partial(BaseCache):
+        def _get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
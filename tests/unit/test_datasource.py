@@ -1,7 +1,11 @@
-from datetime import datetime
+import threading
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
+from pydantic import TypeAdapter
 from pydantic_market_data.models import (
     OHLCV,
     History,
@@ -13,7 +17,9 @@ from pydantic_market_data.models import (
 )
 
 from ftmarkets.api import FTDataSource
-from ftmarkets.extract.scraper import Scraper
+from ftmarkets.extract.scraper import Scraper, ScraperError
+from ftmarkets.frame import HistoryFrame
+from ftmarkets.ledger import Trade
 
 
 @pytest.fixture
@@ -58,7 +64,7 @@ def test_resolve_price_validation(datasource, mock_scraper):
 
     # Mock history with target price
     target_date = datetime(2023, 1, 15)
-    mock_scraper.get_history.return_value = History(
+    mock_scraper.get_history_range.return_value = History(
         symbol=Symbol(ticker="VALID:EX", name="Valid Ticker"),
         candles=[
             OHLCV(date=datetime(2023, 1, 15), open=100, high=105, low=95, close=100, volume=1000)
@@ -73,13 +79,15 @@ def test_resolve_price_validation(datasource, mock_scraper):
     assert result is not None
     assert result.ticker.root == "VALID:EX"
 
-    # Verify days calculation logic called get_history
-    mock_scraper.get_history.assert_called_once()
+    # Only the lookup window around the target date is requested
+    mock_scraper.get_history_range.assert_called_once()
+    _, start, end = mock_scraper.get_history_range.call_args.args
+    assert (start.isoformat(), end.isoformat()) == ("2023-01-10", "2023-01-20")
 
 
 def test_validate_logic(datasource, mock_scraper):
     target_date = datetime(2023, 1, 15)
-    mock_scraper.get_history.return_value = History(
+    mock_scraper.get_history_range.return_value = History(
         symbol=Symbol(ticker="T:EX", name="T"),
         candles=[OHLCV(date=datetime(2023, 1, 15), open=100, high=105, low=95, close=100)],
     )
@@ -89,3 +97,237 @@ def test_validate_logic(datasource, mock_scraper):
     # Invalid (out of range/mismatch) - now raises per Fail Fast
     with pytest.raises(PriceVerificationError):
         datasource.validate(Ticker(root="T:EX"), target_date, Price(root=150.0))
+
+
+def test_resolve_validates_candidates_concurrently_in_priority_order(datasource, mock_scraper):
+    mock_scraper.search.return_value = [
+        Symbol(ticker="A:EX", name="A", currency="USD"),
+        Symbol(ticker="B:EX", name="B", currency="USD"),
+        Symbol(ticker="C:EX", name="C", currency="USD"),
+    ]
+    release = threading.Event()
+
+    def get_history_range(ticker, start, end):
+        close = {"A:EX": 50, "B:EX": 100, "C:EX": 100}[ticker.root]
+        if ticker.root == "C:EX":
+            # A lower-priority fetch still in flight must not delay the result
+            release.wait(timeout=5)
+        return History(
+            symbol=Symbol(ticker=ticker.root, name=ticker.root),
+            candles=[
+                OHLCV(date=datetime(2023, 1, 15), open=close, high=close, low=close, close=close)
+            ],
+        )
+
+    mock_scraper.get_history_range.side_effect = get_history_range
+    criteria = SecurityCriteria(
+        symbol="X", target_price=Price(root=100.0), target_date=datetime(2023, 1, 15)
+    )
+
+    try:
+        result = datasource.resolve(criteria)
+    finally:
+        release.set()
+
+    assert result is not None
+    assert result.ticker.root == "B:EX"
+
+
+def test_validate_many_fetches_one_history_per_ticker(datasource, mock_scraper):
+    def get_history_range(ticker, start, end):
+        if ticker == "BAD:EX":
+            raise ScraperError("XID not found")
+        return History(
+            symbol=Symbol(ticker=ticker, name=ticker),
+            candles=[
+                OHLCV(date=datetime(2023, 1, 13), open=100, high=105, low=95, close=100),
+                OHLCV(date=datetime(2023, 3, 1), open=200, high=205, low=195, close=200),
+            ],
+        )
+
+    mock_scraper.get_history_range.side_effect = get_history_range
+    trades = [
+        Trade(ticker="T:EX", date=date(2023, 1, 15), price=101.0, id="1"),
+        Trade(ticker="BAD:EX", date=date(2023, 1, 15), price=1.0, id="2"),
+        Trade(ticker="T:EX", date=date(2023, 3, 1), price=150.0, id="3"),
+    ]
+
+    results = {r.trade.id: r for r in datasource.validate_many(trades)}
+
+    assert results["1"].valid is True
+    assert results["1"].matched_date == date(2023, 1, 13)
+    assert (results["1"].low, results["1"].high, results["1"].close) == (95, 105, 100)
+    assert results["3"].valid is False
+    assert results["3"].close == 200
+    assert results["2"].valid is None
+    assert "XID not found" in results["2"].error
+    # One request per ticker, covering the lookup windows of its earliest and latest trades
+    calls = {c.args[0]: c.args[1:] for c in mock_scraper.get_history_range.call_args_list}
+    assert len(mock_scraper.get_history_range.call_args_list) == 2
+    assert calls["T:EX"] == (date(2023, 1, 10), date(2023, 3, 6))
+
+
+def test_validate_many_reports_per_trade_errors(datasource, mock_scraper):
+    mock_scraper.get_history_range.return_value = History(
+        symbol=Symbol(ticker="T:EX", name="T:EX"),
+        candles=[OHLCV(date=datetime(2023, 1, 13), open=100, high=105, low=95, close=100)],
+    )
+    trades = [
+        Trade(ticker="T:EX", date=date(2023, 1, 13), price=0.0, id="zero"),
+        Trade(ticker="T:EX", date=date(2023, 1, 13), price=100.0, id="ok"),
+    ]
+
+    results = {r.trade.id: r for r in datasource.validate_many(trades)}
+
+    assert results["zero"].valid is None
+    assert "Price must be positive" in results["zero"].error
+    assert results["ok"].valid is True
+
+
+def _linear_nearest_candle(history, target_date):
+    # Reference: exact match first, else the nearest candle within 5 days, earliest first
+    for c in history.candles:
+        if c.date.date() == target_date:
+            return c
+    candidates = [
+        (abs((c.date.date() - target_date).days), c)
+        for c in history.candles
+        if abs((c.date.date() - target_date).days) <= 5
+    ]
+    return min(candidates, key=lambda x: x[0])[1] if candidates else None
+
+
+def _history(ticker, days, closes):
+    return History(
+        symbol=Symbol(ticker=ticker, name=ticker),
+        candles=[
+            OHLCV(date=datetime.combine(d, datetime.min.time()), open=c, high=c, low=c, close=c)
+            for d, c in zip(days, closes, strict=True)
+        ],
+    )
+
+
+def test_resolve_stops_overtaken_candidates_before_their_chart(datasource, mock_scraper):
+    mock_scraper.search.return_value = [
+        Symbol(ticker="A:EX", name="A", currency="USD"),
+        Symbol(ticker="B:EX", name="B", currency="USD"),
+    ]
+    release, finished = threading.Event(), threading.Event()
+
+    def get_xid(ticker):
+        if ticker.root == "B:EX":
+            # The lower-priority tearsheet is still loading when A matches
+            release.wait(timeout=5)
+            finished.set()
+        return ticker.root
+
+    mock_scraper.get_xid.side_effect = get_xid
+    mock_scraper.get_history_range.return_value = _history("A:EX", [date(2023, 1, 15)], [100.0])
+    criteria = SecurityCriteria(
+        symbol="X", target_price=Price(root=100.0), target_date=datetime(2023, 1, 15)
+    )
+
+    result = datasource.resolve(criteria)
+    release.set()
+    assert finished.wait(timeout=5)
+    # Let the worker run to completion
+    for thread in threading.enumerate():
+        if thread.name.startswith("ThreadPoolExecutor"):
+            thread.join(timeout=5)
+
+    assert result is not None and result.ticker.root == "A:EX"
+    fetched = [c.args[0].root for c in mock_scraper.get_history_range.call_args_list]
+    assert fetched == ["A:EX"]
+
+
+def test_get_prices_builds_ticker_by_date_matrix(datasource, mock_scraper):
+    days = [date(2023, 1, 2), date(2023, 1, 3), date(2023, 1, 6), date(2023, 1, 31)]
+
+    def get_history_range(ticker, start, end):
+        if ticker == "BAD:EX":
+            raise ScraperError("XID not found")
+        return _history(ticker, days, [1.0, 2.0, 3.0, 4.0])
+
+    mock_scraper.get_history_range.side_effect = get_history_range
+    targets = [date(2023, 1, 3), date(2023, 1, 4), date(2023, 1, 5), date(2023, 1, 20)]
+
+    result = datasource.get_prices(["A:EX", "BAD:EX", "A:EX"], targets)
+    prices = result.prices
+
+    assert list(prices.index) == ["A:EX", "BAD:EX"]
+    # Exact match, nearest neighbour, nearest (later) neighbour, nothing within the window
+    assert prices.loc["A:EX"].tolist()[:3] == [2.0, 2.0, 3.0]
+    assert prices.loc["BAD:EX"].isna().all()
+    assert prices.loc["A:EX"].isna().tolist() == [False, False, False, True]
+    assert result.fallback.loc["A:EX"].tolist() == [False, True, True, False]
+    assert result.errors == {"BAD:EX": "XID not found"}
+    # Plain frames combine like any other
+    assert pd.concat([prices, prices]).shape == (4, 4)
+    # One request per ticker spanning every date's lookup window
+    assert mock_scraper.get_history_range.call_count == 2
+    assert mock_scraper.get_history_range.call_args.args[1:] == (
+        date(2022, 12, 29),
+        date(2023, 1, 25),
+    )
+
+
+def test_get_prices_matches_linear_nearest_candle(datasource, mock_scraper):
+    rng = np.random.default_rng(7)
+    start = date(2023, 1, 1)
+    offsets = np.sort(rng.choice(120, size=40, replace=False))
+    days = [start + timedelta(days=int(o)) for o in offsets]
+    history = _history("R:EX", days, [float(o) for o in offsets])
+    mock_scraper.get_history_range.return_value = history
+    targets = [start + timedelta(days=i) for i in range(-10, 130)]
+
+    result = datasource.get_prices(["R:EX"], targets)
+    prices, matched = result.prices, result.matched_dates.loc["R:EX"]
+
+    for target, price, day in zip(targets, prices.loc["R:EX"], matched, strict=True):
+        candle = _linear_nearest_candle(history, target)
+        if candle is None:
+            assert np.isnan(price) and pd.isna(day)
+        else:
+            assert price == candle.close
+            assert day.date() == candle.date.date()
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_find_nearest_candle_matches_linear_scan(datasource, lazy):
+    rng = np.random.default_rng(3)
+    start = date(2023, 1, 1)
+    # Gaps of every size, ties between neighbours and a duplicated day
+    offsets = sorted(rng.choice(90, size=30, replace=False).tolist())
+    offsets.insert(5, offsets[5])
+    days = [start + timedelta(days=o) for o in offsets]
+    history = _history("R:EX", days, [float(i) for i in range(len(days))])
+    if lazy:
+        history = HistoryFrame.from_candles(history.symbol, history.candles).to_history()
+    targets = [start + timedelta(days=i) for i in range(-8, 100)]
+
+    batched = datasource._find_nearest_candles(history, targets)
+
+    for target, candle in zip(targets, batched, strict=True):
+        expected = _linear_nearest_candle(_history("R:EX", days, range(len(days))), target)
+        single = datasource._find_nearest_candle(history, target)
+        if expected is None:
+            assert candle is None and single is None
+        else:
+            assert candle.close == single.close == expected.close
+            assert candle.date.date() == expected.date.date()
+    # Lookups on a lazy history do not materialize every candle
+    assert "candles" not in history.__dict__ or not lazy
+
+
+def test_history_many_returns_serializable_histories(datasource, mock_scraper):
+    days = [date(2023, 1, 2), date(2023, 1, 3)]
+    plain = _history("A:EX", days, [1.0, 2.0])
+    lazy = HistoryFrame.from_candles(plain.symbol, plain.candles).to_history()
+    mock_scraper.get_histories.return_value = {"A:EX": lazy}
+
+    result = datasource.history_many(["A:EX"])
+
+    dumped = TypeAdapter(dict[str, History]).dump_python(result)
+    assert [c["close"] for c in dumped["A:EX"]["candles"]] == [1.0, 2.0]
+    # The scraper's (possibly cached) history stays lazy
+    assert "candles" not in lazy.__dict__
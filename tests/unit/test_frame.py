@@ -0,0 +1,87 @@
+from datetime import date, datetime
+
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+from pydantic_market_data.models import OHLCV, History, Symbol
+
+from ftmarkets.frame import FTHistory, HistoryFrame, as_frame
+
+SYMBOL = Symbol(ticker="AAPL:NSQ", name="AAPL:NSQ")
+
+
+def _frame() -> HistoryFrame:
+    return HistoryFrame.from_series(
+        SYMBOL,
+        [datetime(2023, 1, 2), datetime(2023, 1, 3), datetime(2023, 1, 4)],
+        {
+            "open": [1.0, 2.0, 3.0],
+            "high": [1.5, 2.5, 3.5],
+            "low": [0.5, 1.5, 2.5],
+            "close": [1.2, 2.2, 3.2],
+            "volume": [100, 200],
+        },
+    )
+
+
+def test_from_series_pads_short_series():
+    frame = _frame()
+    assert len(frame) == 3
+    assert frame.dates.dtype == np.dtype("datetime64[s]")
+    assert np.isnan(frame.volume[2])
+
+
+def test_to_pandas_matches_history_layout():
+    frame = _frame()
+    candles = frame.to_candles()
+    expected = History(symbol=SYMBOL, candles=candles).to_pandas()
+
+    df = frame.to_pandas()
+
+    assert list(df.columns) == list(expected.columns)
+    assert df.index.name == "Date"
+    assert df["Close"].tolist() == expected["Close"].tolist()
+    assert candles[2].volume is None
+
+
+def test_ft_history_materializes_lazily():
+    hist = _frame().to_history()
+    assert "candles" not in hist.__dict__
+    assert hist.to_pandas()["Open"].tolist() == [1.0, 2.0, 3.0]
+    assert "candles" not in hist.__dict__
+
+    assert len(hist.candles) == 3
+    assert hist.candles[0] == OHLCV(
+        date=datetime(2023, 1, 2), open=1.0, high=1.5, low=0.5, close=1.2, volume=100
+    )
+
+
+def test_ft_history_dump_includes_candles():
+    dumped = _frame().to_history().model_dump()
+    assert len(dumped["candles"]) == 3
+    assert '"close":3.2' in _frame().to_history().model_dump_json()
+
+
+def test_materialized_history_dumps_when_nested():
+    class Wrapper(BaseModel):
+        h: History
+
+    lazy = _frame().to_history()
+    hist = lazy.materialized()
+
+    assert "candles" not in lazy.__dict__
+    assert hist.frame is lazy.frame
+    assert len(Wrapper(h=hist).model_dump()["h"]["candles"]) == 3
+    dumped = TypeAdapter(dict[str, History]).dump_json({"AAPL": hist})
+    assert b'"close":3.2' in dumped
+    assert hist.materialized() is hist
+
+
+def test_trim_and_as_frame():
+    hist = _frame().to_history()
+    trimmed = hist.trim(date(2023, 1, 3), date(2023, 1, 3))
+
+    assert isinstance(trimmed, FTHistory)
+    assert [c.close for c in trimmed.candles] == [2.2]
+
+    plain = History(symbol=SYMBOL, candles=hist.candles)
+    assert as_frame(plain).close.tolist() == [1.2, 2.2, 3.2]
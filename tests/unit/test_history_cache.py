@@ -0,0 +1,161 @@
+import json
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+from pydantic_market_data.models import History, HistoryPeriod, Symbol
+
+from ftmarkets import api
+from ftmarkets.client import FTClient
+from ftmarkets.commands.history import HistoryCommand
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.frame import HistoryFrame
+from ftmarkets.history_cache import HistoryCache, last_days
+from ftmarkets.ratelimit import endpoint_of
+from ftmarkets.testing import SyntheticAdapter
+from ftmarkets.testing.synthetic import ohlcv, trading_days, xid_for
+
+SYMBOL = Symbol(ticker="APPL:NSQ", name="APPL:NSQ")
+
+
+class CountingAdapter(SyntheticAdapter):
+    def __init__(self):
+        super().__init__()
+        self.counts: dict[str, int] = {}
+
+    def send(self, request, *args, **kwargs):
+        endpoint = endpoint_of(request.url or "")
+        self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+        return super().send(request, *args, **kwargs)
+
+
+def _history(days: int) -> History:
+    dates = trading_days(days)
+    series = {k: v.tolist() for k, v in ohlcv("100", dates).items()}
+    return HistoryFrame.from_series(SYMBOL, dates, series).to_history()
+
+
+def test_get_trims_wider_entry():
+    cache = HistoryCache()
+    cache.put("APPL:NSQ", 90, _history(90))
+
+    hit = cache.get("APPL:NSQ", 30)
+
+    assert hit is not None
+    assert [c.date for c in hit.candles] == [c.date for c in last_days(_history(90), 30).candles]
+    assert hit.candles[0].date.date() >= date.today() - timedelta(days=29)
+    assert cache.get("APPL:NSQ", 365) is None
+    assert cache.get("MSFT:NSQ", 30) is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+
+
+def test_put_keeps_wider_entry_and_min_days():
+    cache = HistoryCache(min_days=120)
+    cache.put("APPL:NSQ", 90, _history(90))
+    cache.put("APPL:NSQ", 30, _history(30))
+
+    assert cache.get("APPL:NSQ", 90) is not None
+    assert cache.fetch_days(30) == 120
+    assert cache.fetch_days(365) == 365
+
+
+def test_entries_from_another_day_are_stale():
+    cache = HistoryCache()
+    cache.put("APPL:NSQ", 30, _history(30))
+    cache._entries["APPL:NSQ"].day = date.today() - timedelta(days=1)
+
+    assert cache.get("APPL:NSQ", 30) is None
+    assert len(cache) == 0
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("ftmarkets.history_cache.time.monotonic", lambda: now[0])
+    cache = HistoryCache(ttl=60)
+    cache.put("APPL:NSQ", 30, _history(30))
+
+    now[0] += 59
+    assert cache.get("APPL:NSQ", 30) is not None
+    now[0] += 2
+    assert cache.get("APPL:NSQ", 30) is None
+    # An expired entry does not block a narrower refetch
+    cache.put("APPL:NSQ", 5, _history(5))
+    assert cache.get("APPL:NSQ", 5) is not None
+
+
+def test_max_candles_evicts_least_recently_used():
+    size = len(_history(30).frame)
+    cache = HistoryCache(max_candles=2 * size)
+    for ticker in ("A", "B"):
+        cache.put(ticker, 30, _history(30))
+    cache.get("A", 30)
+    cache.put("C", 30, _history(30))
+
+    assert cache.get("B", 30) is None
+    assert cache.get("A", 30) is not None and cache.get("C", 30) is not None
+    # A history larger than the bound is not kept and evicts nothing
+    cache.put("D", 365, _history(365))
+    assert cache.get("D", 365) is None
+    assert len(cache) == 2
+
+
+def test_lookback_days_covers_period_and_dates():
+    target = date.today() - timedelta(days=100)
+
+    assert api.lookback_days(HistoryPeriod.MO1) == 30
+    assert api.lookback_days(HistoryPeriod.MO1, [target]) > 100
+    assert api.lookback_days(None, [date.today()]) >= 1
+
+
+def test_datasource_serves_overlapping_windows_from_one_fetch():
+    adapter = CountingAdapter()
+    scraper = Scraper(http_client=FTClient(adapter=adapter), search_backend="html")
+    ds = api.FTDataSource(scraper, history_cache=HistoryCache())
+
+    long = ds.history("APPL:NSQ", period=HistoryPeriod.Y1)
+    short = ds.history("APPL:NSQ", period=HistoryPeriod.MO1)
+
+    assert adapter.counts["chartapi"] == 1
+    assert len(short.candles) < len(long.candles)
+    assert short.candles[-1].date == long.candles[-1].date
+
+
+class ChartDaysAdapter(CountingAdapter):
+    def __init__(self):
+        super().__init__()
+        self.chart_days: list[int] = []
+
+    def send(self, request, *args, **kwargs):
+        if endpoint_of(request.url or "") == "chartapi":
+            self.chart_days.append(json.loads(request.body)["days"])
+        return super().send(request, *args, **kwargs)
+
+
+def test_history_command_widens_only_the_resolved_fetch(monkeypatch, capsys):
+    adapter = ChartDaysAdapter()
+    scraper = Scraper(http_client=FTClient(adapter=adapter), search_backend="html")
+    monkeypatch.setattr(api, "scraper", scraper)
+    target = trading_days(10)[-3]
+    close = float(ohlcv(xid_for("APPL:NSQ"), np.array([target]))["Close"][0])
+
+    HistoryCommand(ticker="APPL", price=close, date=str(target), period="max").cli_cmd()
+
+    assert "VALIDATION PASSED" in capsys.readouterr().out
+    narrow = api.lookback_days(None, [target])
+    wide = [days for days in adapter.chart_days if days > narrow]
+    # One search, then at most one tearsheet and one narrow chart request for each of the
+    # three candidates, and one request for the resolved ticker covering the period and the
+    # price check
+    assert adapter.counts["search"] == 1
+    assert adapter.counts["tearsheet"] <= 3
+    assert len(adapter.chart_days) - len(wide) <= 3
+    assert wide == [api.lookback_days(HistoryPeriod.MAX)]
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_history_matches_uncached(cached):
+    scraper = Scraper(http_client=FTClient(adapter=SyntheticAdapter()), search_backend="html")
+    plain = api.FTDataSource(scraper).history("APPL:NSQ", period=HistoryPeriod.MO3)
+    ds = api.FTDataSource(scraper, history_cache=HistoryCache(min_days=365) if cached else None)
+
+    assert ds.history("APPL:NSQ", period=HistoryPeriod.MO3).candles == plain.candles
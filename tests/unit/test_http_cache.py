@@ -0,0 +1,102 @@
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ftmarkets.cache import MemoryCache, SqliteCache
+from ftmarkets.client import FTClient
+from ftmarkets.http_cache import ResponseCache
+
+
+def _response(status=200, content=b"payload", headers=None):
+    resp = requests.Response()
+    resp.status_code = status
+    resp._content = content
+    resp.headers.update(headers or {})
+    resp.url = "https://markets.ft.com/data/search?query=AAPL"
+    return resp
+
+
+@pytest.fixture
+def client():
+    ftc = FTClient(response_cache=ResponseCache())
+    ftc.session = MagicMock(spec=requests.Session)
+    return ftc
+
+
+def test_fresh_responses_are_served_from_cache(client):
+    client.session.request.return_value = _response(content=b"results")
+
+    first = client.get("/data/search", params={"query": "AAPL"})
+    second = client.get("/data/search", params={"query": "AAPL"})
+
+    assert first.content == second.content == b"results"
+    assert client.session.request.call_count == 1
+    stats = client.response_cache.stats
+    assert (stats.hits, stats.misses, stats.bytes_saved) == (1, 1, len(b"results"))
+    assert stats.hit_ratio == 0.5
+
+
+def test_key_includes_params_and_json_body(client):
+    client.session.request.side_effect = lambda *a, **k: _response()
+
+    client.get("/data/search", params={"query": "AAPL"})
+    client.get("/data/search", params={"query": "MSFT"})
+    client.post("/data/chartapi/series", json={"days": 5})
+    client.post("/data/chartapi/series", json={"days": 10})
+
+    assert client.session.request.call_count == 4
+
+
+def test_stale_entry_is_revalidated_with_etag(client):
+    client.response_cache.ttls = {"/data/search": 0.01}
+    client.session.request.return_value = _response(content=b"v1", headers={"ETag": '"abc"'})
+    client.get("/data/search", params={"query": "AAPL"})
+    time.sleep(0.02)
+
+    client.session.request.return_value = _response(status=304, content=b"")
+    resp = client.get("/data/search", params={"query": "AAPL"})
+
+    assert resp.status_code == 200
+    assert resp.content == b"v1"
+    assert client.session.request.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    assert client.response_cache.stats.revalidations == 1
+
+
+def test_errors_and_zero_ttl_endpoints_are_not_cached(client):
+    client.response_cache.ttls = {"/data/chartapi/series": 0}
+    client.session.request.return_value = _response(status=500)
+
+    client.get("/data/search", params={"query": "AAPL"})
+    client.get("/data/search", params={"query": "AAPL"})
+    client.post("/data/chartapi/series", json={})
+
+    assert client.session.request.call_count == 3
+    assert client.response_cache.stats.hits == 0
+
+
+def test_disk_backend_persists_responses(tmp_path):
+    path = tmp_path / "http.sqlite"
+    session = MagicMock(spec=requests.Session)
+    session.request.return_value = _response(content=b"\x00binary", headers={"ETag": "x"})
+
+    ResponseCache(SqliteCache(path, namespace="http")).send(session, "GET", "https://h/data/x")
+    cached = ResponseCache(SqliteCache(path, namespace="http")).send(
+        session, "GET", "https://h/data/x"
+    )
+
+    assert cached.content == b"\x00binary"
+    assert cached.headers["ETag"] == "x"
+    assert session.request.call_count == 1
+
+
+def test_backend_lru_bounds_entries():
+    cache = ResponseCache(MemoryCache(maxsize=2))
+    session = MagicMock(spec=requests.Session)
+    session.request.side_effect = lambda *a, **k: _response()
+
+    for q in ("a", "b", "c"):
+        cache.send(session, "GET", "https://h/data/search", params={"query": q})
+
+    assert len(cache.backend) == 2
@@ -0,0 +1,81 @@
+import io
+from datetime import date
+
+import pytest
+
+from ftmarkets.ledger import Trade, TradeResult, iter_trades, parse_trades, read_trades
+
+
+def test_parse_trades_csv():
+    data = "id,ticker,date,price\nT1,AAPL:NSQ,2023-01-15,100.5\nT2,VOD:LSE,16/01/2023,70\n"
+
+    trades = list(parse_trades(io.StringIO(data), "csv"))
+
+    assert trades == [
+        Trade(ticker="AAPL:NSQ", date=date(2023, 1, 15), price=100.5, id="T1"),
+        Trade(ticker="VOD:LSE", date=date(2023, 1, 16), price=70.0, id="T2"),
+    ]
+
+
+def test_parse_trades_jsonl_accepts_symbol_and_blank_lines():
+    data = '{"symbol": "AAPL:NSQ", "date": "20230115", "price": 100}\n\n'
+
+    trades = list(parse_trades(io.StringIO(data)))
+
+    assert trades == [Trade(ticker="AAPL:NSQ", date=date(2023, 1, 15), price=100.0)]
+
+
+def test_parse_trades_rejects_incomplete_rows():
+    with pytest.raises(ValueError, match="Line 1"):
+        list(parse_trades(io.StringIO('{"ticker": "AAPL:NSQ", "date": "2023-01-15"}\n')))
+    with pytest.raises(ValueError, match="invalid date"):
+        list(parse_trades(io.StringIO("ticker,date,price\nAAPL:NSQ,soon,1\n"), "csv"))
+
+
+@pytest.mark.parametrize("price", ["0", "-1", "abc"])
+def test_parse_trades_rejects_bad_prices(price):
+    with pytest.raises(ValueError, match="Line 2"):
+        list(parse_trades(io.StringIO(f"ticker,date,price\nAAPL:NSQ,2023-01-15,{price}\n"), "csv"))
+
+
+def test_iter_trades_reports_malformed_rows_and_keeps_reading(tmp_path):
+    path = tmp_path / "trades.jsonl"
+    path.write_text(
+        '{"ticker": "AAPL:NSQ", "date": "2023-01-15", "price": 0}\n'
+        "not json\n"
+        '{"ticker": "AAPL:NSQ", "date": "2023-01-16", "price": 1}\n'
+    )
+
+    rows = list(iter_trades(path))
+
+    assert [line for line, _ in rows] == [1, 2, 3]
+    assert "price must be positive" in str(rows[0][1])
+    assert "invalid JSON" in str(rows[1][1])
+    assert rows[2][1] == Trade(ticker="AAPL:NSQ", date=date(2023, 1, 16), price=1.0)
+
+
+def test_read_trades_picks_format_from_suffix(tmp_path):
+    path = tmp_path / "trades.csv"
+    path.write_text("ticker,date,price\nAAPL:NSQ,2023-01-15,1\n")
+
+    assert [t.ticker for t in read_trades(path)] == ["AAPL:NSQ"]
+
+
+def test_trade_result_to_dict():
+    trade = Trade(ticker="AAPL:NSQ", date=date(2023, 1, 15), price=100.0, id="T1")
+    result = TradeResult(
+        trade=trade, valid=True, matched_date=date(2023, 1, 13), low=99, high=101, close=100
+    )
+
+    assert result.to_dict() == {
+        "id": "T1",
+        "ticker": "AAPL:NSQ",
+        "date": "2023-01-15",
+        "price": 100.0,
+        "valid": True,
+        "matched_date": "2023-01-13",
+        "low": 99,
+        "high": 101,
+        "close": 100,
+        "error": None,
+    }
@@ -0,0 +1,109 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from ftmarkets.client import FTClient, RateLimitedAdapter
+from ftmarkets.ratelimit import (
+    AdaptiveConcurrency,
+    EndpointLimit,
+    RateLimiter,
+    TokenBucket,
+    endpoint_of,
+)
+
+
+def test_token_bucket_spaces_requests_after_burst():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_adaptive_concurrency_aimd():
+    limiter = AdaptiveConcurrency(maximum=8, minimum=1, cooldown=0)
+
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 4
+    limiter.acquire()
+    limiter.release(throttled=True)
+    assert limiter.limit == 2
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release()
+    assert 2 < limiter.limit <= 8
+    assert limiter.in_flight == 0
+
+
+def test_adaptive_concurrency_counts_one_burst_once():
+    limiter = AdaptiveConcurrency(maximum=8, cooldown=60)
+    for _ in range(4):
+        limiter.acquire()
+    for _ in range(4):
+        limiter.release(throttled=True)
+
+    assert limiter.limit == 4
+
+
+def test_adaptive_concurrency_blocks_at_limit():
+    limiter = AdaptiveConcurrency(maximum=1)
+    limiter.acquire()
+    acquired = threading.Event()
+
+    def worker():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    assert not acquired.wait(0.05)
+    limiter.release()
+    assert acquired.wait(1)
+    thread.join()
+
+
+@pytest.mark.parametrize(
+    ("url", "endpoint"),
+    [
+        ("https://markets.ft.com/data/search?query=x", "search"),
+        ("https://markets.ft.com/data/searchapi/searchsecurities", "search"),
+        ("https://markets.ft.com/data/etfs/tearsheet/summary?s=X", "tearsheet"),
+        ("https://markets.ft.com/data/chartapi/series", "chartapi"),
+        ("https://markets.ft.com/other", "default"),
+    ],
+)
+def test_endpoint_of(url, endpoint):
+    assert endpoint_of(url) == endpoint
+
+
+def test_rate_limiter_uses_endpoint_overrides():
+    limiter = RateLimiter(limits={"chartapi": EndpointLimit(rate=1, max_concurrency=2)})
+
+    assert limiter.concurrency["chartapi"].maximum == 2
+    assert limiter.concurrency["search"].maximum == 4
+
+
+def test_adapter_reports_throttling_from_retry_history(monkeypatch):
+    limiter = RateLimiter()
+    adapter = RateLimitedAdapter(limiter)
+    retried = SimpleNamespace(history=[SimpleNamespace(status=429, error=None)])
+    resp = SimpleNamespace(status_code=200, raw=SimpleNamespace(retries=retried))
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, request, *a, **k: resp)
+    request = requests.Request("GET", "https://markets.ft.com/data/search").prepare()
+
+    assert adapter.send(request) is resp
+    assert limiter.concurrency["search"].limit == 2
+    assert limiter.concurrency["search"].in_flight == 0
+
+
+def test_client_mounts_rate_limited_adapter():
+    client = FTClient(rate_limiter=RateLimiter())
+
+    assert isinstance(client.session.get_adapter("https://markets.ft.com/"), RateLimitedAdapter)
@@ -0,0 +1,84 @@
+from datetime import date
+
+import pytest
+
+from ftmarkets.api import FTDataSource
+from ftmarkets.client import FTClient
+from ftmarkets.extract.schemas import Ticker
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.ledger import Trade
+from ftmarkets.testing import (
+    Cassette,
+    CassetteMiss,
+    RecordingAdapter,
+    ReplayAdapter,
+    SyntheticAdapter,
+)
+from ftmarkets.testing.synthetic import isin_for, ohlcv, trading_days, xid_for
+
+
+def _scraper(adapter, **kwargs):
+    return Scraper(http_client=FTClient(adapter=adapter), **kwargs)
+
+
+def test_synthetic_site_drives_the_scraper():
+    scraper = _scraper(SyntheticAdapter(), search_backend="html")
+
+    results = scraper.search("Apple")
+    xid = scraper.get_xid(Ticker(root="APPL:NSQ"))
+    history = scraper.get_history("APPL:NSQ", days=30)
+
+    assert [str(s.ticker) for s in results] == ["APPL:NSQ", "APPL:LSE", "APPL:GER"]
+    assert xid.root == xid_for("APPL:NSQ")
+    assert len(history.candles) == len(trading_days(30))
+
+
+def test_synthetic_prices_do_not_depend_on_the_window():
+    dates = trading_days(400, date(2024, 6, 28))
+    long = ohlcv("123", dates)["Close"]
+    short = ohlcv("123", dates[-5:])["Close"]
+
+    assert list(long[-5:]) == list(short)
+    assert isin_for(378331) == "US0003783315"
+
+
+def test_record_then_replay_offline(tmp_path):
+    path = tmp_path / "ft.json"
+    cassette = Cassette(path)
+    recorder = _scraper(RecordingAdapter(cassette, SyntheticAdapter()))
+    recorded = recorder.get_history("AAPL:NSQ", days=10)
+    recorder.search(isin_for(1))
+    cassette.save()
+
+    replayer = _scraper(ReplayAdapter(Cassette.load(path)))
+    replayed = replayer.get_history("AAPL:NSQ", days=10)
+
+    assert replayed.to_pandas().equals(recorded.to_pandas())
+    assert [str(s.ticker) for s in replayer.search(isin_for(1))] == [
+        "US00:NSQ",
+        "US00:LSE",
+        "US00:GER",
+    ]
+    assert len(Cassette.load(path)) == 3
+
+
+def test_replay_miss_raises():
+    scraper = _scraper(ReplayAdapter(Cassette()))
+
+    with pytest.raises(CassetteMiss):
+        scraper.get_xid(Ticker(root="AAPL:NSQ"))
+
+
+def test_replayed_validation():
+    cassette = Cassette()
+    ticker = "VAL:NSQ"
+    day = trading_days(60)[-20]
+    close = float(ohlcv(xid_for(ticker), day.reshape(1))["Close"][0])
+    trades = [Trade(ticker=ticker, date=day.astype(date), price=close)]
+    recorder = FTDataSource(_scraper(RecordingAdapter(cassette, SyntheticAdapter())))
+    list(recorder.validate_many(trades))
+
+    results = list(FTDataSource(_scraper(ReplayAdapter(cassette))).validate_many(trades))
+
+    assert results[0].valid is True
+    assert results[0].close == close
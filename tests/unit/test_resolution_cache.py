@@ -0,0 +1,96 @@
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic_market_data.models import SecurityCriteria, Symbol
+
+from ftmarkets.api import FTDataSource
+from ftmarkets.cache import SqliteCache
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.resolution_cache import ResolutionCache, criteria_key
+
+APPLE = Symbol(ticker="AAPL:NSQ", name="Apple Inc", currency="USD", isin="US0378331005")
+
+
+@pytest.fixture
+def mock_scraper():
+    scraper = MagicMock(spec=Scraper)
+    scraper.search.return_value = [APPLE]
+    return scraper
+
+
+def test_criteria_key_normalizes_case_and_whitespace():
+    a = SecurityCriteria(symbol="aapl", description=" Apple  Inc", currency="usd")
+    b = SecurityCriteria(symbol="AAPL", description="APPLE INC", currency="USD")
+
+    assert criteria_key(a) == criteria_key(b)
+    assert criteria_key(a) != criteria_key(SecurityCriteria(symbol="AAPL", currency="EUR"))
+    assert criteria_key(SecurityCriteria(isin="US0378331005", target_price=10)) != criteria_key(
+        SecurityCriteria(isin="US0378331005", target_price=11)
+    )
+
+
+def test_repeated_resolve_is_served_from_cache(mock_scraper):
+    cache = ResolutionCache()
+    source = FTDataSource(scraper_instance=mock_scraper, resolution_cache=cache)
+    criteria = SecurityCriteria(isin="US0378331005")
+
+    first = source.resolve(criteria)
+    second = source.resolve(SecurityCriteria(isin="us0378331005"))
+
+    assert first == second == APPLE
+    assert mock_scraper.search.call_count == 1
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+
+def test_no_match_is_cached_negatively(mock_scraper):
+    mock_scraper.search.return_value = []
+    cache = ResolutionCache()
+    source = FTDataSource(scraper_instance=mock_scraper, resolution_cache=cache)
+    criteria = SecurityCriteria(isin="US0000000010")
+
+    assert source.resolve(criteria) is None
+    assert source.resolve(criteria) is None
+    assert mock_scraper.search.call_count == 1
+    assert cache.stats.negative_hits == 1
+
+
+def test_negative_entries_use_their_own_ttl(mock_scraper, monkeypatch):
+    cache = ResolutionCache(ttl=1000, negative_ttl=10)
+    now = [1_000_000.0]
+    monkeypatch.setattr("ftmarkets.cache.time.time", lambda: now[0])
+    cache.store(SecurityCriteria(symbol="GOOD"), APPLE)
+    cache.store(SecurityCriteria(symbol="BAD"), None)
+
+    now[0] += 11
+
+    assert cache.lookup(SecurityCriteria(symbol="GOOD")) == (True, APPLE)
+    assert cache.lookup(SecurityCriteria(symbol="BAD")) == (False, None)
+
+
+def test_errors_are_not_cached(mock_scraper):
+    mock_scraper.search.side_effect = [RuntimeError("boom"), [APPLE]]
+    source = FTDataSource(scraper_instance=mock_scraper, resolution_cache=ResolutionCache())
+    criteria = SecurityCriteria(symbol="AAPL")
+
+    with pytest.raises(RuntimeError):
+        source.resolve(criteria)
+    assert source.resolve(criteria) == APPLE
+
+
+def test_sqlite_backend_is_shared_between_instances(mock_scraper, tmp_path):
+    path = tmp_path / "resolve.db"
+    criteria = SecurityCriteria(isin="US0378331005", currency="USD")
+    writer = FTDataSource(
+        scraper_instance=mock_scraper,
+        resolution_cache=ResolutionCache(SqliteCache(path, namespace="resolve")),
+    )
+    writer.resolve(criteria)
+
+    other_scraper = MagicMock(spec=Scraper)
+    reader = FTDataSource(
+        scraper_instance=other_scraper,
+        resolution_cache=ResolutionCache(SqliteCache(path, namespace="resolve")),
+    )
+
+    assert reader.resolve(criteria) == APPLE
+    other_scraper.search.assert_not_called()
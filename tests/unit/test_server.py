@@ -0,0 +1,79 @@
+import pytest
+import requests
+
+from ftmarkets.client import FTClient
+from ftmarkets.extract.schemas import Ticker
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.testing.server import StandInServer
+from ftmarkets.testing.synthetic import trading_days, xid_for
+
+
+@pytest.fixture
+def server():
+    with StandInServer() as srv:
+        yield srv
+
+
+def test_scraper_runs_against_stand_in(server):
+    scraper = Scraper(http_client=FTClient(base_url=server.url), search_backend="json")
+
+    results = scraper.search("Apple")
+    xid = scraper.get_xid(Ticker(root="APPL:NSQ"))
+    history = scraper.get_history("APPL:NSQ", days=30)
+
+    assert [str(s.ticker) for s in results] == ["APPL:NSQ", "APPL:LSE", "APPL:GER"]
+    assert xid.root == xid_for("APPL:NSQ")
+    assert len(history.candles) == len(trading_days(30))
+    # The JSON search seeds the XID cache, so no tearsheet request is needed
+    assert server.stats.requests == 2
+
+
+def test_base_url_from_environment(server, monkeypatch):
+    monkeypatch.setenv("FTMARKETS_BASE_URL", server.url + "/")
+    client = FTClient()
+
+    assert client.base_url == server.url
+    scraper = Scraper(http_client=client)
+    assert scraper.get_xid(Ticker(root="MSFT:NSQ")).root == xid_for("MSFT:NSQ")
+
+
+def test_explicit_base_url_wins_over_environment(monkeypatch):
+    monkeypatch.setenv("FTMARKETS_BASE_URL", "http://127.0.0.1:1")
+
+    assert FTClient(base_url="http://example.test").base_url == "http://example.test"
+    monkeypatch.delenv("FTMARKETS_BASE_URL")
+    assert FTClient().base_url == FTClient.BASE_URL
+
+
+def test_throttle_injection():
+    with StandInServer(throttle_rate=1.0, retry_after=7) as srv:
+        resp = requests.get(f"{srv.url}/data/search", params={"query": "x"}, timeout=5)
+
+    assert resp.status_code == 429
+    assert resp.headers["Retry-After"] == "7"
+    assert srv.stats.throttled == 1
+
+
+def test_error_injection_is_seeded():
+    def statuses():
+        with StandInServer(error_rate=0.5, seed=42) as srv:
+            return [
+                requests.get(f"{srv.url}/data/search", params={"query": "x"}, timeout=5).status_code
+                for _ in range(20)
+            ]
+
+    first = statuses()
+    assert first == statuses()
+    assert {500, 503} & set(first)
+    assert 200 in first
+
+
+def test_max_rps_answers_429_beyond_the_rate():
+    with StandInServer(max_rps=1) as srv:
+        codes = [
+            requests.get(f"{srv.url}/data/search", params={"query": "x"}, timeout=5).status_code
+            for _ in range(3)
+        ]
+
+    assert codes[0] == 200
+    assert 429 in codes[1:]
@@ -0,0 +1,204 @@
+import json
+import socket
+import threading
+
+import numpy as np
+import pytest
+import requests
+
+from ftmarkets.api import FTDataSource
+from ftmarkets.client import FTClient
+from ftmarkets.extract.scraper import Scraper
+from ftmarkets.history_cache import HistoryCache
+from ftmarkets.ratelimit import endpoint_of
+from ftmarkets.resolution_cache import ResolutionCache
+from ftmarkets.service import Service, ServiceError, ServiceServer
+from ftmarkets.testing import SyntheticAdapter
+from ftmarkets.testing.synthetic import ohlcv, trading_days, xid_for
+
+
+class CountingAdapter(SyntheticAdapter):
+    def __init__(self):
+        super().__init__()
+        self.counts: dict[str, int] = {}
+
+    def send(self, request, *args, **kwargs):
+        endpoint = endpoint_of(request.url or "")
+        self.counts[endpoint] = self.counts.get(endpoint, 0) + 1
+        return super().send(request, *args, **kwargs)
+
+
+@pytest.fixture
+def adapter():
+    return CountingAdapter()
+
+
+@pytest.fixture
+def service(adapter):
+    scraper = Scraper(http_client=FTClient(adapter=adapter), search_backend="html")
+    ds = FTDataSource(scraper, resolution_cache=ResolutionCache(), history_cache=HistoryCache())
+    svc = Service(ds, max_concurrency=4, queue_timeout=0.5)
+    yield svc
+    svc.close()
+
+
+@pytest.fixture
+def server(service):
+    with ServiceServer(service, port=0) as srv:
+        yield srv
+
+
+def _close(ticker: str, day) -> float:
+    return float(ohlcv(xid_for(ticker), np.array([day]))["Close"][0])
+
+
+def test_methods_over_http(server):
+    day = trading_days(10)[-3]
+    price = _close("APPL:NSQ", day)
+
+    def post(method, **params):
+        return requests.post(f"{server.url}/{method}", json=params, timeout=10)
+
+    search = post("search", query="Apple").json()["result"]
+    resolved = post("resolve", symbol="APPL:NSQ", target_price=price, target_date=str(day))
+    history = post("history", ticker="APPL:NSQ", period="1mo").json()["result"]
+    got = post("get_price", ticker="APPL:NSQ", date=str(day)).json()["result"]
+    valid = post("validate", ticker="APPL:NSQ", date=str(day), price=price).json()["result"]
+    invalid = post("validate", ticker="APPL:NSQ", date=str(day), price=price * 2).json()
+
+    assert [s["ticker"] for s in search] == ["APPL:NSQ", "APPL:LSE", "APPL:GER"]
+    assert resolved.json()["result"]["ticker"] == "APPL:NSQ"
+    assert len(history["candles"]) == len(trading_days(30))
+    assert got == pytest.approx(price)
+    assert valid == {"valid": True}
+    assert invalid["result"]["valid"] is False
+
+
+def test_errors_map_to_statuses(server):
+    missing = requests.post(f"{server.url}/history", json={}, timeout=10)
+    unknown = requests.post(f"{server.url}/nope", json={}, timeout=10)
+    bad_json = requests.post(f"{server.url}/search", data=b"{", timeout=10)
+    not_found = requests.get(f"{server.url}/nope", timeout=10)
+    zero_price = requests.post(
+        f"{server.url}/validate",
+        json={"ticker": "APPL:NSQ", "date": str(trading_days(10)[-3]), "price": 0},
+        timeout=10,
+    )
+
+    assert (missing.status_code, missing.json()) == (400, {"error": "Missing parameter: ticker"})
+    assert unknown.status_code == 404
+    assert bad_json.status_code == 400
+    assert not_found.status_code == 404
+    assert zero_price.status_code == 400
+
+
+def test_warm_state_is_shared_between_calls(server, adapter):
+    for _ in range(3):
+        requests.post(f"{server.url}/history", json={"ticker": "MSFT:NSQ"}, timeout=10)
+
+    metrics = requests.get(f"{server.url}/metrics", timeout=10).json()
+
+    assert adapter.counts["chartapi"] == 1
+    assert metrics["methods"]["history"]["calls"] == 3
+    assert metrics["caches"]["history"] == {"hits": 2, "misses": 1}
+    assert metrics["in_flight"] == 0
+    assert requests.get(f"{server.url}/health", timeout=10).json()["status"] == "ok"
+
+
+def test_batch_packs_history_calls(server, adapter):
+    calls = [
+        {"method": "history", "params": {"ticker": t, "period": "5d"}}
+        for t in ("APPL:NSQ", "MSFT:NSQ", "GOOG:NSQ")
+    ]
+    calls += [
+        {"method": "search", "params": {"query": "Apple"}},
+        {"method": "history", "params": {}},
+        {"method": "nope"},
+    ]
+
+    resp = requests.post(f"{server.url}/batch", json={"calls": calls}, timeout=10)
+    results = resp.json()["results"]
+
+    assert resp.status_code == 200
+    assert all(r["result"]["candles"] for r in results[:3])
+    assert [r["result"]["symbol"]["ticker"] for r in results[:3]] == [
+        "APPL:NSQ",
+        "MSFT:NSQ",
+        "GOOG:NSQ",
+    ]
+    assert results[3]["result"][0]["ticker"] == "APPL:NSQ"
+    assert results[4]["status"] == 400
+    assert results[5]["status"] == 404
+    # Three histories in one Chart API request
+    assert adapter.counts["chartapi"] == 1
+
+
+def test_batch_history_uses_the_history_cache(server, service, adapter):
+    requests.post(f"{server.url}/history", json={"ticker": "MSFT:NSQ"}, timeout=10)
+    calls = [
+        {"method": "history", "params": {"ticker": t, "period": "5d"}}
+        for t in ("MSFT:NSQ", "APPL:NSQ", "GOOG:NSQ")
+    ]
+
+    for _ in range(2):
+        resp = requests.post(f"{server.url}/batch", json={"calls": calls}, timeout=10)
+        assert all(r["result"]["candles"] for r in resp.json()["results"])
+    requests.post(f"{server.url}/batch", json={"calls": "nope"}, timeout=10)
+    metrics = requests.get(f"{server.url}/metrics", timeout=10).json()
+
+    # MSFT came from the /history fetch, the others from the first batch
+    assert adapter.counts["chartapi"] == 2
+    assert metrics["methods"]["batch"]["calls"] == 3
+    assert metrics["methods"]["batch"]["errors"] == 1
+    assert metrics["methods"]["batch"]["seconds"] > 0
+    # Replies are dumped from copies; cached histories keep only their frames
+    entry = service.datasource.history_cache._entries["MSFT:NSQ"]
+    assert "candles" not in entry.history.__dict__
+
+
+def test_calls_beyond_the_limit_are_refused(service):
+    release = threading.Event()
+    started = threading.Barrier(service.max_concurrency + 1)
+
+    def slow():
+        started.wait()
+        release.wait(5)
+
+    threads = [
+        threading.Thread(target=service._run, args=("search", slow))
+        for _ in range(service.max_concurrency)
+    ]
+    for t in threads:
+        t.start()
+    started.wait()
+
+    with pytest.raises(ServiceError) as exc:
+        service.call("search", {"query": "Apple"})
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert exc.value.status == 503
+    assert service.rejected == 1
+
+
+def test_unix_socket(service, tmp_path):
+    path = str(tmp_path / "ftmarkets.sock")
+    body = json.dumps({"query": "Apple"}).encode()
+
+    with ServiceServer(service, socket_path=path) as srv:
+        assert srv.url == f"unix://{path}"
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(path)
+            sock.sendall(
+                b"POST /search HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                + body
+            )
+            raw = b""
+            while chunk := sock.recv(65536):
+                raw += chunk
+
+    head, _, payload = raw.partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200")
+    assert json.loads(payload)["result"][0]["ticker"] == "APPL:NSQ"
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from ftmarkets.client import FTClient
+from ftmarkets.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight()
+    release = threading.Event()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "result"
+
+    def call():
+        return group.do("key", fetch)
+
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        futures = [ex.submit(call) for _ in range(4)]
+        while group.stats.calls + group.stats.shared < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == ["result"] * 4
+    assert len(calls) == 1
+    assert (group.stats.calls, group.stats.shared) == (1, 3)
+
+
+def test_errors_propagate_to_every_waiter_and_are_not_remembered():
+    group = SingleFlight()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        group.do("key", fail)
+    # Completed calls leave nothing behind
+    assert group.do("key", lambda: 1) == 1
+
+
+def test_async_concurrent_calls_share_one_execution():
+    group = AsyncSingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(group.do("key", fetch) for _ in range(5)))
+
+    assert asyncio.run(main()) == ["result"] * 5
+    assert len(calls) == 1
+    assert group.stats.shared == 4
+
+
+def test_async_cancelled_waiter_does_not_cancel_shared_call():
+    group = AsyncSingleFlight()
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return "result"
+
+    async def main():
+        first = asyncio.ensure_future(group.do("key", fetch))
+        second = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(main()) == "result"
+
+
+def test_client_coalesces_identical_requests():
+    client = FTClient()
+    client.session = MagicMock(spec=requests.Session)
+    release = threading.Event()
+    response = MagicMock(status_code=200)
+
+    def request(*args, **kwargs):
+        release.wait(timeout=5)
+        return response
+
+    client.session.request.side_effect = request
+
+    def call():
+        return client.get("/data/search", params={"query": "AAPL"})
+
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        futures = [ex.submit(call) for _ in range(3)]
+        while client.inflight.stats.calls + client.inflight.stats.shared < 3:
+            threading.Event().wait(0.001)
+        release.set()
+        assert all(f.result() is response for f in futures)
+
+    assert client.session.request.call_count == 1
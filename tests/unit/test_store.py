@@ -0,0 +1,43 @@
+from datetime import date, datetime, timedelta
+
+from pydantic_market_data.models import OHLCV
+
+from ftmarkets.store import HistoryStore
+
+TODAY = date(2024, 3, 15)
+
+
+def _candle(d: date, close: float) -> OHLCV:
+    return OHLCV(date=datetime.combine(d, datetime.min.time()), close=close)
+
+
+def test_missing_days_unknown_and_covered(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    assert store.missing_days("AAPL:NSQ", 30, today=TODAY) == 30
+
+    store.save("AAPL:NSQ", [], TODAY - timedelta(days=30), TODAY)
+    assert store.missing_days("AAPL:NSQ", 30, today=TODAY) is None
+    # Older window than stored requires a full fetch
+    assert store.missing_days("AAPL:NSQ", 60, today=TODAY) == 60
+
+
+def test_missing_days_only_requests_gap(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    store.save("AAPL:NSQ", [], TODAY - timedelta(days=365), TODAY - timedelta(days=3))
+
+    assert store.missing_days("AAPL:NSQ", 30, today=TODAY) == 4
+
+
+def test_save_merges_and_extends_coverage(tmp_path):
+    store = HistoryStore(tmp_path / "history.db")
+    d1, d2, d3 = date(2024, 3, 1), date(2024, 3, 4), date(2024, 3, 5)
+    store.save("T:EX", [_candle(d1, 1.0), _candle(d2, 2.0)], date(2024, 2, 1), d2)
+    store.save("T:EX", [_candle(d2, 2.5), _candle(d3, 3.0)], d2, d3)
+
+    candles = store.load("T:EX", d1)
+    assert [c.close for c in candles] == [1.0, 2.5, 3.0]
+    assert store.coverage("T:EX") == (date(2024, 2, 1), d3)
+    assert [c.close for c in store.load("T:EX", d2, d2)] == [2.5]
+
+    store.clear("T:EX")
+    assert store.coverage("T:EX") is None
@@ -0,0 +1,122 @@
+import ssl
+import time
+
+import pytest
+import requests
+
+from ftmarkets.client import FTClient
+from ftmarkets.ratelimit import RateLimiter
+from ftmarkets.transport import HTTP2Adapter, backoff_delay, retry_after_delay
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+def _adapter(handler, **kwargs):
+    adapter = HTTP2Adapter(**kwargs)
+    adapter.client = httpx.Client(transport=httpx.MockTransport(handler))
+    return adapter
+
+
+def _session(adapter):
+    session = requests.Session()
+    # Environment proxies would route the requests past the mocked default client
+    session.trust_env = False
+    session.mount("https://", adapter)
+    return session
+
+
+def test_http2_adapter_returns_requests_response():
+    def handler(request):
+        assert request.headers["X-Test"] == "1"
+        return httpx.Response(200, json={"ok": True}, headers={"ETag": "v1"})
+
+    resp = _session(_adapter(handler)).get("https://markets.ft.com/data", headers={"X-Test": "1"})
+
+    assert isinstance(resp, requests.Response)
+    assert resp.json() == {"ok": True}
+    assert resp.headers["etag"] == "v1"
+    assert b"".join(resp.iter_content(4)) == resp.content
+
+
+def test_http2_adapter_retries_throttled_responses(monkeypatch):
+    statuses = [429, 503, 200]
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    limiter = RateLimiter()
+
+    def handler(request):
+        return httpx.Response(statuses.pop(0), headers={"Retry-After": "2"})
+
+    resp = _session(_adapter(handler, limiter=limiter)).get("https://markets.ft.com/data/search")
+
+    assert resp.status_code == 200
+    assert sleeps == [2.0, 2.0]
+    assert limiter.concurrency["search"].limit < limiter.concurrency["search"].maximum
+
+
+def test_http2_adapter_wraps_transport_errors(monkeypatch):
+    monkeypatch.setattr(time, "sleep", lambda _: None)
+
+    def handler(request):
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(requests.exceptions.ConnectionError):
+        _session(_adapter(handler, max_retries=1)).get("https://markets.ft.com/")
+
+
+def test_http2_adapter_streams_bodies():
+    chunks = [b"<div data-mod-config=", b'\'{"xid":"1"}\'>', b"rest of the page"]
+    sent = []
+
+    def body():
+        for chunk in chunks:
+            sent.append(chunk)
+            yield chunk
+
+    def handler(request):
+        return httpx.Response(200, content=body())
+
+    resp = _session(_adapter(handler)).get("https://markets.ft.com/data", stream=True)
+    first = next(resp.iter_content(8))
+    resp.close()
+
+    assert first == chunks[0][:8]
+    assert len(sent) == 1
+
+
+def test_http2_adapter_maps_tls_and_proxy_settings(monkeypatch):
+    adapter = _adapter(lambda request: httpx.Response(200, content=b"ok"))
+    created = []
+
+    def new_client(verify, proxy):
+        created.append((verify, proxy))
+        return httpx.Client(transport=httpx.MockTransport(lambda r: httpx.Response(200)))
+
+    monkeypatch.setattr(adapter, "_new_client", new_client)
+    session = _session(adapter)
+
+    session.get("https://markets.ft.com/data")
+    session.get("https://markets.ft.com/data", verify=False)
+    session.get("https://markets.ft.com/data", verify=False)
+    session.get("https://markets.ft.com/data", proxies={"https": "http://proxy:3128"})
+
+    assert len(created) == 2
+    assert created[0][0].verify_mode == ssl.CERT_NONE and created[0][1] is None
+    assert created[1][1] == "http://proxy:3128"
+
+
+def test_client_pool_settings():
+    client = FTClient(pool_maxsize=64, pool_block=True, keep_alive=False)
+    adapter = client.session.get_adapter("https://markets.ft.com/")
+
+    assert adapter._pool_maxsize == 64
+    assert adapter._pool_block is True
+    assert client.session.headers["Connection"] == "close"
+    assert isinstance(FTClient(http2=True).session.get_adapter("https://x/"), HTTP2Adapter)
+
+
+def test_retry_delays():
+    assert [backoff_delay(n, 1) for n in (1, 2, 3)] == [0.0, 2.0, 4.0]
+    assert retry_after_delay(429, {"Retry-After": "3"}) == 3.0
+    assert retry_after_delay(500, {"Retry-After": "3"}) is None